@@ -25,9 +25,11 @@ from .exceptions import (
 )
 
 from .io import Logger, SizedRotatingLogger, Printer, LogReader, MessageSync
+from .io import MergedLogReader, TimedRotatingLogger
 from .io import ASCWriter, ASCReader
 from .io import BLFReader, BLFWriter
 from .io import CanutilsLogReader, CanutilsLogWriter
+from .io import ColumnarReader, ColumnarWriter
 from .io import CSVWriter, CSVReader
 from .io import SqliteWriter, SqliteReader
 
@@ -41,6 +43,7 @@ from .interfaces import VALID_INTERFACES
 from . import interface
 from .interface import Bus, detect_available_configs
 from .bit_timing import BitTiming
+from .filters import CompiledFilters
 
 from .broadcastmanager import (
     CyclicSendTaskABC,
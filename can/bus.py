@@ -14,6 +14,7 @@ from time import time
 from enum import Enum, auto
 
 from can.broadcastmanager import ThreadBasedCyclicSendTask, CyclicSendTaskABC
+from can.filters import CompiledFilters
 from can.message import Message
 
 LOG = logging.getLogger(__name__)
@@ -113,6 +114,109 @@ class BusABC(metaclass=ABCMeta):
 
                 return None
 
+    def recv_batch(
+        self, max_messages: int = 64, timeout: Optional[float] = None
+    ) -> List[Message]:
+        """Block waiting for messages from the Bus and return all messages
+        that are available at once.
+
+        This waits like :meth:`~can.BusABC.recv` until at least one message
+        arrives and then additionally collects every message that is already
+        waiting to be read, without blocking again. This saves a lot of
+        overhead compared to calling :meth:`~can.BusABC.recv` repeatedly on
+        busy buses.
+
+        :param max_messages:
+            the maximum number of messages to return at once
+        :param timeout:
+            seconds to wait for the first message or None to wait indefinitely
+
+        :return:
+            A list of received :class:`Message` objects in the order they were
+            received. It is empty on timeout.
+
+        :raises ValueError: If `max_messages` is smaller than one
+        :raises can.CanOperationError: If an error occurred while reading
+        """
+        if max_messages < 1:
+            raise ValueError("max_messages must be at least 1")
+
+        start = time()
+        time_left = timeout
+
+        while True:
+
+            # try to get some messages
+            msgs, already_filtered = self._recv_internal_batch(
+                max_messages, timeout=time_left
+            )
+
+            if not already_filtered:
+                msgs = [msg for msg in msgs if self._matches_filters(msg)]
+
+            # return them, if any matched
+            if msgs:
+                if LOG.isEnabledFor(self.RECV_LOGGING_LEVEL):
+                    for msg in msgs:
+                        LOG.log(self.RECV_LOGGING_LEVEL, "Received: %s", msg)
+                return msgs
+
+            # if not, and timeout is None, try indefinitely
+            elif timeout is None:
+                continue
+
+            # try again only if there still is time, and with
+            # reduced timeout
+            else:
+
+                time_left = timeout - (time() - start)
+
+                if time_left > 0:
+                    continue
+
+                return []
+
+    def _recv_internal_batch(
+        self, max_messages: int, timeout: Optional[float]
+    ) -> Tuple[List[Message], bool]:
+        """
+        Read up to `max_messages` messages from the bus and tell whether
+        they were filtered. This method is called by
+        :meth:`~can.BusABC.recv_batch` and should never be called directly.
+
+        It waits at most `timeout` seconds for the first message and must
+        not block again afterwards. The default implementation does so by
+        calling :meth:`~can.BusABC._recv_internal` once with the given
+        timeout and then repeatedly with a timeout of zero. Interfaces that
+        can fetch many frames at once should override this method.
+
+        :param max_messages: the maximum number of messages to return
+        :param timeout: seconds to wait for the first message,
+                        see :meth:`~can.BusABC.send`
+
+        :return:
+            1.  a list of messages that were read, which is empty on timeout
+            2.  a bool that is True if message filtering has already
+                been done and else False
+
+        :raises can.CanOperationError: If an error occurred while reading
+        """
+        msgs: List[Message] = []
+        msg, already_filtered = self._recv_internal(timeout=timeout)
+        frames_read = 1
+
+        # the filtering state may change from message to message (see
+        # _recv_internal()), so filter here and report the batch as filtered
+        while msg is not None:
+            if already_filtered or self._matches_filters(msg):
+                msgs.append(msg)
+            if frames_read >= max_messages:
+                break
+            msg, already_filtered = self._recv_internal(timeout=0.0)
+            frames_read += 1
+
+        return msgs, True
+
     def _recv_internal(
         self, timeout: Optional[float]
     ) -> Tuple[Optional[Message], bool]:
@@ -175,6 +279,50 @@ class BusABC(metaclass=ABCMeta):
         """
         raise NotImplementedError("Trying to write to a readonly bus?")
 
+    def send_batch(
+        self, msgs: Sequence[Message], timeout: Optional[float] = None
+    ) -> int:
+        """Transmit several messages to the CAN bus, in the given order.
+
+        Interfaces that can queue several frames at once override this method,
+        otherwise the messages are passed to :meth:`~can.BusABC.send` one
+        after another.
+
+        :param msgs: The message objects to transmit.
+
+        :param timeout:
+            The time in seconds that may pass for transmitting all messages,
+            see :meth:`~can.BusABC.send` for its meaning for a single message.
+            None blocks indefinitely.
+
+        :return:
+            The number of messages that were queued for transmission. If an
+            error occurs after some messages have already been queued, the
+            remaining messages are not sent and the number of queued messages
+            is returned, which is then less than ``len(msgs)``.
+
+        :raises can.CanOperationError:
+            If an error occurred while sending the first message
+        """
+        started = time()
+        sent = 0
+
+        for msg in msgs:
+            time_left = None
+            if timeout is not None:
+                time_left = max(0.0, timeout - (time() - started))
+
+            try:
+                self.send(msg, timeout=time_left)
+            except can.CanError as error:
+                if sent == 0:
+                    raise
+                LOG.debug("Sending a batch stopped after %d messages: %s", sent, error)
+                break
+            sent += 1
+
+        return sent
+
     def send_periodic(
         self,
         msgs: Union[Message, Sequence[Message]],
@@ -356,6 +504,7 @@ class BusABC(metaclass=ABCMeta):
             messages based only on the arbitration ID and mask.
         """
         self._filters = filters or None
+        self._compiled_filters = CompiledFilters(self._filters)
         self._apply_filters(self._filters)
 
     def _apply_filters(self, filters: Optional[can.typechecking.CanFilters]) -> None:
@@ -383,25 +532,7 @@ class BusABC(metaclass=ABCMeta):
         if self._filters is None:
             return True
 
-        for _filter in self._filters:
-            # check if this filter even applies to the message
-            if "extended" in _filter:
-                _filter = cast(can.typechecking.CanFilterExtended, _filter)
-                if _filter["extended"] != msg.is_extended_id:
-                    continue
-
-            # then check for the mask and id
-            can_id = _filter["can_id"]
-            can_mask = _filter["can_mask"]
-
-            # basically, we compute
-            # `msg.arbitration_id & can_mask == can_id & can_mask`
-            # by using the shorter, but equivalent from below:
-            if (can_id ^ msg.arbitration_id) & can_mask == 0:
-                return True
-
-        # nothing matched
-        return False
+        return self._compiled_filters.matches(msg.arbitration_id, msg.is_extended_id)
 
     def flush_tx_buffer(self) -> None:
         """Discard every message that may be queued in the output buffer(s)."""
@@ -0,0 +1,288 @@
+"""
+Converts log files between any of the formats supported by
+:class:`can.LogReader` and :class:`can.Logger`.
+
+    python -m can.convert trace.asc trace.blf
+
+Reading and writing are pipelined: the messages are read on a separate thread
+and handed over to the writer in batches. Whole directories are converted in
+parallel by a pool of processes:
+
+    python -m can.convert --suffix .blf -j 4 traces/ converted/
+"""
+
+import sys
+import argparse
+import errno
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
+
+from can import LogReader, Logger, Message
+from .io.compression import COMPRESSIBLE_FORMATS, split_suffix
+from .logger import _append_filter_argument, _parse_filters
+from .typechecking import CanFilters, StringPathLike
+
+
+#: the number of messages which are handed over to the writer at once
+BATCH_SIZE = 1000
+
+#: how many batches may be read ahead of the writer
+MAX_PENDING_BATCHES = 16
+
+
+def convert_file(
+    input_file: StringPathLike,
+    output_file: StringPathLike,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    can_filters: Optional[CanFilters] = None,
+    batch_size: int = BATCH_SIZE,
+    max_pending_batches: int = MAX_PENDING_BATCHES,
+) -> Tuple[int, float]:
+    """Converts a single log file to another format.
+
+    The input file is read on a separate thread, which hands over the messages
+    to the writer in batches. Thus, parsing and formatting the messages
+    overlap, while the number of messages held in memory stays bounded.
+
+    :param input_file: the log file to read, for supported types see
+                       :class:`can.LogReader`
+    :param output_file: the log file to write, for supported types see
+                        :class:`can.Logger`
+    :param start: if given, skip all messages before this timestamp
+    :param end: if given, skip all messages after this timestamp
+    :param can_filters: if given, only convert the messages that match at
+                        least one of these filters
+    :param batch_size: the number of messages handed over to the writer at once
+    :param max_pending_batches: how many batches may be read ahead of the
+                                writer before reading blocks
+    :return: the number of converted messages and the time it took in seconds
+    """
+    batches: "queue.Queue[Optional[List[Message]]]" = queue.Queue(max_pending_batches)
+    stopped = threading.Event()
+    errors: List[BaseException] = []
+
+    def put(batch: Optional[List[Message]]) -> None:
+        # do not block forever if the writer failed and no longer consumes
+        while not stopped.is_set():
+            try:
+                batches.put(batch, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def read() -> None:
+        try:
+            with LogReader(
+                input_file, start=start, end=end, can_filters=can_filters
+            ) as reader:
+                batch: List[Message] = []
+                for msg in cast(Iterable[Message], reader):
+                    batch.append(msg)
+                    if len(batch) >= batch_size:
+                        put(batch)
+                        batch = []
+                        if stopped.is_set():
+                            return
+                if batch:
+                    put(batch)
+        except BaseException as error:  # pylint: disable=broad-except
+            errors.append(error)
+        finally:
+            put(None)
+
+    started = time.perf_counter()
+    count = 0
+    thread = threading.Thread(target=read, name=f"Reading {input_file}", daemon=True)
+    thread.start()
+    try:
+        with Logger(output_file) as writer:  # type: ignore
+            while True:
+                batch = batches.get()
+                if batch is None:
+                    break
+                for msg in batch:
+                    writer.on_message_received(msg)
+                count += len(batch)
+    finally:
+        stopped.set()
+        thread.join()
+
+    if errors:
+        raise errors[0]
+    return count, time.perf_counter() - started
+
+
+def _output_name(input_file: str, suffix: str) -> str:
+    """Replaces the format suffix of a file name, including a compression
+    suffix like ``.gz``."""
+    format_suffix, compression = split_suffix(input_file)
+    stem = input_file[: len(input_file) - len(format_suffix + (compression or ""))]
+    return stem + suffix
+
+
+def _is_log_file(path: str) -> bool:
+    format_suffix, compression = split_suffix(path)
+    return (
+        os.path.isfile(path)
+        and format_suffix in LogReader.message_readers
+        and (compression is None or format_suffix in COMPRESSIBLE_FORMATS)
+    )
+
+
+def _print_rate(source: str, destination: str, count: int, seconds: float) -> None:
+    rate = count / seconds if seconds > 0 else 0.0
+    print(
+        f"{source} -> {destination}: {count} messages in {seconds:.2f} s "
+        f"({rate:.0f} frames/s)"
+    )
+
+
+def convert_directory(
+    input_dir: StringPathLike,
+    output_dir: StringPathLike,
+    suffix: str,
+    jobs: Optional[int] = None,
+    **kwargs: Any,
+) -> Tuple[int, float]:
+    """Converts all log files in a directory in parallel.
+
+    :param input_dir: the directory with the log files to convert. Files of
+                      unknown formats and subdirectories are ignored.
+    :param output_dir: the directory to write the converted files to. It is
+                       created if it does not exist.
+    :param suffix: the suffix of the format to convert to, like ``.blf``
+    :param jobs: the number of processes to use, which defaults to the number
+                 of CPUs
+    :param kwargs: passed on to :func:`convert_file`
+    :return: the total number of converted messages and the time it took in
+             seconds
+    :raises ValueError: if several files would be converted to the same one,
+                        like ``trace.asc`` and ``trace.blf``
+    """
+    names = sorted(
+        name
+        for name in os.listdir(input_dir)
+        if _is_log_file(os.path.join(input_dir, name))
+    )
+    sources: Dict[str, str] = {}
+    for name in names:
+        destination = _output_name(name, suffix)
+        if destination in sources:
+            raise ValueError(
+                f"Both {sources[destination]} and {name} would be converted "
+                f"to {destination}"
+            )
+        sources[destination] = name
+    os.makedirs(output_dir, exist_ok=True)
+
+    started = time.perf_counter()
+    total = 0
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            (
+                name,
+                destination,
+                executor.submit(
+                    convert_file,
+                    os.path.join(input_dir, name),
+                    os.path.join(output_dir, destination),
+                    **kwargs,
+                ),
+            )
+            for destination, name in sources.items()
+        ]
+        for source, destination, future in futures:
+            count, seconds = future.result()
+            _print_rate(source, destination, count, seconds)
+            total += count
+    return total, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Convert log files between the supported formats."
+    )
+
+    parser.add_argument(
+        "--suffix",
+        help="""The suffix of the format to convert to, like .blf. Required if
+                the input is a directory.""",
+        default=None,
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="""The number of files to convert in parallel if the input is a
+                directory. Defaults to the number of CPUs.""",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--start",
+        type=float,
+        help="<s> only convert messages with a timestamp at or after this one",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--end",
+        type=float,
+        help="<s> only convert messages with a timestamp at or before this one",
+        default=None,
+    )
+
+    _append_filter_argument(parser)
+
+    parser.add_argument(
+        "input",
+        metavar="input",
+        type=str,
+        help="""The file to convert, for supported types see can.LogReader, or
+                a directory of such files.""",
+    )
+
+    parser.add_argument(
+        "output",
+        metavar="output",
+        type=str,
+        help="""The file to write, for supported types see can.Logger, or the
+                directory to write the converted files to.""",
+    )
+
+    # print help message when no arguments were given
+    if len(sys.argv) < 2:
+        parser.print_help(sys.stderr)
+        raise SystemExit(errno.EINVAL)
+
+    results = parser.parse_args()
+
+    kwargs: Dict[str, Any] = {
+        "start": results.start,
+        "end": results.end,
+        "can_filters": _parse_filters(results) or None,
+    }
+
+    if os.path.isdir(results.input):
+        if results.suffix is None:
+            parser.error("--suffix is required to convert a directory")
+        try:
+            count, seconds = convert_directory(
+                results.input, results.output, results.suffix, results.jobs, **kwargs
+            )
+        except ValueError as error:
+            parser.error(str(error))
+        _print_rate(results.input, results.output, count, seconds)
+    else:
+        count, seconds = convert_file(results.input, results.output, **kwargs)
+        _print_rate(results.input, results.output, count, seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+This module contains :class:`~can.CompiledFilters`, which matches messages
+against :data:`can.typechecking.CanFilters` in (almost) constant time.
+"""
+
+from typing import cast, Dict, List, Optional, Set, Tuple
+
+from can.message import Message
+from can.typechecking import CanFilterExtended, CanFilters
+
+#: the largest arbitration ID of a standard (11-bit) frame
+STANDARD_ID_MAX = 0x7FF
+
+#: the largest arbitration ID of an extended (29-bit) frame
+EXTENDED_ID_MAX = 0x1FFFFFFF
+
+
+class CompiledFilters:
+    """A set of CAN filters that has been compiled for fast matching.
+
+    The filters have the same semantics as described in
+    :meth:`can.BusABC.set_filters`, but the cost of matching a message does
+    not grow with the number of filters:
+
+    - all 11-bit IDs are looked up in a precomputed bitmap with one entry
+      for each of the 2048 possible IDs,
+    - 29-bit IDs are first looked up in a set of the IDs of all filters
+      that match exactly one ID,
+    - all remaining 29-bit filters are grouped by their mask, such that only
+      a single set lookup per distinct mask is required.
+
+    This is for example used by :meth:`can.BusABC._matches_filters`, but may
+    also be used on its own::
+
+        >>> matcher = CompiledFilters([{"can_id": 0x100, "can_mask": 0x7F0}])
+        >>> matcher.matches(0x10A, is_extended_id=False)
+        True
+        >>> matcher(can.Message(arbitration_id=0x200))
+        False
+
+    Compiling is relatively expensive, so the instance should be reused as
+    long as the filters do not change.
+    """
+
+    def __init__(self, filters: Optional[CanFilters] = None) -> None:
+        """
+        :param filters:
+            The filters to compile. If `filters` is `None` or a zero length
+            sequence, all messages are matched.
+        """
+        #: the filters this instance was compiled from or `None` if all
+        #: messages are matched
+        self.filters: Optional[CanFilters] = filters or None
+
+        self._match_all = self.filters is None
+        self._standard_ids = bytearray(STANDARD_ID_MAX + 1)
+        self._extended_ids: Set[int] = set()
+        self._extended_masks: List[Tuple[int, Set[int]]] = []
+
+        masked: Dict[int, Set[int]] = {}
+        standard_seen: Set[Tuple[int, int]] = set()
+
+        for _filter in self.filters or ():
+            can_id = _filter["can_id"]
+            can_mask = _filter["can_mask"]
+            key = can_id & can_mask
+
+            # check to which kinds of frames this filter even applies
+            if "extended" in _filter:
+                _filter = cast(CanFilterExtended, _filter)
+                for_extended = bool(_filter["extended"])
+                for_standard = not for_extended
+            else:
+                for_extended = for_standard = True
+
+            if for_standard and (key, can_mask) not in standard_seen:
+                standard_seen.add((key, can_mask))
+                self._compile_standard(key, can_mask)
+
+            if for_extended:
+                if can_mask & EXTENDED_ID_MAX == EXTENDED_ID_MAX:
+                    # this filter matches exactly one valid ID
+                    self._extended_ids.add(key)
+                else:
+                    masked.setdefault(can_mask, set()).add(key)
+
+        self._extended_masks = list(masked.items())
+
+    def _compile_standard(self, key: int, can_mask: int) -> None:
+        # an 11-bit ID has no bits set above the lower 11, so the filter can
+        # only match if the same is true for the masked filter ID
+        if key & ~STANDARD_ID_MAX:
+            return
+
+        # enumerate all IDs that only differ in the bits not covered by the
+        # mask, i.e. all subsets of the "don't care" bits
+        free_bits = ~can_mask & STANDARD_ID_MAX
+        subset = free_bits
+        while True:
+            self._standard_ids[key | subset] = 1
+            if subset == 0:
+                break
+            subset = (subset - 1) & free_bits
+
+    def matches(self, arbitration_id: int, is_extended_id: bool) -> bool:
+        """Checks whether a frame with the given ID matches at least one of
+        the filters.
+
+        :param arbitration_id: the arbitration ID of the frame
+        :param is_extended_id: whether the ID is a 29-bit one
+        :return: whether the frame matches at least one filter
+        """
+        if self._match_all:
+            return True
+
+        if is_extended_id:
+            if 0 <= arbitration_id <= EXTENDED_ID_MAX:
+                if arbitration_id in self._extended_ids:
+                    return True
+                for can_mask, keys in self._extended_masks:
+                    if arbitration_id & can_mask in keys:
+                        return True
+                return False
+
+        elif 0 <= arbitration_id <= STANDARD_ID_MAX:
+            return self._standard_ids[arbitration_id] == 1
+
+        # the ID is out of range, so do not rely on the precomputed tables
+        return self._matches_slow(arbitration_id, is_extended_id)
+
+    def may_match_range(self, lowest_id: int, highest_id: int) -> bool:
+        """Checks whether any arbitration ID in a range may match a filter.
+
+        This is used to skip whole blocks of stored messages by the range of
+        their IDs. The check is exact for filters that match a single ID, but
+        may return `True` for masked filters that match none of the IDs in the
+        range. It never returns `False` if one of them matches.
+
+        :param lowest_id: the smallest arbitration ID in the range
+        :param highest_id: the largest arbitration ID in the range
+        :return: whether a frame with an ID in the range may match a filter
+        """
+        if self._match_all:
+            return True
+
+        for _filter in self.filters or ():
+            can_mask = _filter["can_mask"]
+            # the smallest and the largest ID that match this filter
+            smallest = _filter["can_id"] & can_mask & EXTENDED_ID_MAX
+            largest = smallest | (~can_mask & EXTENDED_ID_MAX)
+            if smallest <= highest_id and lowest_id <= largest:
+                return True
+        return False
+
+    def _matches_slow(self, arbitration_id: int, is_extended_id: bool) -> bool:
+        for _filter in self.filters or ():
+            # check if this filter even applies to the message
+            if "extended" in _filter:
+                _filter = cast(CanFilterExtended, _filter)
+                if _filter["extended"] != is_extended_id:
+                    continue
+
+            # then check for the mask and id
+            if (_filter["can_id"] ^ arbitration_id) & _filter["can_mask"] == 0:
+                return True
+
+        # nothing matched
+        return False
+
+    def __call__(self, msg: Message) -> bool:
+        """Checks whether the given message matches at least one of the filters.
+
+        :param msg: the message to check
+        :return: whether the message matches at least one filter
+        """
+        return self.matches(msg.arbitration_id, msg.is_extended_id)
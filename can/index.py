@@ -0,0 +1,68 @@
+"""
+Builds sidecar indexes of log files, which allow readers to seek to a start
+time instead of reading the whole file.
+
+    python -m can.index trace.asc trace.blf
+
+The index of each file is stored next to it with an additional ``.idx``
+suffix and is used by passing it as `index_file` to the reader, e.g.
+``can.LogReader("trace.asc", start=3600.0, index_file="trace.asc.idx")``.
+"""
+
+import sys
+import argparse
+import errno
+
+from .io import BLFReader, build_time_index
+from .io.compression import split_suffix
+from .io.timeindex import DEFAULT_STEP, LINE_TIMESTAMP_PARSERS
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Build sidecar time indexes of log files."
+    )
+
+    parser.add_argument(
+        "-s",
+        "--step",
+        type=int,
+        help="The number of lines between two entries of the index of a text "
+        f"log file. Defaults to {DEFAULT_STEP}.",
+        default=DEFAULT_STEP,
+    )
+
+    parser.add_argument(
+        "infiles",
+        metavar="input-file",
+        type=str,
+        nargs="+",
+        help="The files to index, either uncompressed "
+        f"{', '.join(sorted(LINE_TIMESTAMP_PARSERS))} files or .blf files.",
+    )
+
+    # print help message when no arguments were given
+    if len(sys.argv) < 2:
+        parser.print_help(sys.stderr)
+        raise SystemExit(errno.EINVAL)
+
+    results = parser.parse_args()
+
+    for filename in results.infiles:
+        index_file = f"{filename}.idx"
+        file_format, compression = split_suffix(filename)
+        if file_format == ".blf":
+            reader = BLFReader(filename, index_file=index_file)
+            try:
+                count = len(reader.index)
+            finally:
+                reader.stop()
+        elif file_format in LINE_TIMESTAMP_PARSERS and compression is None:
+            count = len(build_time_index(filename, index_file, results.step))
+        else:
+            parser.error(f'cannot index "{filename}"')
+        print(f"{filename} -> {index_file}: {count} entries")
+
+
+if __name__ == "__main__":
+    main()
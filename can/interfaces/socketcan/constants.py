@@ -4,6 +4,8 @@ Defines shared CAN constants.
 
 # Generic socket constants
 SO_TIMESTAMPNS = 35
+SO_RCVBUFFORCE = 33
+SO_RXQ_OVFL = 40
 
 CAN_ERR_FLAG = 0x20000000
 CAN_RTR_FLAG = 0x40000000
@@ -509,7 +509,7 @@ def bind_socket(sock: socket.socket, channel: str = "can0") -> None:
 
 
 def capture_message(
-    sock: socket.socket, get_channel: bool = False
+    sock: socket.socket, get_channel: bool = False, flags: int = 0
 ) -> Optional[Message]:
     """
     Captures a message from given socket.
@@ -518,31 +518,40 @@ def capture_message(
         The socket to read a message from.
     :param get_channel:
         Find out which channel the message comes from.
+    :param flags:
+        Flags passed to :meth:`socket.socket.recvmsg`, like
+        :data:`socket.MSG_DONTWAIT`.
 
-    :return: The received message, or None on failure.
+    :return: The received message, or None on failure or if no message
+             was available for a non-blocking read.
     """
     # Fetching the Arb ID, DLC and Data
     try:
         cf, ancillary_data, msg_flags, addr = sock.recvmsg(
-            CANFD_MTU, RECEIVED_ANCILLARY_BUFFER_SIZE
+            CANFD_MTU, RECEIVED_ANCILLARY_BUFFER_SIZE, flags
         )
         if get_channel:
             channel = addr[0] if isinstance(addr, tuple) else addr
         else:
             channel = None
+    except BlockingIOError:
+        # no frame is queued on the socket
+        return None
     except socket.error as error:
         raise can.CanOperationError(f"Error receiving: {error.strerror}", error.errno)
 
     can_id, can_dlc, flags, data = dissect_can_frame(cf)
 
-    # Fetching the timestamp
-    assert len(ancillary_data) == 1, "only requested a single extra field"
-    cmsg_level, cmsg_type, cmsg_data = ancillary_data[0]
-    assert (
-        cmsg_level == socket.SOL_SOCKET and cmsg_type == SO_TIMESTAMPNS
-    ), "received control message type that was not requested"
+    # Fetching the timestamp, other control messages (like the drop counter
+    # enabled by SocketcanBus) are ignored here
+    timestamps = [
+        cmsg_data
+        for cmsg_level, cmsg_type, cmsg_data in ancillary_data
+        if cmsg_level == socket.SOL_SOCKET and cmsg_type == SO_TIMESTAMPNS
+    ]
+    assert len(timestamps) == 1, "did not receive the requested timestamp"
     # see https://man7.org/linux/man-pages/man3/timespec.3.html -> struct timespec for details
-    seconds, nanoseconds = RECEIVED_TIMESTAMP_STRUCT.unpack_from(cmsg_data)
+    seconds, nanoseconds = RECEIVED_TIMESTAMP_STRUCT.unpack_from(timestamps[0])
     if nanoseconds >= 1e9:
         raise can.CanOperationError(
             f"Timestamp nanoseconds field was out of range: {nanoseconds} not less than 1e9"
@@ -593,7 +602,14 @@ def capture_message(
 # Constants needed for precise handling of timestamps
 if CMSG_SPACE_available:
     RECEIVED_TIMESTAMP_STRUCT = struct.Struct("@ll")
-    RECEIVED_ANCILLARY_BUFFER_SIZE = CMSG_SPACE(RECEIVED_TIMESTAMP_STRUCT.size)
+    # the drop counter is a __u32, see sock_recv_drops() in the kernel
+    RECEIVED_DROP_COUNT_STRUCT = struct.Struct("@I")
+    RECEIVED_ANCILLARY_BUFFER_SIZE = CMSG_SPACE(
+        RECEIVED_TIMESTAMP_STRUCT.size
+    ) + CMSG_SPACE(RECEIVED_DROP_COUNT_STRUCT.size)
+
+# struct timeval as used by the SO_RCVTIMEO socket option
+SOCKET_TIMEVAL_STRUCT = struct.Struct("@ll")
 
 
 class SocketcanBus(BusABC):
@@ -610,6 +626,7 @@ class SocketcanBus(BusABC):
         local_loopback: bool = True,
         fd: bool = False,
         can_filters: Optional[CanFilters] = None,
+        receive_buffer_size: Optional[int] = None,
         **kwargs,
     ) -> None:
         """Creates a new socketcan bus.
@@ -617,8 +634,10 @@ class SocketcanBus(BusABC):
         If setting some socket options fails, an error will be printed but no exception will be thrown.
         This includes enabling:
          - that own messages should be received,
-         - CAN-FD frames and
-         - error frames.
+         - CAN-FD frames,
+         - error frames,
+         - reporting of frames dropped by the kernel (see :attr:`dropped_frames`) and
+         - the size of the receive buffer.
 
         :param channel:
             The can interface name with which to create this bus.
@@ -639,12 +658,33 @@ class SocketcanBus(BusABC):
             If CAN-FD frames should be supported.
         :param can_filters:
             See :meth:`can.BusABC.set_filters`.
+        :param receive_buffer_size:
+            The size of the socket receive buffer in bytes, which determines
+            how many frames the kernel queues before dropping them. This uses
+            ``SO_RCVBUFFORCE`` to exceed the system wide limit
+            ``net.core.rmem_max`` if the process has the ``CAP_NET_ADMIN``
+            capability and ``SO_RCVBUF`` otherwise. Note that the kernel
+            doubles the value to account for its bookkeeping overhead.
+            By default, the system default size is kept.
         """
         self.socket = create_socket()
         self.channel = channel
         self.channel_info = "socketcan channel '%s'" % channel
         self._bcm_sockets: Dict[str, socket.socket] = {}
         self._is_filtered = False
+        # frames are received into this buffer to not allocate one per frame
+        self._rx_buffer = bytearray(CANFD_MTU)
+        self._rx_buffers = [self._rx_buffer]
+        # the receive timeout currently set on the socket, None blocks forever
+        self._rx_timeout: Optional[float] = None
+        # the last value of the kernel's drop counter and the accumulated total
+        self._rx_drop_count = 0
+        self._dropped_frames = 0
+        # frames are packed into this buffer, see _pack_frame()
+        self._tx_buffer = bytearray(CANFD_MTU)
+        self._tx_view = memoryview(self._tx_buffer)
+        self._tx_data_length = 0
+        self._tx_lock = threading.Lock()
         self._task_id = 0
         self._task_id_guard = threading.Lock()
 
@@ -684,16 +724,55 @@ class SocketcanBus(BusABC):
         #     so this is always supported by the kernel
         self.socket.setsockopt(socket.SOL_SOCKET, SO_TIMESTAMPNS, 1)
 
+        # report frames dropped because the receive queue was full
+        try:
+            self.socket.setsockopt(socket.SOL_SOCKET, SO_RXQ_OVFL, 1)
+        except socket.error as error:
+            log.error("Could not enable the drop counter (%s)", error)
+
+        if receive_buffer_size is not None:
+            self._set_receive_buffer_size(receive_buffer_size)
+
         bind_socket(self.socket, channel)
         kwargs.update(
             {
                 "receive_own_messages": receive_own_messages,
                 "fd": fd,
                 "local_loopback": local_loopback,
+                "receive_buffer_size": receive_buffer_size,
             }
         )
         super().__init__(channel=channel, can_filters=can_filters, **kwargs)
 
+    def _set_receive_buffer_size(self, size: int) -> None:
+        try:
+            self.socket.setsockopt(socket.SOL_SOCKET, SO_RCVBUFFORCE, size)
+        except socket.error as force_error:
+            log.debug("Could not force the receive buffer size (%s)", force_error)
+            try:
+                # this is limited to net.core.rmem_max
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, size)
+            except socket.error as error:
+                log.error("Could not set the receive buffer size (%s)", error)
+                return
+
+        log.debug(
+            "The receive buffer size is now %d bytes",
+            self.socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF),
+        )
+
+    @property
+    def dropped_frames(self) -> int:
+        """The number of frames the kernel dropped since the bus was created,
+        because the socket receive queue was full.
+
+        The kernel reports the counter along with the received frames, so this
+        only increases when the next frame after a loss is read. If frames are
+        lost regularly, consider reading them faster or increasing the
+        ``receive_buffer_size``.
+        """
+        return self._dropped_frames
+
     def shutdown(self) -> None:
         """Stops all active periodic tasks and closes the socket."""
         self.stop_all_periodic_tasks()
@@ -706,30 +785,141 @@ class SocketcanBus(BusABC):
     def _recv_internal(
         self, timeout: Optional[float]
     ) -> Tuple[Optional[Message], bool]:
+        if timeout is not None and timeout <= 0:
+            return self._receive_frame(socket.MSG_DONTWAIT), self._is_filtered
+
+        # the socket stays in blocking mode and the kernel itself times out
+        # the read, so that waiting and reading is a single system call
+        if timeout != self._rx_timeout:
+            self._set_receive_timeout(timeout)
+
+        return self._receive_frame(0), self._is_filtered
+
+    def _recv_internal_batch(
+        self, max_messages: int, timeout: Optional[float]
+    ) -> Tuple[List[Message], bool]:
+        # wait once for the first frame ...
+        msg, already_filtered = self._recv_internal(timeout)
+        if msg is None:
+            return [], already_filtered
+
+        # ... and then drain all frames that are already queued in the kernel
+        msgs = [msg]
+        while len(msgs) < max_messages:
+            msg = self._receive_frame(socket.MSG_DONTWAIT)
+            if msg is None:
+                break
+            msgs.append(msg)
+
+        return msgs, self._is_filtered
+
+    def _set_receive_timeout(self, timeout: Optional[float]) -> None:
+        if timeout is None:
+            # a timeout of zero makes the socket block indefinitely
+            seconds, microseconds = 0, 0
+        else:
+            seconds = int(timeout)
+            # round up, since zero would mean to block indefinitely
+            microseconds = max(int((timeout - seconds) * 1e6), 0 if seconds else 1)
+
         try:
-            # get all sockets that are ready (can be a list with a single value
-            # being self.socket or an empty list if self.socket is not ready)
-            ready_receive_sockets, _, _ = select.select([self.socket], [], [], timeout)
-        except socket.error as error:
+            self.socket.setsockopt(
+                socket.SOL_SOCKET,
+                socket.SO_RCVTIMEO,
+                SOCKET_TIMEVAL_STRUCT.pack(seconds, microseconds),
+            )
+        except OSError as error:
+            raise can.CanOperationError(
+                f"Failed to set the receive timeout: {error.strerror}", error.errno
+            )
+        self._rx_timeout = timeout
+
+    def _count_dropped_frames(self, cmsg_data: bytes) -> None:
+        # the kernel only sends the counter once it is not zero, and it
+        # is a running total for the socket that wraps around
+        (drop_count,) = RECEIVED_DROP_COUNT_STRUCT.unpack_from(cmsg_data)
+        dropped = (drop_count - self._rx_drop_count) & 0xFFFFFFFF
+        if dropped:
+            self._rx_drop_count = drop_count
+            self._dropped_frames += dropped
+            log_rx.debug(
+                "The kernel dropped %d frames, %d in total",
+                dropped,
+                self._dropped_frames,
+            )
+
+    def _receive_frame(self, flags: int) -> Optional[Message]:
+        """Reads a single frame into the receive buffer and decodes it.
+
+        :param flags: Flags passed to :meth:`socket.socket.recvmsg_into`
+        :return: The received message, or None if the read timed out.
+        """
+        try:
+            nbytes, ancillary_data, msg_flags, addr = self.socket.recvmsg_into(
+                self._rx_buffers, RECEIVED_ANCILLARY_BUFFER_SIZE, flags
+            )
+        except BlockingIOError:
+            # the receive timeout expired or no frame was queued
+            return None
+        except OSError as error:
             # something bad happened (e.g. the interface went down)
             raise can.CanOperationError(
                 f"Failed to receive: {error.strerror}", error.errno
             )
 
-        if ready_receive_sockets:  # not empty
-            get_channel = self.channel == ""
-            msg = capture_message(self.socket, get_channel)
-            if msg and not msg.channel and self.channel:
-                # Default to our own channel
-                msg.channel = self.channel
-            return msg, self._is_filtered
+        buffer = self._rx_buffer
+        can_id, can_dlc, fd_flags = CAN_FRAME_HEADER_STRUCT.unpack_from(buffer)
+        is_fd = nbytes == CANFD_MTU
+
+        timestamp: Optional[float] = None
+        for cmsg_level, cmsg_type, cmsg_data in ancillary_data:
+            if cmsg_level != socket.SOL_SOCKET:
+                continue
+            if cmsg_type == SO_TIMESTAMPNS:
+                # see https://man7.org/linux/man-pages/man3/timespec.3.html
+                seconds, nanoseconds = RECEIVED_TIMESTAMP_STRUCT.unpack_from(cmsg_data)
+                if nanoseconds >= 1e9:
+                    raise can.CanOperationError(
+                        f"Timestamp nanoseconds field was out of range: {nanoseconds} not less than 1e9"
+                    )
+                timestamp = seconds + nanoseconds * 1e-9
+            elif cmsg_type == SO_RXQ_OVFL:
+                self._count_dropped_frames(cmsg_data)
+
+        if timestamp is None:
+            raise can.CanOperationError(
+                "Received a frame without the requested timestamp"
+            )
 
-        # socket wasn't readable or timeout occurred
-        return None, self._is_filtered
+        if self.channel:
+            channel = self.channel
+        else:
+            channel = addr[0] if isinstance(addr, tuple) else addr
+
+        return Message(
+            timestamp=timestamp,
+            channel=channel,
+            arbitration_id=can_id & (MSK_ARBID if can_id & CAN_EFF_FLAG else 0x7FF),
+            is_extended_id=bool(can_id & CAN_EFF_FLAG),
+            is_remote_frame=bool(can_id & CAN_RTR_FLAG),
+            is_error_frame=bool(can_id & CAN_ERR_FLAG),
+            is_fd=is_fd,
+            # Section 4.7.1: MSG_DONTROUTE: set when the received frame was
+            # created on the local host.
+            is_rx=not msg_flags & socket.MSG_DONTROUTE,
+            # flags are not valid in non-FD frames
+            bitrate_switch=is_fd and bool(fd_flags & CANFD_BRS),
+            error_state_indicator=is_fd and bool(fd_flags & CANFD_ESI),
+            dlc=can_dlc,
+            data=buffer[8 : 8 + can_dlc],
+        )
 
     def send(self, msg: Message, timeout: Optional[float] = None) -> None:
         """Transmit a message to the CAN bus.
 
+        The frame is written without waiting first, and only if the transmit
+        queue is full, the socket is waited on until the `timeout` expires.
+
         :param msg: A message object.
         :param timeout:
             Wait up to this many seconds for the transmit queue to be ready.
@@ -738,40 +928,141 @@ class SocketcanBus(BusABC):
         :raises can.CanError:
             if the message could not be written.
         """
-        log.debug("We've been asked to write a message to the bus")
-        logger_tx = log.getChild("tx")
-        logger_tx.debug("sending: %s", msg)
+        log_tx.debug("sending: %s", msg)
 
         started = time.time()
-        # If no timeout is given, poll for availability
+        channel = str(msg.channel) if msg.channel and not self.channel else None
+        with self._tx_lock:
+            self._send_frame(self._pack_frame(msg), channel, started, timeout)
+
+    def send_batch(
+        self, msgs: Sequence[Message], timeout: Optional[float] = None
+    ) -> int:
+        """Transmit several messages to the CAN bus, in the given order.
+
+        The frames are written one after another without waiting for the
+        socket. Only if the transmit queue runs full, the socket is waited on.
+
+        :param msgs: The message objects to transmit.
+        :param timeout:
+            Wait up to this many seconds in total for the transmit queue to
+            be ready. If not given, the call may fail immediately.
+
+        :return:
+            The number of messages that were queued for transmission, see
+            :meth:`can.BusABC.send_batch`.
+
+        :raises can.CanError:
+            if the first message could not be written.
+        """
+        started = time.time()
+        sent_count = 0
+
+        with self._tx_lock:
+            try:
+                for msg in msgs:
+                    channel = (
+                        str(msg.channel) if msg.channel and not self.channel else None
+                    )
+                    self._send_frame(self._pack_frame(msg), channel, started, timeout)
+                    sent_count += 1
+            except can.CanOperationError as error:
+                if sent_count == 0:
+                    raise
+                log.debug(
+                    "Sending a batch stopped after %d messages: %s", sent_count, error
+                )
+
+        return sent_count
+
+    def _pack_frame(self, msg: Message) -> Union[bytes, memoryview]:
+        """Packs the message into the transmit buffer of this bus.
+
+        This produces the same frames as :func:`build_can_frame`, but avoids
+        allocating new objects for each frame. The returned view is only
+        valid until the next message is packed.
+        """
+        max_len = 64 if msg.is_fd else 8
+        data = msg.data
+        length = len(data)
+        if length > max_len:
+            # let the kernel reject the frame, like it always did
+            return build_can_frame(msg)
+
+        can_id = msg.arbitration_id
+        if msg.is_extended_id:
+            can_id |= CAN_EFF_FLAG
+        if msg.is_remote_frame:
+            can_id |= CAN_RTR_FLAG
+        if msg.is_error_frame:
+            can_id |= CAN_ERR_FLAG
+        fd_flags = 0
+        if msg.bitrate_switch:
+            fd_flags |= CANFD_BRS
+        if msg.error_state_indicator:
+            fd_flags |= CANFD_ESI
+
+        buffer = self._tx_buffer
+        CAN_FRAME_HEADER_STRUCT.pack_into(buffer, 0, can_id, msg.dlc, fd_flags)
+        buffer[8 : 8 + length] = data
+        # only clear what is left over from previous frames
+        if length < self._tx_data_length:
+            buffer[8 + length : 8 + self._tx_data_length] = bytes(
+                self._tx_data_length - length
+            )
+        self._tx_data_length = length
+
+        return self._tx_view[: 8 + max_len]
+
+    def _send_frame(
+        self,
+        frame: Union[bytes, memoryview],
+        channel: Optional[str],
+        started: float,
+        timeout: Optional[float],
+    ) -> None:
+        # the socket is writable almost always, so do not wait for it first
+        try:
+            self._send_once(frame, channel, socket.MSG_DONTWAIT)
+            return
+        except can.CanOperationError as error:
+            if error.error_code not in (errno.EAGAIN, errno.ENOBUFS):
+                raise
+            last_error = error
+
+        # If no timeout is given, fail immediately
         if timeout is None:
             timeout = 0
-        time_left = timeout
-        data = build_can_frame(msg)
-
-        while time_left >= 0:
-            # Wait for write availability
-            ready = select.select([], [self.socket], [], time_left)[1]
-            if not ready:
-                # Timeout
-                break
-            channel = str(msg.channel) if msg.channel else None
-            sent = self._send_once(data, channel)
-            if sent == len(data):
-                return
-            # Not all data were sent, try again with remaining data
-            data = data[sent:]
-            time_left = timeout - (time.time() - started)
-
-        raise can.CanOperationError("Transmit buffer full")
 
-    def _send_once(self, data: bytes, channel: Optional[str] = None) -> int:
+        # The transmit queue is full, so wait for it
+        while True:
+            time_left = timeout - (time.time() - started)
+            if time_left <= 0:
+                raise can.CanOperationError(
+                    "Transmit buffer full", last_error.error_code
+                )
+
+            if select.select([], [self.socket], [], time_left)[1]:
+                try:
+                    self._send_once(frame, channel, socket.MSG_DONTWAIT)
+                    return
+                except can.CanOperationError as error:
+                    if error.error_code not in (errno.EAGAIN, errno.ENOBUFS):
+                        raise
+                    last_error = error
+
+    def _send_once(
+        self,
+        data: Union[bytes, memoryview],
+        channel: Optional[str] = None,
+        flags: int = 0,
+    ) -> int:
         try:
             if self.channel == "" and channel:
                 # Message must be addressed to a specific channel
-                sent = self.socket.sendto(data, (channel,))
+                sent = self.socket.sendto(data, flags, (channel,))
             else:
-                sent = self.socket.send(data)
+                sent = self.socket.send(data, flags)
         except socket.error as error:
             raise can.CanOperationError(
                 f"Failed to transmit: {error.strerror}", error.errno
@@ -825,7 +1116,7 @@ class SocketcanBus(BusABC):
 
     def _get_next_task_id(self) -> int:
         with self._task_id_guard:
-            self._task_id = (self._task_id + 1) % (2 ** 32 - 1)
+            self._task_id = (self._task_id + 1) % (2**32 - 1)
             return self._task_id
 
     def _get_bcm_socket(self, channel: str) -> socket.socket:
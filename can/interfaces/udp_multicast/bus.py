@@ -2,8 +2,9 @@ import logging
 import select
 import socket
 import struct
+import time
 
-from typing import List, Optional, Tuple, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
 log = logging.getLogger(__name__)
 
@@ -130,6 +131,34 @@ class UdpMulticastBus(BusABC):
         data = pack_message(message)
         self._multicast.send(data, timeout)
 
+    def send_batch(
+        self, messages: Sequence[can.Message], timeout: Optional[float] = None
+    ) -> int:
+        if not self.is_fd and any(message.is_fd for message in messages):
+            raise can.CanOperationError(
+                "cannot send FD message over bus with CAN FD disabled"
+            )
+
+        # pack everything beforehand to send the datagrams in quick succession
+        packed = [pack_message(message) for message in messages]
+
+        started = time.time()
+        sent = 0
+        for data in packed:
+            time_left = None
+            if timeout is not None:
+                time_left = max(0.0, timeout - (time.time() - started))
+            try:
+                self._multicast.send(data, time_left)
+            except OSError as error:
+                if sent == 0:
+                    raise
+                log.debug("Sending a batch stopped after %d messages: %s", sent, error)
+                break
+            sent += 1
+
+        return sent
+
     def fileno(self) -> int:
         """Provides the internally used file descriptor of the socket or `-1` if not available."""
         return self._multicast.fileno()
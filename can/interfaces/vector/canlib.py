@@ -527,6 +527,41 @@ class VectorBus(BusABC):
     def send(self, msg: Message, timeout: Optional[float] = None):
         self._send_sequence([msg])
 
+    def send_batch(
+        self, msgs: Sequence[Message], timeout: Optional[float] = None
+    ) -> int:
+        """Transmit several messages with as few driver calls as possible.
+
+        Consecutive messages for the same channel are passed to the driver
+        in a single call.
+
+        :return:
+            The number of messages that were queued for transmission, see
+            :meth:`can.BusABC.send_batch`.
+        """
+        sent = 0
+        start = 0
+        while start < len(msgs):
+            # find the run of messages that are addressed to the same channel
+            end = start + 1
+            while end < len(msgs) and msgs[end].channel == msgs[start].channel:
+                end += 1
+
+            try:
+                sent_now = self._send_sequence(msgs[start:end])
+            except VectorError as error:
+                if sent == 0:
+                    raise
+                LOG.debug("Sending a batch stopped after %d messages: %s", sent, error)
+                break
+
+            sent += sent_now
+            if sent_now < end - start:
+                break
+            start = end
+
+        return sent
+
     def _send_sequence(self, msgs: Sequence[Message]) -> int:
         """Send messages and return number of successful transmissions."""
         if self.fd:
@@ -535,7 +570,7 @@ class VectorBus(BusABC):
             return self._send_can_msg_sequence(msgs)
 
     def _get_tx_channel_mask(self, msgs: Sequence[Message]) -> int:
-        if len(msgs) == 1:
+        if all(msg.channel == msgs[0].channel for msg in msgs):
             return self.channel_masks.get(msgs[0].channel, self.mask)
         else:
             return self.mask
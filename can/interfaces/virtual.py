@@ -6,13 +6,13 @@ Any VirtualBus instances connecting to the same channel
 and reside in the same process will receive the same messages.
 """
 
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
 
+from collections import deque
 from copy import deepcopy
 import logging
 import time
-import queue
-from threading import RLock
+from threading import Condition, Lock, RLock
 from random import randint
 
 from can import CanOperationError
@@ -23,12 +23,85 @@ from can.typechecking import AutoDetectedConfig
 logger = logging.getLogger(__name__)
 
 
+class _ReceiveQueue:
+    """The messages waiting to be received by a :class:`VirtualBus`.
+
+    A batch of messages is sent in two steps, which each take the lock of a
+    queue only once: Space for the batch is reserved in all receiving queues
+    first, then the messages that fit into all of them are appended. Thus,
+    every receiver gets the same messages of a batch.
+    """
+
+    def __init__(self, max_size: int = 0) -> None:
+        """
+        :param max_size: the maximum number of queued messages or 0 for no limit
+        """
+        self.max_size = max_size
+        self._messages: Deque[Message] = deque()
+        # the space promised to senders that have not appended their batch yet
+        self._reserved = 0
+        lock = Lock()
+        self._not_empty = Condition(lock)
+        self._not_full = Condition(lock)
+
+    def _free(self) -> int:
+        return self.max_size - len(self._messages) - self._reserved
+
+    def reserve(self, count: int, deadline: Optional[float]) -> int:
+        """Reserves space for up to `count` messages.
+
+        :param count: the number of messages to reserve space for
+        :param deadline: the value of :func:`time.monotonic` until which to
+                         wait for space for at least one message, or `None`
+                         to wait indefinitely
+        :return: the number of messages space was reserved for, which is zero
+                 if the queue stayed full
+        """
+        if self.max_size <= 0:
+            return count
+        with self._not_full:
+            timeout = None if deadline is None else deadline - time.monotonic()
+            self._not_full.wait_for(lambda: self._free() > 0, timeout)
+            reserved = max(0, min(count, self._free()))
+            self._reserved += reserved
+            return reserved
+
+    def put_batch(self, msgs: Sequence[Message], reserved: int) -> None:
+        """Appends messages that space was reserved for by :meth:`reserve`.
+
+        :param msgs: at most `reserved` messages
+        :param reserved: the value returned by :meth:`reserve`, the remainder
+                         of which is released
+        """
+        with self._not_empty:
+            if self.max_size > 0:
+                self._reserved -= reserved
+                if reserved > len(msgs):
+                    self._not_full.notify_all()
+            if msgs:
+                self._messages.extend(msgs)
+                self._not_empty.notify()
+
+    def qsize(self) -> int:
+        """Returns the number of queued messages."""
+        with self._not_empty:
+            return len(self._messages)
+
+    def get(self, timeout: Optional[float]) -> Optional[Message]:
+        """Removes the oldest message, waiting up to `timeout` seconds for one.
+
+        :return: the message or `None` if the timeout expired
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: self._messages, timeout):
+                return None
+            msg = self._messages.popleft()
+            self._not_full.notify()
+            return msg
+
+
 # Channels are lists of queues, one for each connection
-if TYPE_CHECKING:
-    # https://mypy.readthedocs.io/en/stable/runtime_troubles.html#using-classes-that-are-generic-in-stubs-but-not-at-runtime
-    channels: Dict[Optional[Any], List[queue.Queue[Message]]] = {}
-else:
-    channels = {}
+channels: Dict[Optional[Any], List[_ReceiveQueue]] = {}
 channels_lock = RLock()
 
 
@@ -78,7 +151,7 @@ class VirtualBus(BusABC):
                 channels[self.channel_id] = []
             self.channel = channels[self.channel_id]
 
-            self.queue: queue.Queue[Message] = queue.Queue(rx_queue_size)
+            self.queue = _ReceiveQueue(rx_queue_size)
             self.channel.append(self.queue)
 
     def _check_if_open(self) -> None:
@@ -93,12 +166,7 @@ class VirtualBus(BusABC):
         self, timeout: Optional[float]
     ) -> Tuple[Optional[Message], bool]:
         self._check_if_open()
-        try:
-            msg = self.queue.get(block=True, timeout=timeout)
-        except queue.Empty:
-            return None, False
-        else:
-            return msg, False
+        return self.queue.get(timeout), False
 
     def send(self, msg: Message, timeout: Optional[float] = None) -> None:
         self._check_if_open()
@@ -113,14 +181,66 @@ class VirtualBus(BusABC):
             msg_copy.timestamp = timestamp
             msg_copy.channel = self.channel_id
             msg_copy.is_rx = bus_queue is not self.queue
-            try:
-                bus_queue.put(msg_copy, block=True, timeout=timeout)
-            except queue.Full:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            if bus_queue.reserve(1, deadline):
+                bus_queue.put_batch([msg_copy], 1)
+            else:
                 all_sent = False
 
         if not all_sent:
             raise CanOperationError("Could not send message to one or more recipients")
 
+    def send_batch(
+        self, msgs: Sequence[Message], timeout: Optional[float] = None
+    ) -> int:
+        """Transmit several messages at once.
+
+        All messages of the batch get the same timestamp. If the size of a
+        receiver's queue is limited by `rx_queue_size`, `timeout` applies to
+        the whole batch. Every receiver gets the same messages: if not all of
+        them fit into the queue of some receiver, the remaining ones are not
+        sent to any receiver.
+
+        :return:
+            The number of messages that were queued for all recipients.
+
+        :raises can.CanOperationError:
+            If the first message could not be sent to all recipients.
+        """
+        self._check_if_open()
+
+        timestamp = time.time()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        receivers = [
+            bus_queue
+            for bus_queue in self.channel
+            if bus_queue is not self.queue or self.receive_own_messages
+        ]
+
+        # find out how many messages fit into the queues of all receivers
+        count = len(msgs)
+        reservations = []
+        for bus_queue in receivers:
+            reserved = bus_queue.reserve(count, deadline) if count else 0
+            reservations.append(reserved)
+            count = min(count, reserved)
+
+        for bus_queue, reserved in zip(receivers, reservations):
+            batch = []
+            for msg in msgs[:count]:
+                msg_copy = deepcopy(msg)
+                msg_copy.timestamp = timestamp
+                msg_copy.channel = self.channel_id
+                msg_copy.is_rx = bus_queue is not self.queue
+                batch.append(msg_copy)
+            bus_queue.put_batch(batch, reserved)
+
+        if msgs and not count:
+            raise CanOperationError("Could not send message to one or more recipients")
+        if count < len(msgs):
+            logger.debug("Sending a batch stopped after %d messages", count)
+        return count
+
     def shutdown(self) -> None:
         if self._open:
             self._open = False
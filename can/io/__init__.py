@@ -5,12 +5,17 @@ and Writers based off the file extension.
 
 # Generic
 from .logger import Logger, BaseRotatingLogger, SizedRotatingLogger
-from .player import LogReader, MessageSync
+from .logger import TimedRotatingLogger
+from .player import LogReader, MergedLogReader, MessageSync
 
 # Format specific
 from .asc import ASCWriter, ASCReader
 from .blf import BLFReader, BLFWriter
 from .canutils import CanutilsLogReader, CanutilsLogWriter
+from .columnar import ColumnarReader, ColumnarWriter
 from .csv import CSVWriter, CSVReader
 from .sqlite import SqliteReader, SqliteWriter
 from .printer import Printer
+
+# Sidecar indexes
+from .timeindex import TimeIndex, build_time_index
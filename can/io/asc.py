@@ -6,17 +6,21 @@ Example .asc files:
     - under `test/data/logfile.asc`
 """
 
-from typing import cast, Any, Generator, IO, List, Optional, Union, Dict
+from typing import cast, Any, Generator, IO, List, Optional, Tuple, Union, Dict
 from can import typechecking
 
 from datetime import datetime
+import math
+import sys
 import time
 import logging
 
+from ..filters import CompiledFilters
 from ..message import Message
 from ..listener import Listener
 from ..util import channel2int
 from .generic import BaseIOHandler
+from .timeindex import seek_offset
 
 
 CAN_MSG_EXT = 0x80000000
@@ -27,6 +31,17 @@ BASE_DEC = 10
 logger = logging.getLogger("can.io.asc")
 
 
+if sys.version_info >= (3, 8):
+
+    def _format_data(data: bytearray) -> str:
+        return data.hex(" ").upper()
+
+else:
+
+    def _format_data(data: bytearray) -> str:
+        return " ".join("{:02X}".format(byte) for byte in data)
+
+
 class ASCReader(BaseIOHandler):
     """
     Iterator of CAN messages from a ASC logging file. Meta data (comments,
@@ -35,11 +50,22 @@ class ASCReader(BaseIOHandler):
 
     FORMAT_START_OF_FILE_DATE = "%a %b %d %I:%M:%S.%f %p %Y"
 
+    # whether to parse common data frames directly before falling back to
+    # the general parser, which is only disabled for comparison
+    _use_fast_path = True
+
+    # the number of distinct frame headers to remember when parsing
+    _MAX_CACHED_HEADERS = 4096
+
     def __init__(
         self,
         file: Union[typechecking.FileLike, typechecking.StringPathLike],
         base: str = "hex",
         relative_timestamp: bool = True,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        can_filters: Optional[typechecking.CanFilters] = None,
+        index_file: Optional[typechecking.StringPathLike] = None,
     ) -> None:
         """
         :param file: a path-like object or as file-like object to read from
@@ -51,6 +77,18 @@ class ASCReader(BaseIOHandler):
         :param relative_timestamp: Select whether the timestamps are
                      `relative` (starting at 0.0) or `absolute` (starting at
                      the system time). Default `True = relative`.
+        :param start: if given, skip messages with an earlier timestamp
+        :param end: if given, stop reading at the first message with a later
+                    timestamp, since the file is assumed to be sorted by time
+        :param can_filters: if given, only read the messages matching at least
+                            one of the filters, see
+                            :meth:`can.BusABC.set_filters` for the format
+        :param index_file: a path-like object of a sidecar file with a
+                           :class:`~can.io.timeindex.TimeIndex`, which is used
+                           to seek to `start`. If it does not exist or does not
+                           match the file, the index is built and written to it.
+
+        Lines are rejected by their timestamp before parsing the rest of them.
         """
         super().__init__(file, mode="r")
 
@@ -63,6 +101,10 @@ class ASCReader(BaseIOHandler):
         # TODO - what is this used for? The ASC Writer only prints `absolute`
         self.timestamps_format = None
         self.internal_events_logged = None
+        self.start = start
+        self.end = end
+        self._filters = CompiledFilters(can_filters) if can_filters else None
+        self._index_file = index_file
 
     def _extract_header(self):
         for line in self.file:
@@ -206,37 +248,245 @@ class ASCReader(BaseIOHandler):
         self.file = cast(IO[Any], self.file)
         self._extract_header()
 
+        # Optimized inner loop by making local copies of global variables
+        # and class members and hence reducing the number of lookups
+        start_time = self.start_time
+        if self.start is not None and self._index_file is not None:
+            # the header is parsed already, so seeking keeps the start time
+            # and the base needed to parse the lines
+            offset = seek_offset(
+                self.file, self._index_file, ".asc", self.start - start_time
+            )
+            if offset is not None:
+                self.file.seek(offset)
+        min_timestamp = -math.inf if self.start is None else self.start
+        max_timestamp = math.inf if self.end is None else self.end
+        time_limited = self.start is not None or self.end is not None
+        matches = None if self._filters is None else self._filters.matches
+        fast_path = self._use_fast_path and self._converted_base == BASE_HEX
+        from_hex = bytearray.fromhex
+        parse_classic_header = self._parse_classic_header
+        parse_fd_header = self._parse_fd_header
+        max_cached_headers = self._MAX_CACHED_HEADERS
+        # the parsed fields of recently seen frames, see _parse_classic_header()
+        # and _parse_fd_header()
+        classic_headers: Dict[Tuple[str, ...], Tuple[Any, ...]] = {}
+        fd_headers: Dict[Tuple[str, ...], Tuple[Any, ...]] = {}
+
         for line in self.file:
-            temp = line.strip()
-            if not temp or not temp[0].isdigit():
-                # Could be a comment
-                continue
-            msg_kwargs = {}
-            try:
-                timestamp, channel, rest_of_message = temp.split(None, 2)
-                timestamp = float(timestamp) + self.start_time
-                msg_kwargs["timestamp"] = timestamp
-                if channel == "CANFD":
-                    msg_kwargs["is_fd"] = True
-                elif channel.isdigit():
-                    # See ASCWriter
-                    msg_kwargs["channel"] = int(channel) - 1
+            if time_limited:
+                try:
+                    timestamp = float(line.split(None, 1)[0]) + start_time
+                except (IndexError, ValueError):
+                    # not a message, but maybe a comment
+                    pass
                 else:
-                    # Not a CAN message. Possible values include "statistic", J1939TP
-                    continue
-            except ValueError:
-                # Some other unprocessed or unknown format
-                continue
-
-            if "is_fd" not in msg_kwargs:
-                msg = self._process_classic_can_frame(rest_of_message, msg_kwargs)
-            else:
-                msg = self._process_fd_can_frame(rest_of_message, msg_kwargs)
-            if msg is not None:
+                    if timestamp < min_timestamp:
+                        continue
+                    if timestamp > max_timestamp:
+                        break
+
+            if fast_path:
+                # Parse the common data frames directly. The fields preceding
+                # the data are only parsed once for each distinct header.
+                # Anything else, including malformed data, is left to the
+                # general parser.
+                parts = line.split(None, 6)
+                try:
+                    if parts[1] != "CANFD":
+                        # channel, ID, direction, "d", DLC
+                        key = (parts[1], parts[2], parts[3], parts[4], parts[5])
+                        header = classic_headers.get(key)
+                        if header is None:
+                            if len(classic_headers) >= max_cached_headers:
+                                classic_headers.clear()
+                            header = parse_classic_header(*key)
+                            classic_headers[key] = header
+                        if header and parts[0][0].isdigit():
+                            channel, arbitration_id, is_extended_id, dlc, is_rx = header
+                            if matches is not None and not matches(
+                                arbitration_id, is_extended_id
+                            ):
+                                continue
+                            data = from_hex(parts[6][: 3 * dlc]) if dlc else bytearray()
+                            if len(data) == dlc:
+                                yield Message(
+                                    float(parts[0]) + start_time,
+                                    arbitration_id,
+                                    is_extended_id,
+                                    False,
+                                    False,
+                                    channel,
+                                    dlc,
+                                    data,
+                                    False,
+                                    is_rx,
+                                )
+                                continue
+                    else:
+                        # channel, direction, ID, (symbolic name), BRS, ESI,
+                        # DLC, data length
+                        if parts[5].isdigit():
+                            brs = parts[5]
+                            esi, dlc_str, length_str, data_str = parts[6].split(None, 3)
+                        else:
+                            fields = parts[6].split(None, 4)
+                            brs, esi, dlc_str, length_str, data_str = fields
+                        fd_key = (
+                            parts[2],
+                            parts[3],
+                            parts[4],
+                            brs,
+                            esi,
+                            dlc_str,
+                            length_str,
+                        )
+                        header = fd_headers.get(fd_key)
+                        if header is None:
+                            if len(fd_headers) >= max_cached_headers:
+                                fd_headers.clear()
+                            header = parse_fd_header(*fd_key)
+                            fd_headers[fd_key] = header
+                        if header and parts[0][0].isdigit():
+                            (
+                                channel,
+                                arbitration_id,
+                                is_extended_id,
+                                dlc,
+                                data_length,
+                                is_rx,
+                                bitrate_switch,
+                                error_state_indicator,
+                            ) = header
+                            if matches is not None and not matches(
+                                arbitration_id, is_extended_id
+                            ):
+                                continue
+                            data = (
+                                from_hex(data_str[: 3 * data_length])
+                                if data_length
+                                else bytearray()
+                            )
+                            if len(data) == data_length:
+                                yield Message(
+                                    float(parts[0]) + start_time,
+                                    arbitration_id,
+                                    is_extended_id,
+                                    data_length == 0,
+                                    False,
+                                    channel,
+                                    dlc,
+                                    data,
+                                    True,
+                                    is_rx,
+                                    bitrate_switch,
+                                    error_state_indicator,
+                                )
+                                continue
+                except (IndexError, ValueError):
+                    pass
+
+            msg = self._process_line(line)
+            if msg is not None and (
+                matches is None or matches(msg.arbitration_id, msg.is_extended_id)
+            ):
                 yield msg
 
         self.stop()
 
+    @staticmethod
+    def _parse_classic_header(
+        channel: str, can_id: str, direction: str, dtype: str, dlc: str
+    ) -> Tuple[Any, ...]:
+        """Parses the fields of a classic CAN data frame that precede the data.
+
+        :return: the channel, arbitration ID, whether the ID is an extended
+                 one, DLC and whether the frame was received or an empty
+                 tuple if these fields do not belong to a data frame
+        """
+        if dtype != "d" or not channel.isdigit() or direction not in ("Rx", "Tx"):
+            return ()
+        is_extended_id = can_id[-1] in "xX"
+        try:
+            return (
+                # See ASCWriter
+                int(channel) - 1,
+                int(can_id[:-1] if is_extended_id else can_id, 16),
+                is_extended_id,
+                int(dlc, 16),
+                direction == "Rx",
+            )
+        except ValueError:
+            return ()
+
+    @staticmethod
+    def _parse_fd_header(
+        channel: str,
+        direction: str,
+        can_id: str,
+        brs: str,
+        esi: str,
+        dlc: str,
+        data_length: str,
+    ) -> Tuple[Any, ...]:
+        """Parses the fields of a CAN FD frame that precede the data.
+
+        :return: the channel, arbitration ID, whether the ID is an extended
+                 one, DLC, data length, whether the frame was received, the
+                 bitrate switch and the error state indicator or an empty
+                 tuple if these fields do not belong to a CAN FD frame
+        """
+        if (
+            not channel.isdigit()
+            or direction not in ("Rx", "Tx")
+            or can_id[:10].lower() == "errorframe"
+        ):
+            return ()
+        is_extended_id = can_id[-1] in "xX"
+        try:
+            return (
+                # See ASCWriter
+                int(channel) - 1,
+                int(can_id[:-1] if is_extended_id else can_id, 16),
+                is_extended_id,
+                int(dlc, 16),
+                int(data_length),
+                direction == "Rx",
+                brs == "1",
+                esi == "1",
+            )
+        except ValueError:
+            return ()
+
+    def _process_line(self, line: str) -> Optional[Message]:
+        """Parses any line of the file.
+
+        :return: the message on this line or `None` if it does not contain one
+        """
+        temp = line.strip()
+        if not temp or not temp[0].isdigit():
+            # Could be a comment
+            return None
+        msg_kwargs: Dict[str, Any] = {}
+        try:
+            timestamp, channel, rest_of_message = temp.split(None, 2)
+            msg_kwargs["timestamp"] = float(timestamp) + self.start_time
+            if channel == "CANFD":
+                msg_kwargs["is_fd"] = True
+            elif channel.isdigit():
+                # See ASCWriter
+                msg_kwargs["channel"] = int(channel) - 1
+            else:
+                # Not a CAN message. Possible values include "statistic", J1939TP
+                return None
+        except ValueError:
+            # Some other unprocessed or unknown format
+            return None
+
+        if "is_fd" not in msg_kwargs:
+            return self._process_classic_can_frame(rest_of_message, msg_kwargs)
+        return self._process_fd_can_frame(rest_of_message, msg_kwargs)
+
 
 class ASCWriter(BaseIOHandler, Listener):
     """Logs CAN data to an ASCII log file (.asc).
@@ -245,8 +495,21 @@ class ASCWriter(BaseIOHandler, Listener):
     If a message has a timestamp smaller than the previous one or None,
     it gets assigned the timestamp that was written for the last message.
     It the first message does not have a timestamp, it is set to zero.
+
+    The lines are collected in memory and written to the file in large chunks:
+    once :attr:`MAX_BUFFER_SIZE_BEFORE_WRITES` lines were collected, with the
+    first line that arrives at least `flush_interval` seconds after the last
+    write and when :meth:`flush` or :meth:`stop` is called. There is no timer,
+    so if no more messages arrive, the collected lines stay in memory until
+    one of these methods is called.
     """
 
+    #: Max number of lines collected before they are written to the file
+    MAX_BUFFER_SIZE_BEFORE_WRITES = 1000
+
+    #: Max number of distinct message headers to keep preformatted
+    MAX_CACHED_FORMATS = 4096
+
     FORMAT_MESSAGE = "{channel}  {id:<15} {dir:<4} {dtype} {data}"
     FORMAT_MESSAGE_FD = " ".join(
         [
@@ -277,6 +540,7 @@ class ASCWriter(BaseIOHandler, Listener):
         self,
         file: Union[typechecking.FileLike, typechecking.StringPathLike],
         channel: int = 1,
+        flush_interval: float = 1.0,
     ) -> None:
         """
         :param file: a path-like object or as file-like object to write to
@@ -284,12 +548,21 @@ class ASCWriter(BaseIOHandler, Listener):
                      write mode, not binary write mode.
         :param channel: a default channel to use when the message does not
                         have a channel set
+        :param flush_interval: the time in seconds after the last write after
+                               which the next line is written right away,
+                               together with all collected ones. If this is
+                               zero, every line is written immediately.
         """
         super().__init__(file, mode="w")
         if not self.file:
             raise ValueError("The given file cannot be None")
 
         self.channel = channel
+        self.flush_interval = flush_interval
+        self._lines: List[str] = []
+        self._last_write = time.monotonic()
+        # the parts of a line before and after the data, see _format_parts()
+        self._formats: Dict[Tuple[Any, ...], Tuple[str, str]] = {}
 
         # write start of file header
         now = datetime.now().strftime(self.FORMAT_START_OF_FILE_DATE)
@@ -306,9 +579,25 @@ class ASCWriter(BaseIOHandler, Listener):
         # This is guaranteed to not be None since we raise ValueError in __init__
         self.file = cast(IO[Any], self.file)
         if not self.file.closed:
-            self.file.write("End TriggerBlock\n")
+            self._lines.append("End TriggerBlock\n")
+            self._write_lines()
         super().stop()
 
+    def flush(self) -> None:
+        """Writes the collected lines to the file and flushes it."""
+        # This is guaranteed to not be None since we raise ValueError in __init__
+        self.file = cast(IO[Any], self.file)
+        self._write_lines()
+        self.file.flush()
+
+    def _write_lines(self) -> None:
+        """Writes the collected lines to the file."""
+        # This is guaranteed to not be None since we raise ValueError in __init__
+        self.file = cast(IO[Any], self.file)
+        self.file.write("".join(self._lines))
+        self._lines.clear()
+        self._last_write = time.monotonic()
+
     def log_event(self, message: str, timestamp: Optional[float] = None) -> None:
         """Add a message to the log file.
 
@@ -330,7 +619,7 @@ class ASCWriter(BaseIOHandler, Listener):
             formatted_date = time.strftime(
                 self.FORMAT_DATE.format(mlsec), time.localtime(self.last_timestamp)
             )
-            self.file.write("Begin Triggerblock %s\n" % formatted_date)
+            self._lines.append("Begin Triggerblock %s\n" % formatted_date)
             self.header_written = True
             self.log_event("Start of measurement")  # caution: this is a recursive call!
         # Use last known timestamp if unknown
@@ -339,20 +628,54 @@ class ASCWriter(BaseIOHandler, Listener):
         # turn into relative timestamps if necessary
         if timestamp >= self.started:
             timestamp -= self.started
-        line = self.FORMAT_EVENT.format(timestamp=timestamp, message=message)
-        self.file.write(line)
+        self._lines.append(
+            self.FORMAT_EVENT.format(timestamp=timestamp, message=message)
+        )
+        if (
+            len(self._lines) >= self.MAX_BUFFER_SIZE_BEFORE_WRITES
+            or time.monotonic() - self._last_write >= self.flush_interval
+        ):
+            self._write_lines()
 
     def on_message_received(self, msg: Message) -> None:
 
         if msg.is_error_frame:
             self.log_event("{}  ErrorFrame".format(self.channel), msg.timestamp)
             return
+        key = (
+            msg.channel,
+            msg.arbitration_id,
+            msg.is_extended_id,
+            msg.is_rx,
+            msg.is_remote_frame,
+            msg.is_fd,
+            msg.bitrate_switch,
+            msg.error_state_indicator,
+            msg.dlc,
+            len(msg.data),
+        )
+        parts = self._formats.get(key)
+        if parts is None:
+            if len(self._formats) >= self.MAX_CACHED_FORMATS:
+                self._formats.clear()
+            parts = self._formats[key] = self._format_parts(msg)
+        prefix, suffix = parts
+        if msg.is_remote_frame:
+            self.log_event(prefix + suffix, msg.timestamp)
+        else:
+            self.log_event(prefix + _format_data(msg.data) + suffix, msg.timestamp)
+
+    def _format_parts(self, msg: Message) -> Tuple[str, str]:
+        """Formats everything of a message except for its timestamp and data.
+
+        :return: the parts of the serialized message before and after the data
+        """
         if msg.is_remote_frame:
             dtype = "r {:x}".format(msg.dlc)  # New after v8.5
-            data: List[str] = []
+            data_length = 0
         else:
             dtype = "d {:x}".format(msg.dlc)
-            data = ["{:02X}".format(byte) for byte in msg.data]
+            data_length = len(msg.data)
         arb_id = "{:X}".format(msg.arbitration_id)
         if msg.is_extended_id:
             arb_id += "x"
@@ -362,6 +685,8 @@ class ASCWriter(BaseIOHandler, Listener):
         else:
             # Many interfaces start channel numbering at 0 which is invalid
             channel += 1
+        # the data is inserted between both parts
+        placeholder = "\0"
         if msg.is_fd:
             flags = 0
             flags |= 1 << 12
@@ -377,8 +702,8 @@ class ASCWriter(BaseIOHandler, Listener):
                 brs=1 if msg.bitrate_switch else 0,
                 esi=1 if msg.error_state_indicator else 0,
                 dlc=msg.dlc,
-                data_length=len(data),
-                data=" ".join(data),
+                data_length=data_length,
+                data=placeholder,
                 message_duration=0,
                 message_length=0,
                 flags=flags,
@@ -394,6 +719,7 @@ class ASCWriter(BaseIOHandler, Listener):
                 id=arb_id,
                 dir="Rx" if msg.is_rx else "Tx",
                 dtype=dtype,
-                data=" ".join(data),
+                data=placeholder,
             )
-        self.log_event(serialized, msg.timestamp)
+        prefix, _, suffix = serialized.partition(placeholder)
+        return prefix, suffix
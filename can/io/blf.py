@@ -12,17 +12,39 @@ of uncompressed data each. This data contains the actual CAN messages and other
 objects types.
 """
 
+import json
+import math
+import mmap
+import os
+import queue
 import struct
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 import zlib
 import datetime
 import time
 import logging
-from typing import List
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
+from ..filters import CompiledFilters
 from ..message import Message
 from ..listener import Listener
 from ..util import len2dlc, dlc2len, channel2int
-from ..typechecking import AcceptedIOType
+from ..typechecking import AcceptedIOType, CanFilters, StringPathLike
 from .generic import BaseIOHandler
 
 
@@ -32,6 +54,8 @@ class BLFParseError(Exception):
 
 LOG = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 # signature ("LOGG"), header size,
 # application ID, application major, application minor, application build,
 # bin log major, bin log minor, bin log build, bin log patch,
@@ -61,6 +85,11 @@ CAN_MSG_STRUCT = struct.Struct("<HBBL8s")
 # valid data bytes, data
 CAN_FD_MSG_STRUCT = struct.Struct("<HBBLLBBB5x64s")
 
+# the size of the largest object written for a message
+CAN_FD_OBJ_SIZE = (
+    OBJ_HEADER_BASE_STRUCT.size + OBJ_HEADER_V1_STRUCT.size + CAN_FD_MSG_STRUCT.size
+)
+
 # channel, dlc, valid payload length of data, tx count, arbitration id,
 # frame length, flags, bit rate used in arbitration phase,
 # bit rate used in data phase, time offset of brs field,
@@ -131,21 +160,86 @@ def systemtime_to_timestamp(systemtime):
         return 0
 
 
+class ContainerIndexEntry(NamedTuple):
+    """Describes a single log container of a BLF file, see :attr:`BLFReader.index`."""
+
+    #: the position of the container object in the file
+    offset: int
+    #: the size of the container object in the file, without padding
+    size: int
+    #: the position of the first object that starts in the uncompressed data of
+    #: this container, or `None` if it only holds parts of earlier objects
+    first_object: Optional[int]
+    #: the smallest timestamp of all objects starting in this container
+    start_timestamp: Optional[float]
+    #: the largest timestamp of all objects starting in this container
+    stop_timestamp: Optional[float]
+
+
 class BLFReader(BaseIOHandler):
     """
     Iterator of CAN messages from a Binary Logging File.
 
     Only CAN messages and error frames are supported. Other object types are
     silently ignored.
+
+    Besides reading the whole file, parts of it can be read efficiently with
+    :meth:`seek_time` and :meth:`read_range`. These use an :attr:`index` of all
+    log containers, which takes one pass over the file to build. It can be
+    stored in a sidecar file, so that it is only built once::
+
+        with BLFReader("overnight.blf", index_file="overnight.blf.idx") as reader:
+            for msg in reader.read_range(start, start + 5.0):
+                print(msg)
+
+    Iterating can also be limited to a time range and to some arbitration IDs
+    with the `start`, `end` and `can_filters` arguments. Objects are then
+    skipped by their headers, without creating any messages.
     """
 
-    def __init__(self, file):
+    #: the version of the sidecar index files that are written
+    INDEX_FORMAT_VERSION = 1
+
+    def __init__(
+        self,
+        file: AcceptedIOType,
+        index_file: Optional[StringPathLike] = None,
+        workers: int = 0,
+        processes: int = 0,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        can_filters: Optional[CanFilters] = None,
+    ) -> None:
         """
         :param file: a path-like object or as file-like object to read from
                      If this is a file-like object, is has to opened in binary
                      read mode, not text read mode.
+        :param index_file: a path-like object of a sidecar file to load the
+                           :attr:`index` from. If it does not exist or does not
+                           match the file, the index is built and written to it
+                           on first use.
+        :param workers: The number of threads that decompress containers ahead
+                        of the parser. Since :mod:`zlib` releases the GIL, this
+                        speeds up reading large files on multiple cores.
+                        By default, everything happens in the calling thread.
+        :param processes: The number of processes that parse the objects when
+                          iterating over the whole file. This additionally
+                          moves most of the parsing off the calling thread, but
+                          each container has to be sent to another process.
+                          By default, the objects are parsed in the calling
+                          thread.
+        :param start: if given, skip messages with an earlier timestamp
+        :param end: if given, skip messages with a later timestamp. If an
+                    `index_file` is given, only the containers in the time
+                    range are read. Otherwise, the file is assumed to be
+                    sorted by time and reading stops at the first later
+                    object.
+        :param can_filters: if given, only read the messages matching at least
+                            one of the filters, see
+                            :meth:`can.BusABC.set_filters` for the format
         """
         super().__init__(file, mode="rb")
+        assert self.file is not None
         data = self.file.read(FILE_HEADER_STRUCT.size)
         header = FILE_HEADER_STRUCT.unpack(data)
         if header[0] != b"LOGG":
@@ -155,79 +249,567 @@ class BLFReader(BaseIOHandler):
         self.object_count = header[12]
         self.start_timestamp = systemtime_to_timestamp(header[14:22])
         self.stop_timestamp = systemtime_to_timestamp(header[22:30])
-        # Read rest of header
-        self.file.read(header[1] - FILE_HEADER_STRUCT.size)
+        # Skip rest of header
+        self._data_start = header[1]
+        self._stream_pos = FILE_HEADER_STRUCT.size
         self._tail = b""
-        self._pos = 0
+
+        # read the file through a memory map if possible, since the objects
+        # are accessed in many small pieces
+        self._mmap: Optional[mmap.mmap]
+        try:
+            self._mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):
+            # e.g. an in-memory file
+            self._mmap = None
+
+        self._index_file = index_file
+        self._index: Optional[List[ContainerIndexEntry]] = None
+
+        # where iteration starts, see seek_time()
+        self._seek_container: Optional[int] = None
+        self._seek_timestamp: Optional[float] = None
+
+        self._select(start, end, can_filters)
+
+        self._workers = workers
+        self._processes = processes
+        self._executors: List[Executor] = []
+        self._decompressor: Optional[Executor] = None
+        self._parser: Optional[Executor] = None
+
+    def _select(
+        self,
+        start: Optional[float],
+        end: Optional[float],
+        can_filters: Optional[CanFilters],
+    ) -> None:
+        """Sets which messages :meth:`_parse_container` yields."""
+        self._start = start
+        self._end = end
+        self._can_filters = can_filters
+        self._filters = CompiledFilters(can_filters) if can_filters else None
+        # whether _parse_objects() found an object after the end of the range
+        self._past_end = False
 
     def __iter__(self):
+        time_limited = self._start is not None or self._end is not None
+        if (
+            self._seek_container is None
+            and time_limited
+            and (self._index is not None or self._index_file is not None)
+        ):
+            yield from self.read_range(self._start, self._end)
+        elif self._seek_container is None:
+            datas = (
+                data
+                for _, data in self._iter_containers(self._data_start)
+                if data is not None
+            )
+            if self._processes > 0:
+                yield from self._parse_containers_in_processes(datas)
+            else:
+                for data in datas:
+                    yield from self._parse_container(data)
+                    if self._past_end:
+                        break
+        else:
+            # skip everything before the time that was seeked to
+            seek_timestamp = self._seek_timestamp
+            for msg in self._read_containers(
+                range(self._seek_container, len(self.index))
+            ):
+                if seek_timestamp is None or msg.timestamp >= seek_timestamp:
+                    seek_timestamp = None
+                    yield msg
+        self.stop()
+
+    def _read_at(self, offset: int, size: int) -> bytes:
+        if self._mmap is not None:
+            return self._mmap[offset : offset + size]
+        assert self.file is not None
+        if self.file.seekable():
+            self.file.seek(offset)
+        else:
+            # only reading forward is possible, like when iterating
+            self.file.read(offset - self._stream_pos)
+        data: bytes = self.file.read(size)
+        self._stream_pos = offset + len(data)
+        return data
+
+    def _iter_containers(
+        self, offset: int
+    ) -> Iterator[Tuple[Tuple[int, int], Optional[bytes]]]:
+        """Iterates over all objects at the top level of the file, which
+        should all be log containers.
+
+        :param offset: the position of the first object to read
+        :return: the position and size of each container as well as the
+                 uncompressed data, which is `None` if the container cannot be
+                 decompressed
+        """
+        return self._decompress_containers(self._iter_container_objects(offset))
+
+    def _iter_container_objects(
+        self, offset: int
+    ) -> Iterator[Tuple[Tuple[int, int], bytes]]:
+        header_size = OBJ_HEADER_BASE_STRUCT.size
         while True:
-            data = self.file.read(OBJ_HEADER_BASE_STRUCT.size)
-            if not data:
+            data = self._read_at(offset, header_size)
+            if len(data) < header_size:
                 # EOF
                 break
 
             signature, _, _, obj_size, obj_type = OBJ_HEADER_BASE_STRUCT.unpack(data)
             if signature != b"LOBJ":
                 raise BLFParseError()
-            obj_data = self.file.read(obj_size - OBJ_HEADER_BASE_STRUCT.size)
-            # Read padding bytes
-            self.file.read(obj_size % 4)
 
             if obj_type == LOG_CONTAINER:
-                method, uncompressed_size = LOG_CONTAINER_STRUCT.unpack_from(obj_data)
-                container_data = obj_data[LOG_CONTAINER_STRUCT.size :]
-                if method == NO_COMPRESSION:
-                    data = container_data
-                elif method == ZLIB_DEFLATE:
-                    data = zlib.decompress(container_data, 15, uncompressed_size)
-                else:
-                    # Unknown compression method
-                    LOG.warning("Unknown compression method (%d)", method)
+                obj_data = self._read_at(offset + header_size, obj_size - header_size)
+                yield (offset, obj_size), obj_data
+
+            # Skip padding bytes
+            offset += obj_size + obj_size % 4
+
+    def _decompress_containers(
+        self, containers: Iterable[Tuple[_T, bytes]]
+    ) -> Iterator[Tuple[_T, Optional[bytes]]]:
+        """Decompresses the data of log container objects in order.
+
+        If there are `workers`, a bounded number of containers is decompressed
+        ahead in a thread pool.
+        """
+        if self._workers <= 0:
+            for key, obj_data in containers:
+                yield key, self._decompress(obj_data)
+            return
+
+        if self._decompressor is None:
+            self._decompressor = ThreadPoolExecutor(self._workers)
+            self._executors.append(self._decompressor)
+        pending: Deque[Tuple[_T, "Future[Optional[bytes]]"]] = deque()
+        for key, obj_data in containers:
+            pending.append((key, self._decompressor.submit(self._decompress, obj_data)))
+            if len(pending) > 2 * self._workers:
+                key, future = pending.popleft()
+                yield key, future.result()
+        while pending:
+            key, future = pending.popleft()
+            yield key, future.result()
+
+    def _parse_containers_in_processes(
+        self, datas: Iterable[bytes]
+    ) -> Iterator[Message]:
+        """Like calling :meth:`_parse_container` for all containers, but parses
+        the objects in a process pool."""
+        if self._parser is None:
+            self._parser = ProcessPoolExecutor(self._processes)
+            self._executors.append(self._parser)
+        pending: Deque["Future[Tuple[List[tuple], bool]]"] = deque()
+        tail = b""
+        for data in datas:
+            if tail:
+                data = b"".join((tail, data))
+            # only complete objects can be parsed independently of the others
+            end = _complete_objects_end(data)
+            tail = data[end:]
+            pending.append(
+                self._parser.submit(
+                    _parse_records,
+                    data[:end],
+                    self.start_timestamp,
+                    self._start,
+                    self._end,
+                    self._can_filters,
+                )
+            )
+            if len(pending) > 2 * self._processes:
+                yield from self._collect_records(pending)
+                if self._past_end:
+                    break
+        while pending and not self._past_end:
+            yield from self._collect_records(pending)
+        for future in pending:
+            future.cancel()
+
+    def _collect_records(
+        self, pending: Deque["Future[Tuple[List[tuple], bool]]"]
+    ) -> Iterator[Message]:
+        """Creates the messages parsed by the oldest pending worker."""
+        records, self._past_end = pending.popleft().result()
+        for record in records:
+            yield Message(*record)
+
+    @staticmethod
+    def _decompress(obj_data: bytes) -> Optional[bytes]:
+        method, uncompressed_size = LOG_CONTAINER_STRUCT.unpack_from(obj_data)
+        container_data = obj_data[LOG_CONTAINER_STRUCT.size :]
+        if method == NO_COMPRESSION:
+            return container_data
+        if method == ZLIB_DEFLATE:
+            return zlib.decompress(container_data, 15, uncompressed_size)
+        # Unknown compression method
+        LOG.warning("Unknown compression method (%d)", method)
+        return None
+
+    @property
+    def index(self) -> List[ContainerIndexEntry]:
+        """All log containers of the file in the order they are stored.
+
+        This is loaded from the sidecar index file if one was given and it
+        matches the file. Otherwise it is built on first access, which requires
+        decompressing the whole file once, and then stored in the sidecar file.
+        """
+        if self._index is None:
+            if self._index_file is not None:
+                self._index = self._load_index(self._index_file)
+            if self._index is None:
+                self._index = self._build_index()
+                if self._index_file is not None:
+                    self._save_index(self._index_file, self._index)
+        return self._index
+
+    def _file_length(self) -> int:
+        if self._mmap is not None:
+            return len(self._mmap)
+        assert self.file is not None
+        return self.file.seek(0, os.SEEK_END)
+
+    def _load_index(
+        self, index_file: StringPathLike
+    ) -> Optional[List[ContainerIndexEntry]]:
+        try:
+            with open(index_file, "r", encoding="utf-8") as sidecar:
+                content = json.load(sidecar)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            LOG.warning("Ignoring the malformed index file %s", index_file)
+            return None
+
+        if (
+            content.get("version") != self.INDEX_FORMAT_VERSION
+            or content.get("file_length") != self._file_length()
+            or content.get("object_count") != self.object_count
+        ):
+            LOG.info("The index file %s is outdated", index_file)
+            return None
+
+        return [ContainerIndexEntry(*entry) for entry in content["containers"]]
+
+    def _save_index(
+        self, index_file: StringPathLike, index: List[ContainerIndexEntry]
+    ) -> None:
+        content = {
+            "version": self.INDEX_FORMAT_VERSION,
+            "file_length": self._file_length(),
+            "object_count": self.object_count,
+            "containers": [list(entry) for entry in index],
+        }
+        try:
+            with open(index_file, "w", encoding="utf-8") as sidecar:
+                json.dump(content, sidecar)
+        except OSError as error:
+            LOG.warning("Could not write the index file %s: %s", index_file, error)
+
+    def _build_index(self) -> List[ContainerIndexEntry]:
+        index: List[ContainerIndexEntry] = []
+        tail = b""
+        previous_size = 0
+        for (offset, size), data in self._iter_containers(self._data_start):
+            if data is None:
+                index.append(ContainerIndexEntry(offset, size, None, None, None))
+                tail = b""
+                previous_size = 0
+                continue
+
+            tail_size = len(tail)
+            joined_data = b"".join((tail, data)) if tail else data
+            objects, remaining_pos = self._scan_objects(joined_data)
+
+            # objects may have started in the previous container, but only
+            # now their header is complete
+            earlier = [
+                (previous_size - tail_size + pos, timestamp)
+                for pos, timestamp in objects
+                if pos < tail_size <= previous_size
+            ]
+            if earlier:
+                previous = index[-1]
+                timestamps = [timestamp for _, timestamp in earlier]
+                if previous.start_timestamp is not None:
+                    timestamps.append(previous.start_timestamp)
+                if previous.stop_timestamp is not None:
+                    timestamps.append(previous.stop_timestamp)
+                index[-1] = previous._replace(
+                    first_object=earlier[0][0]
+                    if previous.first_object is None
+                    else previous.first_object,
+                    start_timestamp=min(timestamps),
+                    stop_timestamp=max(timestamps),
+                )
+
+            own = [(pos - tail_size, ts) for pos, ts in objects if pos >= tail_size]
+            own_timestamps = [timestamp for _, timestamp in own]
+            index.append(
+                ContainerIndexEntry(
+                    offset,
+                    size,
+                    own[0][0] if own else None,
+                    min(own_timestamps) if own else None,
+                    max(own_timestamps) if own else None,
+                )
+            )
+
+            tail = joined_data[remaining_pos:]
+            previous_size = len(data)
+        return index
+
+    def _scan_objects(self, data: bytes) -> Tuple[List[Tuple[int, float]], int]:
+        """Finds the objects in the data without parsing them.
+
+        :return: the position and absolute timestamp of every object whose
+                 header is contained in the data, even if the rest of the
+                 object is not, as well as the position where the data
+                 starts that could not be processed
+        """
+        max_pos = len(data)
+        header_base_size = OBJ_HEADER_BASE_STRUCT.size
+        objects = []
+        pos = 0
+        while True:
+            try:
+                pos = data.index(b"LOBJ", pos, pos + 8)
+            except ValueError:
+                if pos + 8 > max_pos:
+                    # Not enough data in container
+                    break
+                raise BLFParseError("Could not find next object")
+
+            if pos + header_base_size > max_pos:
+                # The header continues in the next container
+                break
+            _, _, header_version, obj_size, _ = OBJ_HEADER_BASE_STRUCT.unpack_from(
+                data, pos
+            )
+            header_struct = (
+                OBJ_HEADER_V1_STRUCT if header_version == 1 else OBJ_HEADER_V2_STRUCT
+            )
+            if pos + header_base_size + header_struct.size > max_pos:
+                # The header continues in the next container
+                break
+
+            if header_version in (1, 2):
+                flags, _, _, timestamp = header_struct.unpack_from(
+                    data, pos + header_base_size
+                )
+                factor = 1e-5 if flags == 1 else 1e-9
+                objects.append((pos, timestamp * factor + self.start_timestamp))
+
+            if pos + obj_size > max_pos:
+                # This object continues in the next container
+                break
+            pos += obj_size
+
+        return objects, pos
+
+    def seek_time(self, timestamp: float) -> None:
+        """Makes iterating over the reader start at the first message with a
+        timestamp equal to or larger than the given one.
+
+        Only the containers from the one that holds that message on are
+        decompressed.
+
+        :param timestamp: the absolute timestamp to seek to
+        """
+        self._tail = b""
+        self._seek_timestamp = timestamp
+        for number, entry in enumerate(self.index):
+            if entry.stop_timestamp is not None and entry.stop_timestamp >= timestamp:
+                self._seek_container = number
+                break
+        else:
+            # there is nothing after that time
+            self._seek_container = len(self.index)
+
+    def read_range(
+        self, start: Optional[float] = None, end: Optional[float] = None
+    ) -> Iterator[Message]:
+        """Reads all messages with timestamps in the given range, in the order
+        they are stored in the file.
+
+        Only the containers that hold objects in that range are decompressed.
+        Unlike iterating over the reader, this does not close the file, such
+        that multiple ranges can be read.
+
+        :param start: the smallest absolute timestamp to include,
+                      or `None` to start at the beginning
+        :param end: the largest absolute timestamp to include,
+                    or `None` to continue until the end
+        """
+        containers = [
+            number
+            for number, entry in enumerate(self.index)
+            if entry.start_timestamp is not None
+            and entry.stop_timestamp is not None
+            and (start is None or entry.stop_timestamp >= start)
+            and (end is None or entry.start_timestamp <= end)
+        ]
+        for msg in self._read_containers(containers):
+            if (start is None or msg.timestamp >= start) and (
+                end is None or msg.timestamp <= end
+            ):
+                yield msg
+
+    def _read_containers(self, containers: Iterable[int]) -> Iterator[Message]:
+        """Parses the given containers, which must be in ascending order.
+
+        Objects that started in containers before the first given one or in
+        skipped ones are ignored, while objects continuing into skipped
+        containers are completed.
+        """
+        index = self.index
+        header_size = OBJ_HEADER_BASE_STRUCT.size
+        self._tail = b""
+        last_number = -1
+        container_objects = (
+            (
+                number,
+                self._read_at(
+                    index[number].offset + header_size,
+                    index[number].size - header_size,
+                ),
+            )
+            for number in containers
+        )
+        for number, data in self._decompress_containers(container_objects):
+            if number != last_number + 1:
+                yield from self._complete_tail(last_number + 1, number)
+                self._tail = b""
+
+            entry = index[number]
+            last_number = number
+            if data is None:
+                self._tail = b""
+                continue
+            if not self._tail:
+                if entry.first_object is None:
+                    # only holds the continuation of an object that was skipped
                     continue
-                yield from self._parse_container(data)
-        self.stop()
+                # start at the first object that begins in this container
+                data = data[entry.first_object :]
+            # the selected containers may hold objects in any order
+            yield from self._parse_container(data, stop_at_end=False)
+
+        yield from self._complete_tail(last_number + 1, len(index))
 
-    def _parse_container(self, data):
+    def _complete_tail(self, first: int, stop: int) -> Iterator[Message]:
+        """Parses the parts of the containers in the range that belong to an
+        object that started before them."""
+        index = self.index
+        for number in range(first, stop):
+            if not self._tail:
+                break
+            entry = index[number]
+            data = self._read_container(entry)
+            if data is None:
+                break
+            if entry.first_object is not None:
+                data = data[: entry.first_object]
+            yield from self._parse_container(data, stop_at_end=False)
+
+    def _read_container(self, entry: ContainerIndexEntry) -> Optional[bytes]:
+        header_size = OBJ_HEADER_BASE_STRUCT.size
+        return self._decompress(
+            self._read_at(entry.offset + header_size, entry.size - header_size)
+        )
+
+    def stop(self) -> None:
+        """Closes the file."""
+        for executor in self._executors:
+            executor.shutdown()
+        self._executors.clear()
+        self._decompressor = self._parser = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        super().stop()
+
+    def _parse_container(self, data, stop_at_end=True):
         if self._tail:
             data = b"".join((self._tail, data))
-        try:
-            yield from self._parse_data(data)
-        except struct.error:
-            # There was not enough data in the container to unpack a struct
-            pass
+        end, self._past_end = yield from _parse_objects(
+            data,
+            self.start_timestamp,
+            Message,
+            self._start,
+            self._end,
+            self._filters,
+            stop_at_end,
+        )
         # Save the remaining data that could not be processed
-        self._tail = data[self._pos :]
-
-    def _parse_data(self, data):
-        """Optimized inner loop by making local copies of global variables
-        and class members and hardcoding some values."""
-        unpack_obj_header_base = OBJ_HEADER_BASE_STRUCT.unpack_from
-        obj_header_base_size = OBJ_HEADER_BASE_STRUCT.size
-        unpack_obj_header_v1 = OBJ_HEADER_V1_STRUCT.unpack_from
-        obj_header_v1_size = OBJ_HEADER_V1_STRUCT.size
-        unpack_obj_header_v2 = OBJ_HEADER_V2_STRUCT.unpack_from
-        obj_header_v2_size = OBJ_HEADER_V2_STRUCT.size
-        unpack_can_msg = CAN_MSG_STRUCT.unpack_from
-        unpack_can_fd_msg = CAN_FD_MSG_STRUCT.unpack_from
-        unpack_can_fd_64_msg = CAN_FD_MSG_64_STRUCT.unpack_from
-        can_fd_64_msg_size = CAN_FD_MSG_64_STRUCT.size
-        unpack_can_error_ext = CAN_ERROR_EXT_STRUCT.unpack_from
-
-        start_timestamp = self.start_timestamp
-        max_pos = len(data)
-        pos = 0
+        self._tail = data[end:]
+
+
+def _parse_objects(
+    data: bytes,
+    start_timestamp: float,
+    make_message: Callable[..., Any] = Message,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    filters: Optional[CompiledFilters] = None,
+    stop_at_end: bool = True,
+) -> Generator[Any, None, Tuple[int, bool]]:
+    """Parses the complete objects in the decompressed data of containers.
+
+    Optimized inner loop by making local copies of global variables
+    and hardcoding some values.
+
+    :param data: the objects, starting with the first one
+    :param start_timestamp: the start timestamp of the file, which the
+                            timestamps of the objects are relative to
+    :param make_message: called with the same arguments as :class:`can.Message`
+                         to create the yielded objects
+    :param start: if given, skip objects with an earlier timestamp
+    :param end: if given, skip objects with a later timestamp
+    :param filters: if given, skip messages that do not match these filters
+    :param stop_at_end: whether to stop at the first object after `end`,
+                        which is only correct if the objects are sorted by time
+    :return: the position after the last complete object, where parsing has to
+             continue once more data is available, and whether an object
+             after `end` was found
+    """
+    unpack_obj_header_base = OBJ_HEADER_BASE_STRUCT.unpack_from
+    obj_header_base_size = OBJ_HEADER_BASE_STRUCT.size
+    unpack_obj_header_v1 = OBJ_HEADER_V1_STRUCT.unpack_from
+    obj_header_v1_size = OBJ_HEADER_V1_STRUCT.size
+    unpack_obj_header_v2 = OBJ_HEADER_V2_STRUCT.unpack_from
+    obj_header_v2_size = OBJ_HEADER_V2_STRUCT.size
+    unpack_can_msg = CAN_MSG_STRUCT.unpack_from
+    unpack_can_fd_msg = CAN_FD_MSG_STRUCT.unpack_from
+    unpack_can_fd_64_msg = CAN_FD_MSG_64_STRUCT.unpack_from
+    can_fd_64_msg_size = CAN_FD_MSG_64_STRUCT.size
+    unpack_can_error_ext = CAN_ERROR_EXT_STRUCT.unpack_from
+
+    min_timestamp = -math.inf if start is None else start
+    max_timestamp = math.inf if end is None else end
+    matches = None if filters is None else filters.matches
+
+    max_pos = len(data)
+    pos = 0
 
+    object_pos = pos
+    try:
         # Loop until a struct unpack raises an exception
         while True:
-            self._pos = pos
+            object_pos = pos
             # Find next object after padding (depends on object type)
             try:
                 pos = data.index(b"LOBJ", pos, pos + 8)
             except ValueError:
                 if pos + 8 > max_pos:
                     # Not enough data in container
-                    return
+                    return object_pos, False
                 raise BLFParseError("Could not find next object")
             header = unpack_obj_header_base(data, pos)
             # print(header)
@@ -239,7 +821,7 @@ class BLFReader(BaseIOHandler):
             next_pos = pos + obj_size
             if next_pos > max_pos:
                 # This object continues in the next container
-                return
+                return object_pos, False
             pos += obj_header_base_size
 
             # Read rest of header
@@ -257,10 +839,23 @@ class BLFReader(BaseIOHandler):
             # Calculate absolute timestamp in seconds
             factor = 1e-5 if flags == 1 else 1e-9
             timestamp = timestamp * factor + start_timestamp
+            if timestamp < min_timestamp:
+                pos = next_pos
+                continue
+            if timestamp > max_timestamp:
+                if stop_at_end:
+                    return object_pos, True
+                pos = next_pos
+                continue
 
             if obj_type == CAN_MESSAGE or obj_type == CAN_MESSAGE2:
                 channel, flags, dlc, can_id, can_data = unpack_can_msg(data, pos)
-                yield Message(
+                if matches is not None and not matches(
+                    can_id & 0x1FFFFFFF, bool(can_id & CAN_MSG_EXT)
+                ):
+                    pos = next_pos
+                    continue
+                yield make_message(
                     timestamp=timestamp,
                     arbitration_id=can_id & 0x1FFFFFFF,
                     is_extended_id=bool(can_id & CAN_MSG_EXT),
@@ -276,7 +871,12 @@ class BLFReader(BaseIOHandler):
                 dlc = members[5]
                 can_id = members[7]
                 can_data = members[9]
-                yield Message(
+                if matches is not None and not matches(
+                    can_id & 0x1FFFFFFF, bool(can_id & CAN_MSG_EXT)
+                ):
+                    pos = next_pos
+                    continue
+                yield make_message(
                     timestamp=timestamp,
                     is_error_frame=True,
                     is_extended_id=bool(can_id & CAN_MSG_EXT),
@@ -298,7 +898,12 @@ class BLFReader(BaseIOHandler):
                     valid_bytes,
                     can_data,
                 ) = members
-                yield Message(
+                if matches is not None and not matches(
+                    can_id & 0x1FFFFFFF, bool(can_id & CAN_MSG_EXT)
+                ):
+                    pos = next_pos
+                    continue
+                yield make_message(
                     timestamp=timestamp,
                     arbitration_id=can_id & 0x1FFFFFFF,
                     is_extended_id=bool(can_id & CAN_MSG_EXT),
@@ -329,8 +934,13 @@ class BLFReader(BaseIOHandler):
                     _,
                     _,
                 ) = unpack_can_fd_64_msg(data, pos)
+                if matches is not None and not matches(
+                    can_id & 0x1FFFFFFF, bool(can_id & CAN_MSG_EXT)
+                ):
+                    pos = next_pos
+                    continue
                 pos += can_fd_64_msg_size
-                yield Message(
+                yield make_message(
                     timestamp=timestamp,
                     arbitration_id=can_id & 0x1FFFFFFF,
                     is_extended_id=bool(can_id & CAN_MSG_EXT),
@@ -345,6 +955,90 @@ class BLFReader(BaseIOHandler):
                 )
 
             pos = next_pos
+    except struct.error:
+        # There was not enough data in the container to unpack a struct
+        return object_pos, False
+
+
+def _message_record(
+    timestamp: float = 0.0,
+    arbitration_id: int = 0,
+    is_extended_id: bool = True,
+    is_remote_frame: bool = False,
+    is_error_frame: bool = False,
+    channel: Optional[int] = None,
+    dlc: Optional[int] = None,
+    data: Optional[bytes] = None,
+    is_fd: bool = False,
+    is_rx: bool = True,
+    bitrate_switch: bool = False,
+    error_state_indicator: bool = False,
+) -> tuple:
+    """Takes the same arguments as :class:`can.Message` and returns them as a
+    tuple, that is smaller to send between processes."""
+    return (
+        timestamp,
+        arbitration_id,
+        is_extended_id,
+        is_remote_frame,
+        is_error_frame,
+        channel,
+        dlc,
+        data,
+        is_fd,
+        is_rx,
+        bitrate_switch,
+        error_state_indicator,
+    )
+
+
+def _parse_records(
+    data: bytes,
+    start_timestamp: float,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    can_filters: Optional[CanFilters] = None,
+) -> Tuple[List[tuple], bool]:
+    """Parses complete objects in a worker process, see
+    :meth:`BLFReader._parse_containers_in_processes`.
+
+    :return: the arguments to create each selected message with and whether
+             an object after `end` was found
+    """
+    past_end = False
+
+    def parse() -> Iterator[tuple]:
+        nonlocal past_end
+        _, past_end = yield from _parse_objects(
+            data,
+            start_timestamp,
+            _message_record,
+            start,
+            end,
+            CompiledFilters(can_filters) if can_filters else None,
+        )
+
+    records = list(parse())
+    return records, past_end
+
+
+def _complete_objects_end(data: bytes) -> int:
+    """Finds the end of the last object that is completely contained in the data."""
+    max_pos = len(data)
+    pos = 0
+    while True:
+        try:
+            next_pos = data.index(b"LOBJ", pos, pos + 8)
+        except ValueError:
+            if pos + 8 > max_pos:
+                return pos
+            raise BLFParseError("Could not find next object") from None
+        if next_pos + OBJ_HEADER_BASE_STRUCT.size > max_pos:
+            return pos
+        obj_size = OBJ_HEADER_BASE_STRUCT.unpack_from(data, next_pos)[3]
+        if next_pos + obj_size > max_pos:
+            return pos
+        pos = next_pos + obj_size
 
 
 class BLFWriter(BaseIOHandler, Listener):
@@ -355,6 +1049,10 @@ class BLFWriter(BaseIOHandler, Listener):
     #: Max log container size of uncompressed data
     max_container_size = 128 * 1024
 
+    #: Max number of full log containers waiting to be compressed and written
+    #: by the background thread before :meth:`on_message_received` blocks
+    max_pending_containers = 4
+
     #: Application identifier for the log writer
     application_id = 5
 
@@ -392,8 +1090,15 @@ class BLFWriter(BaseIOHandler, Listener):
         assert self.file is not None
         self.channel = channel
         self.compression_level = compression_level
-        self._buffer: List[bytes] = []
+        # objects are packed directly into this buffer, which grows as needed
+        self._buffer = bytearray(self.max_container_size + CAN_FD_OBJ_SIZE)
         self._buffer_size = 0
+        # full containers are compressed and written in a background thread
+        self._containers: "queue.Queue[Optional[bytes]]" = queue.Queue(
+            self.max_pending_containers
+        )
+        self._writer_thread: Optional[threading.Thread] = None
+        self._write_error: Optional[Exception] = None
         if append:
             # Parse file header
             data = self.file.read(FILE_HEADER_STRUCT.size)
@@ -414,6 +1119,13 @@ class BLFWriter(BaseIOHandler, Listener):
             # Write a default header which will be updated when stopped
             self._write_header(FILE_HEADER_SIZE)
 
+    @property
+    def pending_size(self) -> int:
+        """An upper bound of the bytes that are not written to the file yet,
+        since they are buffered or wait to be compressed."""
+        pending_containers = self._containers.unfinished_tasks
+        return self._buffer_size + pending_containers * self.max_container_size
+
     def _write_header(self, filesize):
         header = [b"LOGG", FILE_HEADER_SIZE, self.application_id, 0, 0, 0, 2, 6, 8, 1]
         # The meaning of "count of objects read" is unknown
@@ -441,7 +1153,12 @@ class BLFWriter(BaseIOHandler, Listener):
         can_data = bytes(msg.data)
 
         if msg.is_error_frame:
-            data = CAN_ERROR_EXT_STRUCT.pack(
+            pos = self._start_object(
+                CAN_ERROR_EXT, CAN_ERROR_EXT_STRUCT.size, msg.timestamp
+            )
+            CAN_ERROR_EXT_STRUCT.pack_into(
+                self._buffer,
+                pos,
                 channel,
                 0,  # length
                 0,  # flags
@@ -453,14 +1170,18 @@ class BLFWriter(BaseIOHandler, Listener):
                 0,  # ext flags
                 can_data,
             )
-            self._add_object(CAN_ERROR_EXT, data, msg.timestamp)
         elif msg.is_fd:
             fd_flags = EDL
             if msg.bitrate_switch:
                 fd_flags |= BRS
             if msg.error_state_indicator:
                 fd_flags |= ESI
-            data = CAN_FD_MSG_STRUCT.pack(
+            pos = self._start_object(
+                CAN_FD_MESSAGE, CAN_FD_MSG_STRUCT.size, msg.timestamp
+            )
+            CAN_FD_MSG_STRUCT.pack_into(
+                self._buffer,
+                pos,
                 channel,
                 flags,
                 len2dlc(msg.dlc),
@@ -471,10 +1192,12 @@ class BLFWriter(BaseIOHandler, Listener):
                 len(can_data),
                 can_data,
             )
-            self._add_object(CAN_FD_MESSAGE, data, msg.timestamp)
         else:
-            data = CAN_MSG_STRUCT.pack(channel, flags, msg.dlc, arb_id, can_data)
-            self._add_object(CAN_MESSAGE, data, msg.timestamp)
+            pos = self._start_object(CAN_MESSAGE, CAN_MSG_STRUCT.size, msg.timestamp)
+            CAN_MSG_STRUCT.pack_into(
+                self._buffer, pos, channel, flags, msg.dlc, arb_id, can_data
+            )
+        self._finish_object()
 
     def log_event(self, text, timestamp=None):
         """Add an arbitrary message to the log file as a global marker.
@@ -498,6 +1221,20 @@ class BLFWriter(BaseIOHandler, Listener):
         self._add_object(GLOBAL_MARKER, data + text + marker + comment, timestamp)
 
     def _add_object(self, obj_type, data, timestamp=None):
+        pos = self._start_object(obj_type, len(data), timestamp)
+        self._buffer[pos : pos + len(data)] = data
+        self._finish_object()
+
+    def _start_object(
+        self, obj_type: int, data_size: int, timestamp: Optional[float] = None
+    ) -> int:
+        """Packs the headers of an object into the buffer.
+
+        :param obj_type: the type of the object
+        :param data_size: the size of the data following the headers
+        :param timestamp: the timestamp of the object
+        :return: the position in the buffer to pack the data of the object to
+        """
         if timestamp is None:
             timestamp = self.stop_timestamp or time.time()
         if self.start_timestamp is None:
@@ -505,37 +1242,87 @@ class BLFWriter(BaseIOHandler, Listener):
         self.stop_timestamp = timestamp
         timestamp = int((timestamp - self.start_timestamp) * 1e9)
         header_size = OBJ_HEADER_BASE_STRUCT.size + OBJ_HEADER_V1_STRUCT.size
-        obj_size = header_size + len(data)
-        base_header = OBJ_HEADER_BASE_STRUCT.pack(
-            b"LOBJ", header_size, 1, obj_size, obj_type
-        )
-        obj_header = OBJ_HEADER_V1_STRUCT.pack(TIME_ONE_NANS, 0, 0, max(timestamp, 0))
+        obj_size = header_size + data_size
+        padding_size = data_size % 4
 
-        self._buffer.append(base_header)
-        self._buffer.append(obj_header)
-        self._buffer.append(data)
-        padding_size = len(data) % 4
+        pos = self._buffer_size
+        end = pos + obj_size + padding_size
+        if end > len(self._buffer):
+            self._buffer.extend(bytes(end - len(self._buffer)))
+        OBJ_HEADER_BASE_STRUCT.pack_into(
+            self._buffer, pos, b"LOBJ", header_size, 1, obj_size, obj_type
+        )
+        OBJ_HEADER_V1_STRUCT.pack_into(
+            self._buffer,
+            pos + OBJ_HEADER_BASE_STRUCT.size,
+            TIME_ONE_NANS,
+            0,
+            0,
+            max(timestamp, 0),
+        )
         if padding_size:
-            self._buffer.append(b"\x00" * padding_size)
+            # the buffer is reused, so the padding has to be cleared
+            self._buffer[end - padding_size : end] = bytes(padding_size)
 
-        self._buffer_size += obj_size + padding_size
+        self._buffer_size = end
         self.object_count += 1
-        if self._buffer_size >= self.max_container_size:
+        return pos + header_size
+
+    def _finish_object(self) -> None:
+        """Hands over full containers after an object was packed."""
+        while self._buffer_size >= self.max_container_size:
             self._flush()
 
     def _flush(self):
-        """Compresses and writes data in the buffer to file."""
-        if self.file.closed:
-            return
-        buffer = b"".join(self._buffer)
-        if not buffer:
-            # Nothing to write
+        """Hands over data in the buffer to be compressed and written to file.
+
+        At most :attr:`max_container_size` bytes are put into one container,
+        the rest is kept for the next one.
+        """
+        if self.file.closed or not self._buffer_size:
             return
-        uncompressed_data = memoryview(buffer)[: self.max_container_size]
+        size = min(self._buffer_size, self.max_container_size)
+        uncompressed_data = bytes(self._buffer[:size])
         # Save data that comes after max size to next container
-        tail = buffer[self.max_container_size :]
-        self._buffer = [tail]
-        self._buffer_size = len(tail)
+        self._buffer[: self._buffer_size - size] = self._buffer[
+            size : self._buffer_size
+        ]
+        self._buffer_size -= size
+
+        self.uncompressed_size += OBJ_HEADER_BASE_STRUCT.size
+        self.uncompressed_size += LOG_CONTAINER_STRUCT.size
+        self.uncompressed_size += size
+
+        if self._write_error is not None:
+            raise self._write_error
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(
+                target=self._write_containers, name="BLFWriter", daemon=True
+            )
+            self._writer_thread.start()
+        self._containers.put(uncompressed_data)
+
+    def _write_containers(self) -> None:
+        """Compresses and writes the containers handed over by :meth:`_flush`
+        until `None` is received."""
+        while True:
+            uncompressed_data = self._containers.get()
+            if uncompressed_data is None:
+                return
+            if self._write_error is not None:
+                # keep consuming such that the producer does not block
+                self._containers.task_done()
+                continue
+            try:
+                self._write_container(uncompressed_data)
+            except Exception as exc:  # pylint: disable=broad-except
+                LOG.exception("Could not write BLF container")
+                self._write_error = exc
+            self._containers.task_done()
+
+    def _write_container(self, uncompressed_data: bytes) -> None:
+        """Compresses and writes a log container to file."""
+        assert self.file is not None
         if not self.compression_level:
             data = uncompressed_data
             method = NO_COMPRESSION
@@ -552,13 +1339,20 @@ class BLFWriter(BaseIOHandler, Listener):
         self.file.write(data)
         # Write padding bytes
         self.file.write(b"\x00" * (obj_size % 4))
-        self.uncompressed_size += OBJ_HEADER_BASE_STRUCT.size
-        self.uncompressed_size += LOG_CONTAINER_STRUCT.size
-        self.uncompressed_size += len(uncompressed_data)
 
     def stop(self):
-        """Stops logging and closes the file."""
+        """Stops logging and closes the file.
+
+        Waits until all containers are written before the header is updated.
+        """
         self._flush()
+        if self._writer_thread is not None:
+            self._containers.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+        if self._write_error is not None:
+            super().stop()
+            raise self._write_error
         if self.file.seekable():
             filesize = self.file.tell()
             # Write header in the beginning of the file
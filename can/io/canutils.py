@@ -4,11 +4,18 @@ It is is compatible with "candump -L" from the canutils program
 (https://github.com/linux-can/can-utils).
 """
 
+import binascii
+import io
 import logging
+import math
+import mmap
+import time
 
+from can.filters import CompiledFilters
 from can.message import Message
 from can.listener import Listener
 from .generic import BaseIOHandler
+from .timeindex import seek_offset
 
 
 log = logging.getLogger("can.io.canutils")
@@ -32,43 +39,128 @@ class CanutilsLogReader(BaseIOHandler):
         ``(0.0) vcan0 001#8d00100100820100``
     """
 
-    def __init__(self, file):
+    def __init__(
+        self,
+        file,
+        use_mmap=False,
+        start=None,
+        end=None,
+        can_filters=None,
+        index_file=None,
+    ):
         """
         :param file: a path-like object or as file-like object to read from
                      If this is a file-like object, is has to opened in text
                      read mode, not binary read mode.
+        :param bool use_mmap: if set to `True`, the file is read through a
+                              memory map if possible. This avoids copying
+                              very large files through the buffers of the
+                              file object.
+        :param float start: if given, skip messages with an earlier timestamp
+        :param float end: if given, stop reading at the first message with a
+                          later timestamp, since the file is assumed to be
+                          sorted by time
+        :param can_filters: if given, only read the messages matching at least
+                            one of the filters, see
+                            :meth:`can.BusABC.set_filters` for the format
+        :param index_file: a path-like object of a sidecar file with a
+                           :class:`~can.io.timeindex.TimeIndex`, which is used
+                           to seek to `start`. If it does not exist or does not
+                           match the file, the index is built and written to it.
+
+        Lines are rejected by their timestamp and ID before parsing the data.
         """
         super().__init__(file, mode="r")
+        self.start = start
+        self.end = end
+        self._filters = CompiledFilters(can_filters) if can_filters else None
+        self._index_file = index_file
+
+        self._mmap = None
+        # only map plain files, and not the compressed file below a
+        # decompressing file object
+        if use_mmap and isinstance(
+            getattr(self.file, "buffer", None), io.BufferedReader
+        ):
+            try:
+                self._mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (AttributeError, OSError, ValueError):
+                # e.g. an in-memory or empty file
+                log.debug("Could not map the file into memory, reading it instead")
 
     def __iter__(self):
-        for line in self.file:
-
+        if self.start is not None and self._index_file is not None:
+            offset = seek_offset(self.file, self._index_file, ".log", self.start)
+            if offset is not None:
+                if self._mmap is not None:
+                    self._mmap.seek(offset)
+                else:
+                    self.file.seek(offset)
+
+        # Optimized inner loop by making local copies of global variables
+        # and hence reducing the number of lookups. The lines of a memory
+        # mapped file are parsed as bytes without decoding them.
+        if self._mmap is not None:
+            lines = iter(self._mmap.readline, b"")
+            fd_mark, remote_marks = b"#", (b"r", b"R")
+            from_hex = binascii.unhexlify
+        else:
+            lines = self.file
+            fd_mark, remote_marks = "#", ("r", "R")
+            from_hex = bytearray.fromhex
+        # the converted channel of each channel string seen so far
+        channels = {}
+        min_timestamp = -math.inf if self.start is None else self.start
+        max_timestamp = math.inf if self.end is None else self.end
+        matches = None if self._filters is None else self._filters.matches
+
+        for line in lines:
+            parts = line.split()
             # skip empty lines
-            temp = line.strip()
-            if not temp:
+            if not parts:
                 continue
 
-            timestamp, channel, frame = temp.split()
+            timestamp, channel, frame = parts
             timestamp = float(timestamp[1:-1])
-            canId, data = frame.split("#", maxsplit=1)
-            if channel.isdigit():
-                channel = int(channel)
+            if timestamp < min_timestamp:
+                continue
+            if timestamp > max_timestamp:
+                break
+            canId, _, data = frame.partition(fd_mark)
+            try:
+                channel = channels[channel]
+            except KeyError:
+                if channel.isdigit():
+                    channels[channel] = int(channel)
+                elif isinstance(channel, bytes):
+                    channels[channel] = channel.decode()
+                else:
+                    channels[channel] = channel
+                channel = channels[channel]
 
             isExtended = len(canId) > 3
             canId = int(canId, 16)
+            if matches is not None:
+                if canId & CAN_ERR_FLAG and canId & CAN_ERR_BUSERROR:
+                    # the ID of the error frame created below
+                    selected = matches(0, True)
+                else:
+                    selected = matches(canId & 0x1FFFFFFF, isExtended)
+                if not selected:
+                    continue
 
             is_fd = False
             brs = False
             esi = False
 
-            if data and data[0] == "#":
+            if data[:1] == fd_mark:
                 is_fd = True
-                fd_flags = int(data[1])
+                fd_flags = int(data[1:2])
                 brs = bool(fd_flags & CANFD_BRS)
                 esi = bool(fd_flags & CANFD_ESI)
                 data = data[2:]
 
-            if data and data[0].lower() == "r":
+            if data[:1] in remote_marks:
                 isRemoteFrame = True
 
                 if len(data) > 1:
@@ -81,29 +173,35 @@ class CanutilsLogReader(BaseIOHandler):
                 isRemoteFrame = False
 
                 dlc = len(data) // 2
-                dataBin = bytearray()
-                for i in range(0, len(data), 2):
-                    dataBin.append(int(data[i : (i + 2)], 16))
+                dataBin = from_hex(data)
 
             if canId & CAN_ERR_FLAG and canId & CAN_ERR_BUSERROR:
                 msg = Message(timestamp=timestamp, is_error_frame=True)
             else:
                 msg = Message(
-                    timestamp=timestamp,
-                    arbitration_id=canId & 0x1FFFFFFF,
-                    is_extended_id=isExtended,
-                    is_remote_frame=isRemoteFrame,
-                    is_fd=is_fd,
-                    bitrate_switch=brs,
-                    error_state_indicator=esi,
-                    dlc=dlc,
-                    data=dataBin,
-                    channel=channel,
+                    timestamp,
+                    canId & 0x1FFFFFFF,
+                    isExtended,
+                    isRemoteFrame,
+                    False,
+                    channel,
+                    dlc,
+                    dataBin,
+                    is_fd,
+                    True,
+                    brs,
+                    esi,
                 )
             yield msg
 
         self.stop()
 
+    def stop(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        super().stop()
+
 
 class CanutilsLogWriter(BaseIOHandler, Listener):
     """Logs CAN data to an ASCII log file (.log).
@@ -112,9 +210,19 @@ class CanutilsLogWriter(BaseIOHandler, Listener):
     If a message has a timestamp smaller than the previous one (or 0 or None),
     it gets assigned the timestamp that was written for the last message.
     It the first message does not have a timestamp, it is set to zero.
+
+    The lines are collected in memory and written to the file in large chunks:
+    once :attr:`MAX_BUFFER_SIZE_BEFORE_WRITES` lines were collected, with the
+    first line that arrives at least `flush_interval` seconds after the last
+    write and when :meth:`flush` or :meth:`stop` is called. There is no timer,
+    so if no more messages arrive, the collected lines stay in memory until
+    one of these methods is called.
     """
 
-    def __init__(self, file, channel="vcan0", append=False):
+    #: Max number of lines collected before they are written to the file
+    MAX_BUFFER_SIZE_BEFORE_WRITES = 1000
+
+    def __init__(self, file, channel="vcan0", append=False, flush_interval=1.0):
         """
         :param file: a path-like object or as file-like object to write to
                      If this is a file-like object, is has to opened in text
@@ -123,14 +231,24 @@ class CanutilsLogWriter(BaseIOHandler, Listener):
                         have a channel set
         :param bool append: if set to `True` messages are appended to
                             the file, else the file is truncated
+        :param float flush_interval: the time in seconds after the last write
+                                     after which the next line is written
+                                     right away, together with all collected
+                                     ones. If this is zero, every line is
+                                     written immediately.
         """
         mode = "a" if append else "w"
         super().__init__(file, mode=mode)
 
         self.channel = channel
+        self.flush_interval = flush_interval
         self.last_timestamp = None
+        self._lines = []
+        self._last_write = time.monotonic()
+        # the string to write for each channel seen so far
+        self._channels = {}
 
-    def on_message_received(self, msg):
+    def _format_line(self, msg):
         # this is the case for the very first message:
         if self.last_timestamp is None:
             self.last_timestamp = msg.timestamp or 0.0
@@ -141,27 +259,63 @@ class CanutilsLogWriter(BaseIOHandler, Listener):
         else:
             timestamp = msg.timestamp
 
-        channel = msg.channel if msg.channel is not None else self.channel
-
-        framestr = "(%f) %s" % (timestamp, channel)
+        try:
+            channel = self._channels[msg.channel]
+        except KeyError:
+            channel = msg.channel if msg.channel is not None else self.channel
+            channel = self._channels[msg.channel] = str(channel)
 
         if msg.is_error_frame:
-            framestr += " %08X#" % (CAN_ERR_FLAG | CAN_ERR_BUSERROR)
+            can_id = "%08X" % (CAN_ERR_FLAG | CAN_ERR_BUSERROR)
         elif msg.is_extended_id:
-            framestr += " %08X#" % (msg.arbitration_id)
+            can_id = "%08X" % (msg.arbitration_id)
         else:
-            framestr += " %03X#" % (msg.arbitration_id)
+            can_id = "%03X" % (msg.arbitration_id)
 
         if msg.is_remote_frame:
-            framestr += "R\n"
+            data = "R"
+        elif msg.is_fd:
+            fd_flags = 0
+            if msg.bitrate_switch:
+                fd_flags |= CANFD_BRS
+            if msg.error_state_indicator:
+                fd_flags |= CANFD_ESI
+            data = "#%X%s" % (fd_flags, msg.data.hex().upper())
         else:
-            if msg.is_fd:
-                fd_flags = 0
-                if msg.bitrate_switch:
-                    fd_flags |= CANFD_BRS
-                if msg.error_state_indicator:
-                    fd_flags |= CANFD_ESI
-                framestr += "#%X" % fd_flags
-            framestr += "%s\n" % (msg.data.hex().upper())
-
-        self.file.write(framestr)
+            data = msg.data.hex().upper()
+
+        return "(%f) %s %s#%s\n" % (timestamp, channel, can_id, data)
+
+    def on_message_received(self, msg):
+        lines = self._lines
+        lines.append(self._format_line(msg))
+        if (
+            len(lines) >= self.MAX_BUFFER_SIZE_BEFORE_WRITES
+            or time.monotonic() - self._last_write >= self.flush_interval
+        ):
+            self._write_lines()
+
+    def on_messages_received(self, msgs):
+        format_line = self._format_line
+        self._lines.extend([format_line(msg) for msg in msgs])
+        if (
+            len(self._lines) >= self.MAX_BUFFER_SIZE_BEFORE_WRITES
+            or time.monotonic() - self._last_write >= self.flush_interval
+        ):
+            self._write_lines()
+
+    def flush(self):
+        """Writes the collected lines to the file and flushes it."""
+        self._write_lines()
+        self.file.flush()
+
+    def _write_lines(self):
+        """Writes the collected lines to the file."""
+        self.file.write("".join(self._lines))
+        self._lines.clear()
+        self._last_write = time.monotonic()
+
+    def stop(self):
+        if self.file is not None and not self.file.closed:
+            self._write_lines()
+        super().stop()
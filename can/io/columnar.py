@@ -0,0 +1,596 @@
+"""
+Implements a compact columnar log format for CAN messages, which uses the
+suffix ``.canc``.
+
+Unlike the other formats, which store one record after another, the messages
+are grouped into chunks and each chunk stores all values of one attribute
+next to each other. These columns can be loaded with a few calls into
+:mod:`array`, such that scanning a file from Python is cheap and does not
+require creating a :class:`~can.Message` for every frame.
+
+The file starts with a header, followed by the chunks. Each chunk consists of
+a header and the (optionally zlib compressed) columns:
+
+- a length prefixed JSON list of the channels used in the chunk,
+- the timestamps as doubles,
+- the arbitration IDs as 32-bit integers,
+- the flags of each message as a byte (see the ``FLAG_*`` constants),
+- the DLCs as bytes,
+- the indices into the list of channels as 16-bit integers,
+- the lengths of the data as bytes and
+- all data concatenated.
+
+The file ends with an index of the positions of all chunks and a trailer
+pointing to it. If a file was not closed properly and lacks the index, it is
+rebuilt from the chunk headers. All values are stored in little endian byte
+order.
+"""
+
+import json
+import logging
+import math
+import struct
+import sys
+import zlib
+from array import array
+from itertools import accumulate
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from ..filters import CompiledFilters
+from ..message import Message
+from ..listener import Listener
+from ..typechecking import AcceptedIOType, CanFilters, Channel
+from .generic import BaseIOHandler
+
+
+class ColumnarParseError(Exception):
+    """Columnar log file could not be parsed correctly."""
+
+
+LOG = logging.getLogger(__name__)
+
+# signature ("CANC"), version, reserved
+FILE_HEADER_STRUCT = struct.Struct("<4sHH")
+
+# signature ("CHNK"), number of messages, size of the stored columns,
+# compression method, reserved, smallest timestamp, largest timestamp,
+# smallest arbitration ID, largest arbitration ID
+CHUNK_HEADER_STRUCT = struct.Struct("<4sLLB3xddLL")
+
+# position of the chunk header in the file, repeated for all chunks after the
+# signature of the index ("INDX")
+INDEX_ENTRY_STRUCT = struct.Struct("<Q")
+
+# position of the index, number of chunks, signature ("CANC")
+TRAILER_STRUCT = struct.Struct("<QL4s")
+
+# the number of bytes of the length of the channel list
+CHANNELS_LENGTH_STRUCT = struct.Struct("<L")
+
+FILE_SIGNATURE = b"CANC"
+CHUNK_SIGNATURE = b"CHNK"
+INDEX_SIGNATURE = b"INDX"
+FORMAT_VERSION = 1
+
+NO_COMPRESSION = 0
+ZLIB_DEFLATE = 1
+
+FLAG_EXTENDED_ID = 0x01
+FLAG_REMOTE_FRAME = 0x02
+FLAG_ERROR_FRAME = 0x04
+FLAG_FD = 0x08
+FLAG_BITRATE_SWITCH = 0x10
+FLAG_ERROR_STATE_INDICATOR = 0x20
+FLAG_RX = 0x40
+
+# the type codes of the arrays holding 32 and 16 bit unsigned integers
+_UINT32 = "I" if array("I").itemsize == 4 else "L"
+_UINT16 = "H"
+
+# the columns are stored little endian, so they need to be swapped on others
+_SWAP_BYTES = sys.byteorder == "big"
+
+
+class ChunkIndexEntry(NamedTuple):
+    """Describes a single chunk of a columnar log file, see
+    :attr:`ColumnarReader.index`."""
+
+    #: the position of the chunk header in the file
+    offset: int
+    #: the number of messages in the chunk
+    message_count: int
+    #: the number of bytes of the stored columns, following the header
+    size: int
+    #: the compression method of the columns
+    compression: int
+    #: the smallest timestamp of all messages in the chunk
+    start_timestamp: float
+    #: the largest timestamp of all messages in the chunk
+    stop_timestamp: float
+    #: the smallest arbitration ID of all messages in the chunk
+    min_arbitration_id: int
+    #: the largest arbitration ID of all messages in the chunk
+    max_arbitration_id: int
+
+
+class ColumnarChunk(NamedTuple):
+    """The columns of all messages in a chunk, see
+    :meth:`ColumnarReader.iter_chunks`.
+
+    The arrays support the buffer protocol, so they can for example be
+    wrapped with ``numpy.frombuffer()`` without copying.
+    """
+
+    #: the timestamps of the messages
+    timestamps: array
+    #: the arbitration IDs of the messages
+    arbitration_ids: array
+    #: the flags of the messages, see the ``FLAG_*`` constants
+    flags: bytes
+    #: the DLCs of the messages
+    dlcs: bytes
+    #: the position of the channel of each message in :attr:`channels`
+    channel_indices: array
+    #: the distinct channels of the messages in this chunk
+    channels: List[Optional[Channel]]
+    #: the number of data bytes of each message
+    data_lengths: bytes
+    #: the data of all messages concatenated
+    payload: bytes
+
+    def data_offsets(self) -> List[int]:
+        """Returns the position of the data of each message in :attr:`payload`."""
+        return [0, *accumulate(self.data_lengths)][:-1]
+
+    def messages(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        filters: Optional[CompiledFilters] = None,
+    ) -> Iterator[Message]:
+        """Creates the messages from the columns.
+
+        :param start: if given, skip messages with an earlier timestamp
+        :param end: if given, skip messages with a later timestamp
+        :param filters: if given, skip messages not matching these filters
+        """
+        channels = self.channels
+        payload = self.payload
+        min_timestamp = -math.inf if start is None else start
+        max_timestamp = math.inf if end is None else end
+        matches = None if filters is None else filters.matches
+        offset = 0
+        for timestamp, arbitration_id, flags, dlc, channel, length in zip(
+            self.timestamps,
+            self.arbitration_ids,
+            self.flags,
+            self.dlcs,
+            self.channel_indices,
+            self.data_lengths,
+        ):
+            if not min_timestamp <= timestamp <= max_timestamp or (
+                matches is not None
+                and not matches(arbitration_id, bool(flags & FLAG_EXTENDED_ID))
+            ):
+                offset += length
+                continue
+            yield Message(
+                timestamp,
+                arbitration_id,
+                bool(flags & FLAG_EXTENDED_ID),
+                bool(flags & FLAG_REMOTE_FRAME),
+                bool(flags & FLAG_ERROR_FRAME),
+                channels[channel],
+                dlc,
+                bytearray(payload[offset : offset + length]),
+                bool(flags & FLAG_FD),
+                bool(flags & FLAG_RX),
+                bool(flags & FLAG_BITRATE_SWITCH),
+                bool(flags & FLAG_ERROR_STATE_INDICATOR),
+            )
+            offset += length
+
+
+def _load_array(typecode: str, data: bytes, offset: int, count: int) -> array:
+    values = array(typecode)
+    values.frombytes(data[offset : offset + count * values.itemsize])
+    if _SWAP_BYTES:
+        values.byteswap()
+    return values
+
+
+def _dump_array(values: array) -> bytes:
+    if _SWAP_BYTES:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class ColumnarReader(BaseIOHandler):
+    """
+    Iterator of CAN messages from a columnar log file.
+
+    Besides iterating over the messages, the file can be read chunk by chunk
+    with :meth:`iter_chunks`, which skips chunks outside of a time range
+    using the :attr:`index` and does not create any messages::
+
+        with ColumnarReader("overnight.canc") as reader:
+            count = sum(chunk.arbitration_ids.count(0x123)
+                        for chunk in reader.iter_chunks(start, start + 5.0))
+    """
+
+    def __init__(
+        self,
+        file: AcceptedIOType,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        can_filters: Optional[CanFilters] = None,
+    ) -> None:
+        """
+        :param file: a path-like object or as file-like object to read from
+                     If this is a file-like object, is has to opened in binary
+                     read mode, not text read mode.
+        :param start: if given, skip messages with an earlier timestamp
+        :param end: if given, skip messages with a later timestamp
+        :param can_filters: if given, only read the messages matching at least
+                            one of the filters, see
+                            :meth:`can.BusABC.set_filters` for the format
+
+        Only the chunks overlapping the time range and holding arbitration IDs
+        that may match the filters are read. Messages are only created for the
+        selected rows of their columns.
+
+        :raises ColumnarParseError: if the file is not a columnar log file
+        """
+        super().__init__(file, mode="rb")
+        self.start = start
+        self.end = end
+        self._filters = CompiledFilters(can_filters) if can_filters else None
+        assert self.file is not None
+        data = self.file.read(FILE_HEADER_STRUCT.size)
+        self._empty = not data
+        if not self._empty:
+            if len(data) < FILE_HEADER_STRUCT.size:
+                raise ColumnarParseError("Unexpected end of file")
+            signature, version, _ = FILE_HEADER_STRUCT.unpack(data)
+            if signature != FILE_SIGNATURE:
+                raise ColumnarParseError("Unexpected file format")
+            if version > FORMAT_VERSION:
+                raise ColumnarParseError(f"Unsupported format version {version}")
+        self._index: Optional[List[ChunkIndexEntry]] = None
+
+    def __iter__(self) -> Iterator[Message]:
+        for chunk in self._iter_chunks(self.start, self.end, self._filters):
+            yield from chunk.messages(self.start, self.end, self._filters)
+        self.stop()
+
+    @property
+    def index(self) -> List[ChunkIndexEntry]:
+        """All chunks of the file in the order they are stored.
+
+        It is read from the end of the file or, if the file was not closed
+        properly, built by scanning the chunk headers.
+        """
+        if self._index is None:
+            self._index = self._load_index()
+            if self._index is None:
+                self._index = [entry for entry, _ in self._scan_chunks()]
+        return self._index
+
+    def _load_index(self) -> Optional[List[ChunkIndexEntry]]:
+        assert self.file is not None
+        if self._empty:
+            return []
+        if not self.file.seekable():
+            return None
+        file_size = self.file.seek(0, 2)
+        if file_size < FILE_HEADER_STRUCT.size + TRAILER_STRUCT.size:
+            return None
+        self.file.seek(file_size - TRAILER_STRUCT.size)
+        index_offset, count, signature = TRAILER_STRUCT.unpack(
+            self.file.read(TRAILER_STRUCT.size)
+        )
+        if signature != FILE_SIGNATURE:
+            return None
+
+        self.file.seek(index_offset)
+        if self.file.read(len(INDEX_SIGNATURE)) != INDEX_SIGNATURE:
+            return None
+        offsets = self.file.read(count * INDEX_ENTRY_STRUCT.size)
+        index = []
+        for (offset,) in INDEX_ENTRY_STRUCT.iter_unpack(offsets):
+            self.file.seek(offset)
+            entry = self._read_chunk_header(offset)
+            if entry is None:
+                raise ColumnarParseError(f"No chunk at position {offset}")
+            index.append(entry)
+        return index
+
+    def _read_chunk_header(self, offset: int) -> Optional[ChunkIndexEntry]:
+        """Reads the header of a chunk at the current position of the file.
+
+        :return: the entry of the chunk or `None` if there is no chunk
+        """
+        assert self.file is not None
+        data = self.file.read(CHUNK_HEADER_STRUCT.size)
+        if data[: len(CHUNK_SIGNATURE)] != CHUNK_SIGNATURE:
+            # either the end of the file or the index
+            return None
+        if len(data) < CHUNK_HEADER_STRUCT.size:
+            LOG.warning("Ignoring truncated chunk at position %d", offset)
+            return None
+        return ChunkIndexEntry(offset, *CHUNK_HEADER_STRUCT.unpack(data)[1:])
+
+    def _scan_chunks(self) -> Iterator[Tuple[ChunkIndexEntry, bytes]]:
+        """Reads all chunks in the order they are stored, starting after the
+        file header, without relying on the index."""
+        assert self.file is not None
+        if self._empty:
+            return
+        offset = FILE_HEADER_STRUCT.size
+        if self.file.seekable():
+            self.file.seek(offset)
+        while True:
+            entry = self._read_chunk_header(offset)
+            if entry is None:
+                break
+            data = self.file.read(entry.size)
+            if len(data) < entry.size:
+                LOG.warning("Ignoring truncated chunk at position %d", offset)
+                break
+            yield entry, data
+            offset += CHUNK_HEADER_STRUCT.size + entry.size
+
+    def iter_chunks(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        can_filters: Optional[CanFilters] = None,
+    ) -> Iterator[ColumnarChunk]:
+        """Reads the columns chunk by chunk, without creating any messages.
+
+        If a time range or filters are given, only the chunks that may contain
+        matching messages are read, but these may still contain other ones.
+
+        :param start: the smallest absolute timestamp of interest,
+                      or `None` to start at the beginning
+        :param end: the largest absolute timestamp of interest,
+                    or `None` to continue until the end
+        :param can_filters: if given, skip chunks without any arbitration ID
+                            that may match one of the filters, see
+                            :meth:`can.BusABC.set_filters` for the format
+        """
+        filters = CompiledFilters(can_filters) if can_filters else None
+        return self._iter_chunks(start, end, filters)
+
+    def _iter_chunks(
+        self,
+        start: Optional[float],
+        end: Optional[float],
+        filters: Optional[CompiledFilters],
+    ) -> Iterator[ColumnarChunk]:
+        assert self.file is not None
+        if (start is None and end is None) or not self.file.seekable():
+            for entry, data in self._scan_chunks():
+                if self._selects(entry, start, end, filters):
+                    yield self._parse_chunk(entry, data)
+            return
+
+        for entry in self.index:
+            if self._selects(entry, start, end, filters):
+                self.file.seek(entry.offset + CHUNK_HEADER_STRUCT.size)
+                yield self._parse_chunk(entry, self.file.read(entry.size))
+
+    @staticmethod
+    def _selects(
+        entry: ChunkIndexEntry,
+        start: Optional[float],
+        end: Optional[float],
+        filters: Optional[CompiledFilters],
+    ) -> bool:
+        """Whether the chunk may hold messages in the range matching the filters."""
+        return (
+            (start is None or entry.stop_timestamp >= start)
+            and (end is None or entry.start_timestamp <= end)
+            and (
+                filters is None
+                or filters.may_match_range(
+                    entry.min_arbitration_id, entry.max_arbitration_id
+                )
+            )
+        )
+
+    @staticmethod
+    def _parse_chunk(entry: ChunkIndexEntry, data: bytes) -> ColumnarChunk:
+        if entry.compression == ZLIB_DEFLATE:
+            data = zlib.decompress(data)
+        elif entry.compression != NO_COMPRESSION:
+            raise ColumnarParseError(
+                f"Unknown compression method {entry.compression} of the chunk "
+                f"at position {entry.offset}"
+            )
+
+        count = entry.message_count
+        (channels_length,) = CHANNELS_LENGTH_STRUCT.unpack_from(data)
+        pos = CHANNELS_LENGTH_STRUCT.size
+        channels = json.loads(data[pos : pos + channels_length].decode())
+        pos += channels_length
+
+        timestamps = _load_array("d", data, pos, count)
+        pos += count * timestamps.itemsize
+        arbitration_ids = _load_array(_UINT32, data, pos, count)
+        pos += count * arbitration_ids.itemsize
+        flags = data[pos : pos + count]
+        pos += count
+        dlcs = data[pos : pos + count]
+        pos += count
+        channel_indices = _load_array(_UINT16, data, pos, count)
+        pos += count * channel_indices.itemsize
+        data_lengths = data[pos : pos + count]
+        pos += count
+
+        return ColumnarChunk(
+            timestamps,
+            arbitration_ids,
+            flags,
+            dlcs,
+            channel_indices,
+            channels,
+            data_lengths,
+            data[pos:],
+        )
+
+
+class ColumnarWriter(BaseIOHandler, Listener):
+    """
+    Logs CAN data to a columnar log file, see :mod:`can.io.columnar`.
+
+    The messages are buffered in memory until a chunk is complete, so the
+    file is only written every :attr:`chunk_size` messages.
+
+    Channels should be strings, integers or `None`. Other channels are
+    stored as strings.
+    """
+
+    def __init__(
+        self,
+        file: AcceptedIOType,
+        chunk_size: int = 10000,
+        compression_level: int = -1,
+    ) -> None:
+        """
+        :param file: a path-like object or as file-like object to write to
+                     If this is a file-like object, is has to opened in binary
+                     write mode, not text write mode.
+        :param chunk_size: the number of messages per chunk
+        :param compression_level: An integer from 0 to 9 or -1 controlling the
+                                  level of compression. 1 (Z_BEST_SPEED) is
+                                  fastest and produces the least compression.
+                                  9 (Z_BEST_COMPRESSION) is slowest and produces
+                                  the most. 0 means that the chunks are not
+                                  compressed. The default value is -1
+                                  (Z_DEFAULT_COMPRESSION).
+        """
+        super().__init__(file, mode="wb")
+        assert self.file is not None
+        self.chunk_size = chunk_size
+        self.compression_level = compression_level
+        self.file.write(FILE_HEADER_STRUCT.pack(FILE_SIGNATURE, FORMAT_VERSION, 0))
+        self._offset = FILE_HEADER_STRUCT.size
+        self._chunk_offsets: List[int] = []
+        self._new_chunk()
+
+    def _new_chunk(self) -> None:
+        self._timestamps = array("d")
+        self._arbitration_ids = array(_UINT32)
+        self._flags = bytearray()
+        self._dlcs = bytearray()
+        self._channel_indices = array(_UINT16)
+        self._channels: Dict[Any, int] = {}
+        self._data_lengths = bytearray()
+        self._payload = bytearray()
+
+    @property
+    def pending_size(self) -> int:
+        """The number of uncompressed bytes of the chunk held in memory."""
+        return (
+            len(self._timestamps) * self._timestamps.itemsize
+            + len(self._arbitration_ids) * self._arbitration_ids.itemsize
+            + len(self._channel_indices) * self._channel_indices.itemsize
+            + len(self._flags)
+            + len(self._dlcs)
+            + len(self._data_lengths)
+            + len(self._payload)
+        )
+
+    def on_message_received(self, msg: Message) -> None:
+        channel = msg.channel
+        try:
+            channel_index = self._channels[channel]
+        except KeyError:
+            channel_index = self._channels[channel] = len(self._channels)
+        except TypeError:
+            # not hashable
+            channel = str(channel)
+            channel_index = self._channels.setdefault(channel, len(self._channels))
+
+        self._timestamps.append(msg.timestamp)
+        self._arbitration_ids.append(msg.arbitration_id)
+        self._flags.append(
+            (FLAG_EXTENDED_ID if msg.is_extended_id else 0)
+            | (FLAG_REMOTE_FRAME if msg.is_remote_frame else 0)
+            | (FLAG_ERROR_FRAME if msg.is_error_frame else 0)
+            | (FLAG_FD if msg.is_fd else 0)
+            | (FLAG_BITRATE_SWITCH if msg.bitrate_switch else 0)
+            | (FLAG_ERROR_STATE_INDICATOR if msg.error_state_indicator else 0)
+            | (FLAG_RX if msg.is_rx else 0)
+        )
+        self._dlcs.append(msg.dlc)
+        self._channel_indices.append(channel_index)
+        self._data_lengths.append(len(msg.data))
+        self._payload += msg.data
+
+        if len(self._timestamps) >= self.chunk_size:
+            self._write_chunk()
+
+    def _write_chunk(self) -> None:
+        count = len(self._timestamps)
+        if not count:
+            return
+
+        channels = [
+            channel
+            if channel is None or isinstance(channel, (int, str))
+            else str(channel)
+            for channel in self._channels
+        ]
+        channels_json = json.dumps(channels).encode()
+        columns = b"".join(
+            [
+                CHANNELS_LENGTH_STRUCT.pack(len(channels_json)),
+                channels_json,
+                _dump_array(self._timestamps),
+                _dump_array(self._arbitration_ids),
+                self._flags,
+                self._dlcs,
+                _dump_array(self._channel_indices),
+                self._data_lengths,
+                self._payload,
+            ]
+        )
+        if self.compression_level:
+            compression = ZLIB_DEFLATE
+            columns = zlib.compress(columns, self.compression_level)
+        else:
+            compression = NO_COMPRESSION
+
+        header = CHUNK_HEADER_STRUCT.pack(
+            CHUNK_SIGNATURE,
+            count,
+            len(columns),
+            compression,
+            min(self._timestamps),
+            max(self._timestamps),
+            min(self._arbitration_ids),
+            max(self._arbitration_ids),
+        )
+        assert self.file is not None
+        self.file.write(header)
+        self.file.write(columns)
+        self._chunk_offsets.append(self._offset)
+        self._offset += len(header) + len(columns)
+        self._new_chunk()
+
+    def stop(self) -> None:
+        """Writes the remaining messages and the index and closes the file."""
+        assert self.file is not None
+        if self.file.closed:
+            return
+        self._write_chunk()
+        self.file.write(INDEX_SIGNATURE)
+        for offset in self._chunk_offsets:
+            self.file.write(INDEX_ENTRY_STRUCT.pack(offset))
+        self.file.write(
+            TRAILER_STRUCT.pack(self._offset, len(self._chunk_offsets), FILE_SIGNATURE)
+        )
+        super().stop()
@@ -0,0 +1,173 @@
+"""
+Transparent compression of text log files, like ``.asc.gz`` or ``.log.xz``.
+
+The compression suffix is stripped to find the log format, and the file is
+read or written through the corresponding codec of the standard library.
+When writing, the compression runs on a background thread.
+"""
+
+import bz2
+import functools
+import gzip
+import io
+import lzma
+import pathlib
+import queue
+import threading
+import zlib
+from typing import Any, BinaryIO, Callable, Dict, Optional, TextIO, Tuple, cast
+
+from ..typechecking import StringPathLike
+
+#: the suffixes of the supported compression methods and the functions that
+#: open a compressed file, like :func:`gzip.open`
+COMPRESSION_SUFFIXES: Dict[str, Callable[..., Any]] = {
+    # the default level of zlib is much faster than level 9 of gzip.open(),
+    # but the files are only slightly larger
+    ".gz": functools.partial(gzip.open, compresslevel=6),
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+
+#: the suffixes of the log formats which can be compressed
+COMPRESSIBLE_FORMATS = (".asc", ".csv", ".log")
+
+
+def split_suffix(filename: StringPathLike) -> Tuple[str, Optional[str]]:
+    """Determines the log format and the compression method of a file.
+
+    :param filename: the path of the log file
+    :return: the lowercase suffix of the log format and the suffix of the
+             compression method, which is `None` if it is not compressed
+    """
+    path = pathlib.PurePath(filename)
+    suffix = path.suffix.lower()
+    if suffix in COMPRESSION_SUFFIXES:
+        return pathlib.PurePath(path.stem).suffix.lower(), suffix
+    return suffix, None
+
+
+def open_compressed(filename: StringPathLike, mode: str = "rt") -> TextIO:
+    """Opens a compressed text log file.
+
+    :param filename: the path of the log file, whose last suffix selects the
+                     compression method
+    :param mode: one of ``"rt"``, ``"wt"`` and ``"at"``. When writing, the data
+                 is compressed on a background thread, see
+                 :class:`BackgroundCompressedFile`.
+    :return: a file-like object to read or write text
+    :raises ValueError: if the suffix is not a known compression method
+    """
+    _, compression = split_suffix(filename)
+    if compression is None:
+        raise ValueError(f'Unknown compression method of "{filename}"')
+    if mode == "rt":
+        return cast(TextIO, COMPRESSION_SUFFIXES[compression](filename, mode))
+    return io.TextIOWrapper(BackgroundCompressedFile(filename, mode.replace("t", "b")))
+
+
+class BackgroundCompressedFile(io.BufferedIOBase):
+    """A binary file, which is compressed on a background thread.
+
+    Writing only hands the data over to the thread, which compresses it and
+    writes it to disk. Thus, flushing the file does not guarantee that the data
+    is on disk, but closing it does.
+    """
+
+    #: how many writes may wait for the thread before writing blocks
+    max_pending_writes = 64
+
+    #: the compression ratio assumed by :attr:`compressed_size` until the
+    #: thread has compressed the first data, i.e. no compression at all
+    assumed_ratio = 1.0
+
+    def __init__(self, filename: StringPathLike, mode: str = "wb") -> None:
+        """
+        :param filename: the path of the file, whose last suffix selects the
+                         compression method
+        :param mode: either ``"wb"`` to truncate the file or ``"ab"`` to append
+                     a new compressed stream to it
+        """
+        super().__init__()
+        _, compression = split_suffix(filename)
+        if compression is None:
+            raise ValueError(f'Unknown compression method of "{filename}"')
+        self.name = filename
+        self._raw = cast(BinaryIO, open(filename, mode))
+        self._compressed: BinaryIO = COMPRESSION_SUFFIXES[compression](self._raw, "wb")
+        self._initial_size = self._raw.tell()
+        # the number of bytes passed to write()
+        self._written = 0
+        # the number of bytes the thread compressed and their size when each
+        # write is compressed on its own, which is updated as a whole
+        self._sample = (0, 0)
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue(
+            self.max_pending_writes
+        )
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(
+            target=self._compress, name=f"Compressing {filename}", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def compressed_size(self) -> int:
+        """An estimate of the size of the file once everything written so far
+        is compressed.
+
+        The compressor holds back data until it fills a block, which is up
+        to several hundred kilobytes for bzip2 and xz, and data may still wait
+        for the thread. Thus, the size is estimated from all data written so
+        far and the ratio achieved by compressing each write on its own with
+        a fast zlib level. That compresses worse than the actual compressor,
+        so the estimate tends to be somewhat larger than the final size, but
+        never smaller than the data that is already on disk.
+        """
+        sampled, sample_size = self._sample
+        ratio = sample_size / sampled if sampled else self.assumed_ratio
+        estimate = self._initial_size + int(self._written * ratio)
+        return max(estimate, self._raw.tell())
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        if self.closed:
+            raise ValueError("write to closed file")
+        if self._error is not None:
+            raise self._error
+        data = bytes(data)
+        self._queue.put(data)
+        self._written += len(data)
+        return len(data)
+
+    def _compress(self) -> None:
+        while True:
+            data = self._queue.get()
+            if data is None:
+                break
+            if self._error is None:
+                try:
+                    self._compressed.write(data)
+                    sampled, sample_size = self._sample
+                    self._sample = (
+                        sampled + len(data),
+                        sample_size + len(zlib.compress(data, 1)),
+                    )
+                except BaseException as error:  # pylint: disable=broad-except
+                    # keep on consuming the queue, so that writing does not block
+                    self._error = error
+
+    def close(self) -> None:
+        """Waits for all data to be compressed and closes the file."""
+        if self.closed:
+            return
+        try:
+            self._queue.put(None)
+            self._thread.join()
+            self._compressed.close()
+            self._raw.close()
+        finally:
+            super().close()
+        if self._error is not None:
+            raise self._error
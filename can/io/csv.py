@@ -9,11 +9,14 @@ TODO: This module could use https://docs.python.org/2/library/csv.html#module-cs
       of a CSV file.
 """
 
+import math
 from base64 import b64encode, b64decode
 
+from can.filters import CompiledFilters
 from can.message import Message
 from can.listener import Listener
 from .generic import BaseIOHandler
+from .timeindex import seek_offset
 
 
 class CSVWriter(BaseIOHandler, Listener):
@@ -54,8 +57,9 @@ class CSVWriter(BaseIOHandler, Listener):
         if not append:
             self.file.write("timestamp,arbitration_id,extended,remote,error,dlc,data\n")
 
-    def on_message_received(self, msg):
-        row = ",".join(
+    @staticmethod
+    def _format_row(msg):
+        return ",".join(
             [
                 repr(msg.timestamp),  # cannot use str() here because that is rounding
                 hex(msg.arbitration_id),
@@ -66,9 +70,15 @@ class CSVWriter(BaseIOHandler, Listener):
                 b64encode(msg.data).decode("utf8"),
             ]
         )
-        self.file.write(row)
+
+    def on_message_received(self, msg):
+        self.file.write(self._format_row(msg))
         self.file.write("\n")
 
+    def on_messages_received(self, msgs):
+        # a single write for the whole batch
+        self.file.write("".join([self._format_row(msg) + "\n" for msg in msgs]))
+
 
 class CSVReader(BaseIOHandler):
     """Iterator over CAN messages from a .csv file that was
@@ -79,13 +89,30 @@ class CSVReader(BaseIOHandler):
     Any line separator is accepted.
     """
 
-    def __init__(self, file):
+    def __init__(self, file, start=None, end=None, can_filters=None, index_file=None):
         """
         :param file: a path-like object or as file-like object to read from
                      If this is a file-like object, is has to opened in text
                      read mode, not binary read mode.
+        :param float start: if given, skip messages with an earlier timestamp
+        :param float end: if given, stop reading at the first message with a
+                          later timestamp, since the file is assumed to be
+                          sorted by time
+        :param can_filters: if given, only read the messages matching at least
+                            one of the filters, see
+                            :meth:`can.BusABC.set_filters` for the format
+        :param index_file: a path-like object of a sidecar file with a
+                           :class:`~can.io.timeindex.TimeIndex`, which is used
+                           to seek to `start`. If it does not exist or does not
+                           match the file, the index is built and written to it.
+
+        Lines are rejected by their timestamp and ID before decoding the data.
         """
         super().__init__(file, mode="r")
+        self.start = start
+        self.end = end
+        self._filters = CompiledFilters(can_filters) if can_filters else None
+        self._index_file = index_file
 
     def __iter__(self):
         # skip the header line
@@ -95,18 +122,36 @@ class CSVReader(BaseIOHandler):
             # don't crash on a file with only a header
             return
 
+        if self.start is not None and self._index_file is not None:
+            offset = seek_offset(self.file, self._index_file, ".csv", self.start)
+            if offset is not None:
+                self.file.seek(offset)
+
+        min_timestamp = -math.inf if self.start is None else self.start
+        max_timestamp = math.inf if self.end is None else self.end
+        matches = None if self._filters is None else self._filters.matches
+
         for line in self.file:
 
             timestamp, arbitration_id, extended, remote, error, dlc, data = line.split(
                 ","
             )
 
+            timestamp = float(timestamp)
+            if timestamp < min_timestamp:
+                continue
+            if timestamp > max_timestamp:
+                break
+            arbitration_id = int(arbitration_id, base=16)
+            if matches is not None and not matches(arbitration_id, extended == "1"):
+                continue
+
             yield Message(
-                timestamp=float(timestamp),
+                timestamp=timestamp,
                 is_remote_frame=(remote == "1"),
                 is_extended_id=(extended == "1"),
                 is_error_frame=(error == "1"),
-                arbitration_id=int(arbitration_id, base=16),
+                arbitration_id=arbitration_id,
                 dlc=int(dlc),
                 data=b64decode(data),
             )
@@ -2,6 +2,7 @@
 
 from abc import ABCMeta
 from typing import (
+    Any,
     Optional,
     cast,
     Iterable,
@@ -30,12 +31,16 @@ class BaseIOHandler(ContextManager, metaclass=ABCMeta):
 
     file: Optional[can.typechecking.FileLike]
 
-    def __init__(self, file: can.typechecking.AcceptedIOType, mode: str = "rt") -> None:
+    def __init__(
+        self, file: can.typechecking.AcceptedIOType, mode: str = "rt", **kwargs: Any
+    ) -> None:
         """
         :param file: a path-like object to open a file, a file-like object
                      to be used as a file or `None` to not use a file at all
         :param mode: the mode that should be used to open the file, see
                      :func:`open`, ignored if *file* is `None`
+        :param kwargs: passed on to the next base class of a subclass that
+                       inherits from several classes
         """
         if file is None or (hasattr(file, "read") and hasattr(file, "write")):
             # file is None or some file-like object
@@ -45,7 +50,7 @@ class BaseIOHandler(ContextManager, metaclass=ABCMeta):
             self.file = open(cast(can.typechecking.StringPathLike, file), mode)
 
         # for multiple inheritance
-        super().__init__()
+        super().__init__(**kwargs)
 
     def __enter__(self) -> "BaseIOHandler":
         return self
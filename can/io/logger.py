@@ -4,9 +4,11 @@ See the :class:`Logger` class.
 
 import os
 import pathlib
+import threading
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, cast, Callable, Optional
+from typing import Any, cast, Callable, Dict, List, Optional, TextIO
 
 from pkg_resources import iter_entry_points
 
@@ -16,10 +18,13 @@ from .generic import BaseIOHandler, FileIOMessageWriter
 from .asc import ASCWriter
 from .blf import BLFWriter
 from .canutils import CanutilsLogWriter
+from .columnar import ColumnarWriter
+from .compression import BackgroundCompressedFile, COMPRESSIBLE_FORMATS
+from .compression import open_compressed, split_suffix
 from .csv import CSVWriter
 from .sqlite import SqliteWriter
 from .printer import Printer
-from ..typechecking import StringPathLike
+from ..typechecking import AcceptedIOType, StringPathLike
 
 
 class Logger(BaseIOHandler, Listener):  # pylint: disable=abstract-method
@@ -29,6 +34,7 @@ class Logger(BaseIOHandler, Listener):  # pylint: disable=abstract-method
     The format is determined from the file format which can be one of:
       * .asc: :class:`can.ASCWriter`
       * .blf :class:`can.BLFWriter`
+      * .canc: :class:`can.ColumnarWriter`
       * .csv: :class:`can.CSVWriter`
       * .db: :class:`can.SqliteWriter`
       * .log :class:`can.CanutilsLogWriter`
@@ -36,6 +42,10 @@ class Logger(BaseIOHandler, Listener):  # pylint: disable=abstract-method
 
     The **filename** may also be *None*, to fall back to :class:`can.Printer`.
 
+    The text formats (.asc, .csv and .log) can be compressed by appending
+    .gz, .bz2 or .xz to the suffix, e.g. ``"overnight.asc.gz"``. The data is
+    compressed on a background thread while logging.
+
     The log files may be incomplete until `stop()` is called due to buffering.
 
     .. note::
@@ -47,6 +57,7 @@ class Logger(BaseIOHandler, Listener):  # pylint: disable=abstract-method
     message_writers = {
         ".asc": ASCWriter,
         ".blf": BLFWriter,
+        ".canc": ColumnarWriter,
         ".csv": CSVWriter,
         ".db": SqliteWriter,
         ".log": CanutilsLogWriter,
@@ -75,15 +86,26 @@ class Logger(BaseIOHandler, Listener):  # pylint: disable=abstract-method
             )
             Logger.fetched_plugins = True
 
-        suffix = pathlib.PurePath(filename).suffix.lower()
+        suffix, compression = split_suffix(filename)
         try:
-            return cast(
-                Listener, Logger.message_writers[suffix](filename, *args, **kwargs)
-            )
+            writer_class = Logger.message_writers[suffix]
         except KeyError:
             raise ValueError(
                 f'No write support for this unknown log format "{suffix}"'
             ) from None
+        file: AcceptedIOType = filename
+        if compression is not None:
+            file = _open_compressed_for_writing(filename, suffix, kwargs)
+        return cast(Listener, writer_class(file, *args, **kwargs))
+
+
+def _open_compressed_for_writing(
+    filename: StringPathLike, suffix: str, kwargs: Dict[str, Any]
+) -> TextIO:
+    """Opens a compressed file for a writer, honouring its `append` argument."""
+    if suffix not in COMPRESSIBLE_FORMATS:
+        raise ValueError(f'Log format "{suffix}" does not support compression')
+    return open_compressed(filename, "at" if kwargs.get("append") else "wt")
 
 
 class BaseRotatingLogger(Listener, ABC):
@@ -112,11 +134,20 @@ class BaseRotatingLogger(Listener, ABC):
     :attr FileIOMessageWriter writer:
         This attribute holds an instance of a writer class which manages the
         actual file IO.
+
+    When rotating, the current log file is renamed while it is still open and
+    the new writer is created right away. The old writer is stopped on a
+    background thread, which for example compresses the last container of a
+    BLF file, so that receiving messages does not stall. Only if renaming an
+    open file is not possible, like on Windows, this happens synchronously.
+    It also happens synchronously if a custom `rotator` is set or `rotate` is
+    overridden, so that they are passed the finished log file.
     """
 
     supported_writers = {
         ".asc": ASCWriter,
         ".blf": BLFWriter,
+        ".canc": ColumnarWriter,
         ".csv": CSVWriter,
         ".log": CanutilsLogWriter,
         ".txt": Printer,
@@ -125,6 +156,8 @@ class BaseRotatingLogger(Listener, ABC):
     rotator: Optional[Callable[[StringPathLike, StringPathLike], None]] = None
     rollover_count: int = 0
     _writer: Optional[FileIOMessageWriter] = None
+    _finalizer: Optional[threading.Thread] = None
+    _finalizer_error: Optional[BaseException] = None
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self.writer_args = args
@@ -187,6 +220,23 @@ class BaseRotatingLogger(Listener, ABC):
 
         self.writer.on_message_received(msg)
 
+    def on_messages_received(self, msgs: List[Message]) -> None:
+        """This method is called to handle several messages at once.
+
+        The rollover conditions are only checked once for the whole batch.
+
+        :param msgs:
+            the delivered messages
+        """
+        if not msgs:
+            return
+
+        if self.should_rollover(msgs[0]):
+            self.do_rollover()
+            self.rollover_count += 1
+
+        self.writer.on_messages_received(msgs)
+
     def get_new_writer(self, filename: StringPathLike) -> None:
         """Instantiate a new writer.
 
@@ -196,7 +246,7 @@ class BaseRotatingLogger(Listener, ABC):
         :return:
             An instance of a writer class.
         """
-        suffix = pathlib.Path(filename).suffix.lower()
+        suffix, compression = split_suffix(filename)
         try:
             writer_class = self.supported_writers[suffix]
         except KeyError:
@@ -205,9 +255,89 @@ class BaseRotatingLogger(Listener, ABC):
                 f"not supported by {self.__class__.__name__}."
             )
         else:
-            self._writer = writer_class(
-                filename, *self.writer_args, **self.writer_kwargs
-            )
+            file: AcceptedIOType = filename
+            if compression is not None:
+                file = _open_compressed_for_writing(
+                    filename, suffix, self.writer_kwargs
+                )
+            self._writer = writer_class(file, *self.writer_args, **self.writer_kwargs)
+
+    def _rollover(self, filename: StringPathLike) -> None:
+        """Rotates the current log file and creates a new writer for `filename`.
+
+        The current writer is stopped on a background thread if possible, see
+        :class:`BaseRotatingLogger`.
+
+        :param filename:
+            The path of the current log file, which is also used for the new one.
+        """
+        writer = self.writer
+        dest = self.rotation_filename(self._default_name(filename))
+        # the previous writer has to be finished before its file is rotated
+        # again, which also bounds the number of pending writers to one
+        self._join_finalizer()
+
+        if self._rotates_open_files():
+            try:
+                # move the file out of the way, while the old writer keeps it open
+                self.rotate(filename, dest)
+            except OSError:
+                # e.g. open files cannot be renamed on Windows
+                pass
+            else:
+                self.get_new_writer(filename)
+                self._finalizer = threading.Thread(
+                    target=self._finalize,
+                    args=(writer,),
+                    name=f"Finalizing {dest}",
+                    daemon=True,
+                )
+                self._finalizer.start()
+                return
+
+        writer.stop()
+        self.rotate(filename, dest)
+        self.get_new_writer(filename)
+
+    def _rotates_open_files(self) -> bool:
+        """Whether :meth:`rotate` only renames the file, which also works while
+        it is still open. Custom rotations are passed the finished file."""
+        return (
+            not callable(self.rotator)
+            and type(self).rotate is BaseRotatingLogger.rotate
+        )
+
+    def _finalize(self, writer: FileIOMessageWriter) -> None:
+        try:
+            writer.stop()
+        except BaseException as error:  # pylint: disable=broad-except
+            # raised when the next rollover or stop() waits for this thread
+            self._finalizer_error = error
+
+    def _join_finalizer(self) -> None:
+        """Waits for the previous writer to be stopped and rotated."""
+        if self._finalizer is not None:
+            self._finalizer.join()
+            self._finalizer = None
+        error, self._finalizer_error = self._finalizer_error, None
+        if error is not None:
+            raise error
+
+    def _default_name(self, filename: StringPathLike) -> StringPathLike:
+        """Generate the default rotation filename."""
+        path = pathlib.Path(filename)
+        # keep the suffix of the compression method, like in "log.asc.gz"
+        _, compression = split_suffix(path)
+        suffix = "".join(path.suffixes[-2:] if compression else path.suffixes[-1:])
+        new_name = (
+            path.name[: len(path.name) - len(suffix)]
+            + "_"
+            + datetime.now().strftime("%Y-%m-%dT%H%M%S")
+            + "_"
+            + f"#{self.rollover_count:03}"
+            + suffix
+        )
+        return str(path.parent / new_name)
 
     def stop(self) -> None:
         """Stop handling new messages.
@@ -215,7 +345,10 @@ class BaseRotatingLogger(Listener, ABC):
         Carry out any final tasks to ensure
         data is persisted and cleanup any open resources.
         """
-        self.writer.stop()
+        try:
+            self._join_finalizer()
+        finally:
+            self.writer.stop()
 
     @abstractmethod
     def should_rollover(self, msg: Message) -> bool:
@@ -255,13 +388,32 @@ class SizedRotatingLogger(BaseRotatingLogger):
     The SizedRotatingLogger currently supports the formats
       * .asc: :class:`can.ASCWriter`
       * .blf :class:`can.BLFWriter`
+      * .canc: :class:`can.ColumnarWriter`
       * .csv: :class:`can.CSVWriter`
       * .log :class:`can.CanutilsLogWriter`
       * .txt :class:`can.Printer`
 
-    The log files may be incomplete until `stop()` is called due to buffering.
+    The text formats may be compressed like with :class:`can.Logger`, e.g.
+    ``"my_logfile.asc.gz"``. Then, `max_bytes` limits the compressed size of
+    the files. Since the compressor holds back data, that size can only be
+    estimated, see :attr:`can.io.compression.BackgroundCompressedFile.compressed_size`.
+    The estimate is on the safe side, so the files usually end up somewhat
+    smaller than `max_bytes`.
+
+    The size of the file is not checked for every message, but only once the
+    messages written since the last check could have reached `max_bytes`,
+    assuming that no message takes more than :attr:`MAX_MESSAGE_SIZE` bytes.
+
+    Data that the writer still holds in memory is included in the size, so
+    the files do not grow much past `max_bytes` due to buffering. For
+    :class:`can.BLFWriter` and :class:`can.ColumnarWriter`, this data is
+    counted before compression. The log files may be incomplete until
+    `stop()` is called due to buffering.
     """
 
+    #: an upper bound of the bytes a single message takes in any supported format
+    MAX_MESSAGE_SIZE = 512
+
     def __init__(
         self,
         base_filename: StringPathLike,
@@ -281,6 +433,9 @@ class SizedRotatingLogger(BaseRotatingLogger):
 
         self.base_filename = os.path.abspath(base_filename)
         self.max_bytes = max_bytes
+        # the number of messages that can be written before the size of the
+        # file has to be checked again
+        self._unchecked_messages = 0
 
         self.get_new_writer(self.base_filename)
 
@@ -288,30 +443,96 @@ class SizedRotatingLogger(BaseRotatingLogger):
         if self.max_bytes <= 0:
             return False
 
-        if self.writer.file.tell() >= self.max_bytes:
+        if self._unchecked_messages > 0:
+            self._unchecked_messages -= 1
+            return False
+
+        size = self._file_size()
+        if size >= self.max_bytes:
             return True
 
+        self._unchecked_messages = (self.max_bytes - size) // self.MAX_MESSAGE_SIZE
         return False
 
+    def on_messages_received(self, msgs: List[Message]) -> None:
+        super().on_messages_received(msgs)
+        # only the first message was counted by should_rollover()
+        self._unchecked_messages -= max(len(msgs) - 1, 0)
+
+    def _file_size(self) -> int:
+        """Returns the size of the current log file, after compression if any,
+        including the data the writer still holds in memory."""
+        writer = self.writer
+        if isinstance(writer, (ASCWriter, CanutilsLogWriter)):
+            # the collected lines are cheap to write out and then measured exactly
+            writer.flush()
+        file = writer.file
+        buffer = getattr(file, "buffer", None)
+        if isinstance(buffer, BackgroundCompressedFile):
+            size = buffer.compressed_size
+        else:
+            size = file.tell()
+        # containers or chunks of the binary formats, before compression
+        return size + getattr(writer, "pending_size", 0)
+
     def do_rollover(self) -> None:
-        if self.writer:
-            self.writer.stop()
+        self._rollover(self.base_filename)
+        self._unchecked_messages = 0
 
-        sfn = self.base_filename
-        dfn = self.rotation_filename(self._default_name())
-        self.rotate(sfn, dfn)
 
-        self.get_new_writer(self.base_filename)
+class TimedRotatingLogger(BaseRotatingLogger):
+    """Log CAN messages to a sequence of files, each covering a given interval.
 
-    def _default_name(self) -> StringPathLike:
-        """Generate the default rotation filename."""
-        path = pathlib.Path(self.base_filename)
-        new_name = (
-            path.stem
-            + "_"
-            + datetime.now().strftime("%Y-%m-%dT%H%M%S")
-            + "_"
-            + f"#{self.rollover_count:03}"
-            + path.suffix
+    The logger creates a log file with the given `base_filename`. When the
+    interval has passed, the current log file is closed and renamed by adding
+    a timestamp and the rollover count, just like with
+    :class:`~can.SizedRotatingLogger`. A new log file is then created and
+    written to.
+
+    Example::
+
+        from can import Notifier, TimedRotatingLogger
+
+        logger = TimedRotatingLogger(
+            base_filename="my_logfile.blf",
+            interval=60 * 60,  # a new file every hour
         )
-        return str(path.parent / new_name)
+
+        notifier = Notifier(bus=bus, listeners=[logger])
+
+    The same formats as for :class:`~can.SizedRotatingLogger` are supported.
+    The interval is measured with the system clock, starting when the logger
+    or the current log file was created.
+
+    The log files may be incomplete until `stop()` is called due to buffering.
+    """
+
+    def __init__(
+        self,
+        base_filename: StringPathLike,
+        interval: float = 0,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """
+        :param base_filename:
+            A path-like object for the base filename. The log file format is defined by
+            the suffix of `base_filename`.
+        :param interval:
+            The number of seconds after which a new log file shall be created. If set
+            to 0, no rollover will be performed.
+        """
+        super(TimedRotatingLogger, self).__init__(*args, **kwargs)
+
+        self.base_filename = os.path.abspath(base_filename)
+        self.interval = interval
+        self.rollover_at = time.time() + interval
+
+        self.get_new_writer(self.base_filename)
+
+    def should_rollover(self, msg: Message) -> bool:
+        return self.interval > 0 and time.time() >= self.rollover_at
+
+    def do_rollover(self) -> None:
+        self._rollover(self.base_filename)
+        self.rollover_at = time.time() + self.interval
@@ -4,7 +4,9 @@ well as :class:`MessageSync` which plays back messages
 in the recorded order an time intervals.
 """
 
-import pathlib
+import heapq
+import os
+from operator import attrgetter
 from time import time, sleep
 import typing
 
@@ -17,6 +19,8 @@ from .generic import BaseIOHandler, MessageReader
 from .asc import ASCReader
 from .blf import BLFReader
 from .canutils import CanutilsLogReader
+from .columnar import ColumnarReader
+from .compression import COMPRESSIBLE_FORMATS, open_compressed, split_suffix
 from .csv import CSVReader
 from .sqlite import SqliteReader
 
@@ -28,15 +32,30 @@ class LogReader(BaseIOHandler):
     The format is determined from the file format which can be one of:
       * .asc
       * .blf
+      * .canc
       * .csv
       * .db
       * .log
 
+    The text formats (.asc, .csv and .log) may be compressed with a suffix
+    like .gz, .bz2 or .xz, e.g. ``"overnight.asc.gz"``.
+
     Exposes a simple iterator interface, to use simply:
 
         >>> for msg in LogReader("some/path/to/my_file.log"):
         ...     print(msg)
 
+    The messages can be limited to a time range and to some arbitration IDs.
+    This is done by the reader of each format, which for example skips the
+    lines of text formats by their timestamps or uses SQL for databases:
+
+        >>> reader = LogReader(
+        ...     "some/path/to/my_file.blf",
+        ...     start=120.0,
+        ...     end=180.0,
+        ...     can_filters=[{"can_id": 0x18FEF100, "can_mask": 0x1FFFFFFF}],
+        ... )
+
     .. note::
         There are no time delays, if you want to reproduce the measured
         delays between messages look at the :class:`can.MessageSync` class.
@@ -50,6 +69,7 @@ class LogReader(BaseIOHandler):
     message_readers = {
         ".asc": ASCReader,
         ".blf": BLFReader,
+        ".canc": ColumnarReader,
         ".csv": CSVReader,
         ".db": SqliteReader,
         ".log": CanutilsLogReader,
@@ -60,10 +80,20 @@ class LogReader(BaseIOHandler):
         cls: typing.Any,
         filename: "can.typechecking.StringPathLike",
         *args: typing.Any,
+        start: typing.Optional[float] = None,
+        end: typing.Optional[float] = None,
+        can_filters: typing.Optional["can.typechecking.CanFilters"] = None,
         **kwargs: typing.Any,
     ) -> MessageReader:
         """
         :param filename: the filename/path of the file to read from
+        :param start: if given, skip messages with an earlier timestamp
+        :param end: if given, skip messages with a later timestamp. Text
+                    files are assumed to be sorted by time, so reading stops
+                    at the first later message.
+        :param can_filters: if given, only read the messages matching at least
+                            one of the filters, see
+                            :meth:`can.BusABC.set_filters` for the format
         :raises ValueError: if the filename's suffix is of an unknown file type
         """
         if not LogReader.fetched_plugins:
@@ -75,16 +105,122 @@ class LogReader(BaseIOHandler):
             )
             LogReader.fetched_plugins = True
 
-        suffix = pathlib.PurePath(filename).suffix.lower()
+        suffix, compression = split_suffix(filename)
         try:
-            return typing.cast(
-                MessageReader,
-                LogReader.message_readers[suffix](filename, *args, **kwargs),
-            )
+            reader_class = LogReader.message_readers[suffix]
         except KeyError:
             raise ValueError(
                 f'No read support for this unknown log format "{suffix}"'
             ) from None
+        # only pass on the selection if given, as plugins might not support it
+        for name, value in (
+            ("start", start),
+            ("end", end),
+            ("can_filters", can_filters),
+        ):
+            if value is not None:
+                kwargs[name] = value
+
+        file: "can.typechecking.AcceptedIOType" = filename
+        if compression is not None:
+            if suffix not in COMPRESSIBLE_FORMATS:
+                raise ValueError(f'Log format "{suffix}" does not support compression')
+            file = open_compressed(filename, "rt")
+        return typing.cast(MessageReader, reader_class(file, *args, **kwargs))
+
+
+class MergedLogReader(MessageReader):
+    """
+    Merges several logs into a single stream of messages ordered by timestamp.
+
+    The logs may be of different formats, but each one has to be sorted by
+    time. Only the next message of each log is held in memory, so the logs
+    may be arbitrarily large and start hours apart. Messages with equal
+    timestamps are yielded in the order of the logs.
+
+    Like any reader, it can be passed to a :class:`~can.MessageSync` or its
+    messages can be written to a :class:`~can.Logger`::
+
+        with MergedLogReader(["can0.blf", "can1.asc"], channels=[0, 1]) as reader:
+            with Logger("merged.blf") as writer:
+                for msg in reader:
+                    writer(msg)
+    """
+
+    def __init__(
+        self,
+        logs: typing.Iterable[
+            typing.Union[
+                "can.typechecking.StringPathLike", typing.Iterable["can.Message"]
+            ]
+        ],
+        channels: typing.Optional[
+            typing.Sequence[typing.Optional["can.typechecking.Channel"]]
+        ] = None,
+        **kwargs: typing.Any,
+    ) -> None:
+        """
+        :param logs: The paths of the log files, which are opened with
+                     :class:`~can.LogReader`, or already opened readers or any
+                     other iterables of messages. All of them are stopped when
+                     this reader is stopped.
+        :param channels: If given, the channel to set on all messages of the
+                         log at the same position, e.g. to tell apart logs
+                         that were recorded on different buses.
+        :param kwargs: Passed on to :class:`~can.LogReader` when opening a log
+                       file, e.g. to only merge a time range with `start` and
+                       `end`. ASC files are read with absolute timestamps, so
+                       that they can be compared with the other logs.
+        :raises ValueError: if the number of channels does not match the
+                            number of logs
+        """
+        super().__init__(file=None)
+        self.readers: typing.List[typing.Iterable["can.Message"]] = []
+        try:
+            for log in logs:
+                if isinstance(log, (str, os.PathLike)):
+                    if split_suffix(log)[0] == ".asc":
+                        log = LogReader(log, relative_timestamp=False, **kwargs)
+                    else:
+                        log = LogReader(log, **kwargs)
+                self.readers.append(log)
+        except BaseException:
+            self.stop()
+            raise
+
+        if channels is not None and len(channels) != len(self.readers):
+            self.stop()
+            raise ValueError(
+                f"Got {len(channels)} channels for {len(self.readers)} logs"
+            )
+        self.channels = channels
+
+    def __iter__(self) -> typing.Generator["can.Message", None, None]:
+        if self.channels is None:
+            streams = self.readers
+        else:
+            streams = [
+                self._set_channel(reader, channel)
+                for reader, channel in zip(self.readers, self.channels)
+            ]
+        yield from heapq.merge(*streams, key=attrgetter("timestamp"))
+        self.stop()
+
+    @staticmethod
+    def _set_channel(
+        messages: typing.Iterable["can.Message"],
+        channel: typing.Optional["can.typechecking.Channel"],
+    ) -> typing.Generator["can.Message", None, None]:
+        for msg in messages:
+            msg.channel = channel
+            yield msg
+
+    def stop(self) -> None:
+        """Stops all logs."""
+        for reader in self.readers:
+            if isinstance(reader, BaseIOHandler):
+                reader.stop()
+        super().stop()
 
 
 class MessageSync:  # pylint: disable=too-few-public-methods
@@ -118,20 +254,91 @@ class MessageSync:  # pylint: disable=too-few-public-methods
 
         for message in self.raw_messages:
 
-            # Work out the correct wait time
-            if self.timestamps:
-                if recorded_start_time is None:
-                    recorded_start_time = message.timestamp
+            if self.timestamps and recorded_start_time is None:
+                recorded_start_time = message.timestamp
+
+            sleep(self._sleep_period(message, playback_start_time, recorded_start_time))
 
-                now = time()
-                current_offset = now - playback_start_time
-                recorded_offset_from_start = message.timestamp - recorded_start_time
-                remaining_gap = max(0.0, recorded_offset_from_start - current_offset)
+            yield message
 
-                sleep_period = max(self.gap, min(self.skip, remaining_gap))
-            else:
-                sleep_period = self.gap
+    def iter_batches(
+        self, max_batch_size: int = 64
+    ) -> typing.Generator[typing.List["can.Message"], None, None]:
+        """Like iterating over this instance, but yields lists of messages
+        that are all due at the same time.
 
-            sleep(sleep_period)
+        A message is added to the current batch if it was recorded at the same
+        time as the previous one or if the playback is already lagging behind
+        it. The minimum *gap* only applies between batches. If the timestamps
+        are ignored, the messages are only combined if *gap* is zero. This
+        allows sending bursts of messages with :meth:`can.BusABC.send_batch`.
 
-            yield message
+        :param max_batch_size: the maximum number of messages per batch
+        """
+        playback_start_time = time()
+        recorded_start_time = None
+        batch: typing.List["can.Message"] = []
+
+        for message in self.raw_messages:
+
+            if self.timestamps and recorded_start_time is None:
+                recorded_start_time = message.timestamp
+
+            if batch:
+                if len(batch) < max_batch_size and self._joins_batch(
+                    message, batch[-1], playback_start_time, recorded_start_time
+                ):
+                    batch.append(message)
+                    continue
+                yield batch
+                batch = []
+
+            sleep(self._sleep_period(message, playback_start_time, recorded_start_time))
+            batch.append(message)
+
+        if batch:
+            yield batch
+
+    def _joins_batch(
+        self,
+        message: "can.Message",
+        previous: "can.Message",
+        playback_start_time: float,
+        recorded_start_time: typing.Optional[float],
+    ) -> bool:
+        """Whether the message may be sent right after the previous one."""
+        if not self.timestamps:
+            return self.gap <= 0
+        return (
+            message.timestamp == previous.timestamp
+            or self._remaining_gap(message, playback_start_time, recorded_start_time)
+            <= 0
+        )
+
+    def _remaining_gap(
+        self,
+        message: "can.Message",
+        playback_start_time: float,
+        recorded_start_time: typing.Optional[float],
+    ) -> float:
+        """Work out how long it takes until the given message is due."""
+        if recorded_start_time is None:
+            return 0.0
+        current_offset = time() - playback_start_time
+        recorded_offset_from_start = message.timestamp - recorded_start_time
+        return max(0.0, recorded_offset_from_start - current_offset)
+
+    def _sleep_period(
+        self,
+        message: "can.Message",
+        playback_start_time: float,
+        recorded_start_time: typing.Optional[float],
+    ) -> float:
+        """Work out the correct wait time before sending the given message."""
+        if self.timestamps and recorded_start_time is not None:
+            remaining_gap = self._remaining_gap(
+                message, playback_start_time, recorded_start_time
+            )
+            return max(self.gap, min(self.skip, remaining_gap))
+        else:
+            return self.gap
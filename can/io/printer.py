@@ -38,3 +38,12 @@ class Printer(BaseIOHandler, Listener):
             self.file.write(str(msg) + "\n")
         else:
             print(msg)
+
+    def on_messages_received(self, msgs):
+        if not msgs:
+            return
+        lines = "\n".join([str(msg) for msg in msgs])
+        if self.write_to_file:
+            self.file.write(lines + "\n")
+        else:
+            print(lines)
@@ -8,13 +8,26 @@ import time
 import threading
 import logging
 import sqlite3
+from operator import attrgetter
 
+from can.filters import EXTENDED_ID_MAX
 from can.listener import BufferedReader
 from can.message import Message
 from .generic import BaseIOHandler
 
 log = logging.getLogger("can.io.sqlite")
 
+# extracts the values of a row from a message, without building the tuple in Python
+_row_of_message = attrgetter(
+    "timestamp",
+    "arbitration_id",
+    "is_extended_id",
+    "is_remote_frame",
+    "is_error_frame",
+    "dlc",
+    "data",
+)
+
 
 class SqliteReader(BaseIOHandler):
     """
@@ -23,6 +36,13 @@ class SqliteReader(BaseIOHandler):
     This class can be iterated over or used to fetch all messages in the
     database with :meth:`~SqliteReader.read_all`.
 
+    Only the messages in a time range and/or matching some filters can be read
+    by passing `start`, `end` and `can_filters`. These are translated into a
+    ``WHERE`` clause, such that the database does the filtering. This is
+    especially fast if the database has indexes on ``ts`` and
+    ``arbitration_id``, see the `create_indexes` parameter of
+    :class:`~can.SqliteWriter`.
+
     Calling :func:`~builtin.len` on this object might not run in constant time.
 
     :attr str table_name: the name of the database table used for storing the messages
@@ -30,11 +50,26 @@ class SqliteReader(BaseIOHandler):
     .. note:: The database schema is given in the documentation of the loggers.
     """
 
-    def __init__(self, file, table_name="messages"):
+    def __init__(
+        self,
+        file,
+        table_name="messages",
+        start=None,
+        end=None,
+        can_filters=None,
+        arraysize=1000,
+    ):
         """
         :param file: a `str` or since Python 3.7 a path like object that points
                      to the database file to use
         :param str table_name: the name of the table to look for the messages
+        :param float start: if given, skip messages with an earlier timestamp
+        :param float end: if given, skip messages with a later timestamp
+        :param can_filters: if given, only read the messages matching at least
+                            one of the filters, see
+                            :meth:`can.BusABC.set_filters` for the format
+        :param int arraysize: the number of rows to fetch from the database at
+                              once
 
         .. warning:: In contrary to all other readers/writers the Sqlite handlers
                      do not accept file-like objects as the `file` parameter.
@@ -44,40 +79,92 @@ class SqliteReader(BaseIOHandler):
         self._conn = sqlite3.connect(file)
         self._cursor = self._conn.cursor()
         self.table_name = table_name
+        self.arraysize = arraysize
+        self._where, self._parameters = self._build_where(start, end, can_filters)
+
+    @staticmethod
+    def _build_where(start, end, can_filters):
+        """Translates the selection of messages into a ``WHERE`` clause.
+
+        :return: the clause, which is empty if all messages are selected, and
+                 its parameters
+        """
+        conditions = []
+        parameters = []
+        if start is not None:
+            conditions.append("ts >= ?")
+            parameters.append(start)
+        if end is not None:
+            conditions.append("ts <= ?")
+            parameters.append(end)
+
+        if can_filters:
+            matches = []
+            for can_filter in can_filters:
+                can_mask = can_filter["can_mask"]
+                if can_mask & EXTENDED_ID_MAX == EXTENDED_ID_MAX:
+                    # this can use an index on the arbitration ID
+                    match = "arbitration_id = ?"
+                    parameters.append(can_filter["can_id"] & can_mask)
+                else:
+                    match = "arbitration_id & ? = ?"
+                    parameters.extend([can_mask, can_filter["can_id"] & can_mask])
+                if "extended" in can_filter:
+                    match += " AND extended = ?"
+                    parameters.append(bool(can_filter["extended"]))
+                matches.append("({})".format(match))
+            conditions.append("({})".format(" OR ".join(matches)))
+
+        if not conditions:
+            return "", parameters
+        return " WHERE " + " AND ".join(conditions), parameters
+
+    def _select(self, columns):
+        return self._conn.execute(
+            "SELECT {} FROM {}{}".format(columns, self.table_name, self._where),
+            self._parameters,
+        )
 
     def __iter__(self):
-        for frame_data in self._cursor.execute(
-            "SELECT * FROM {}".format(self.table_name)
-        ):
-            yield SqliteReader._assemble_message(frame_data)
+        # a separate cursor, such that len() can be called while iterating
+        cursor = self._select("*")
+        cursor.arraysize = self.arraysize
+        assemble_message = SqliteReader._assemble_message
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            for frame_data in rows:
+                yield assemble_message(frame_data)
 
     @staticmethod
     def _assemble_message(frame_data):
         timestamp, can_id, is_extended, is_remote, is_error, dlc, data = frame_data
         return Message(
-            timestamp=timestamp,
-            is_remote_frame=bool(is_remote),
-            is_extended_id=bool(is_extended),
-            is_error_frame=bool(is_error),
-            arbitration_id=can_id,
-            dlc=dlc,
-            data=data,
+            timestamp,
+            can_id,
+            bool(is_extended),
+            bool(is_remote),
+            bool(is_error),
+            None,
+            dlc,
+            data,
         )
 
     def __len__(self):
         # this might not run in constant time
-        result = self._cursor.execute("SELECT COUNT(*) FROM {}".format(self.table_name))
+        result = self._select("COUNT(*)")
         return int(result.fetchone()[0])
 
     def read_all(self):
         """Fetches all messages in the database.
 
+        The messages are fetched in chunks of :attr:`arraysize` while the
+        returned generator is consumed.
+
         :rtype: Generator[can.Message]
         """
-        result = self._cursor.execute(
-            "SELECT * FROM {}".format(self.table_name)
-        ).fetchall()
-        return (SqliteReader._assemble_message(frame) for frame in result)
+        return iter(self)
 
     def stop(self):
         """Closes the connection to the database."""
@@ -101,6 +188,17 @@ class SqliteWriter(BaseIOHandler, BufferedReader):
                           excludes messages that are still buffered
     :attr float last_write: the last time a message war actually written to the database,
                             as given by ``time.time()``
+    :attr int dropped_messages: the number of messages that were discarded
+                                because the buffer was full, see `max_buffer_size`
+
+    For high bus loads, the writer can be run in a *throughput mode*. Then, the
+    database uses a write-ahead log (``journal_mode=WAL``) and does not wait for
+    the data to reach the disk after each transaction (``synchronous=NORMAL``),
+    which is still safe against corruption, but the last transactions might be
+    lost on a power failure. Furthermore, the number of messages per transaction
+    adapts to the rate at which messages arrive: It doubles whenever a full batch
+    is buffered, up to :attr:`~SqliteWriter.MAX_BATCH_SIZE`, and halves if the
+    messages could not fill the last batch.
 
     .. note::
 
@@ -115,7 +213,8 @@ class SqliteWriter(BaseIOHandler, BufferedReader):
         However if the bus is still saturated with messages, the Listener
         will continue receiving until the :attr:`~can.SqliteWriter.MAX_TIME_BETWEEN_WRITES`
         timeout is reached or more than
-        :attr:`~can.SqliteWriter.MAX_BUFFER_SIZE_BEFORE_WRITES` messages are buffered.
+        :attr:`~can.SqliteWriter.MAX_BUFFER_SIZE_BEFORE_WRITES` messages are buffered
+        (or the current adaptive batch size in throughput mode).
 
     .. note:: The database schema is given in the documentation of the loggers.
 
@@ -128,19 +227,46 @@ class SqliteWriter(BaseIOHandler, BufferedReader):
     """Maximum number of seconds to wait between writes to the database"""
 
     MAX_BUFFER_SIZE_BEFORE_WRITES = 500
-    """Maximum number of messages to buffer before writing to the database"""
-
-    def __init__(self, file, table_name="messages"):
+    """Maximum number of messages to buffer before writing to the database,
+    which is the smallest batch size in throughput mode"""
+
+    MAX_BATCH_SIZE = 50000
+    """Largest number of messages per transaction in throughput mode"""
+
+    def __init__(
+        self,
+        file,
+        table_name="messages",
+        create_indexes=False,
+        throughput_mode=False,
+        max_buffer_size=0,
+        overflow="block",
+    ):
         """
         :param file: a `str` or since Python 3.7 a path like object that points
                      to the database file to use
         :param str table_name: the name of the table to store messages in
+        :param bool create_indexes: if set to `True`, indexes on the ``ts`` and
+                                    ``arbitration_id`` columns are created when
+                                    the writer is stopped. This speeds up
+                                    reading parts of the database with
+                                    :class:`~can.SqliteReader`.
+        :param bool throughput_mode: if set to `True`, the database is
+                                     optimized for writing many messages, see
+                                     above
+        :param int max_buffer_size: the maximum number of messages waiting to
+                                    be written, or ``0`` to buffer without limit
+        :param str overflow: what to do with new messages if the buffer is full,
+                             see :class:`~can.BufferedReader`
 
         .. warning:: In contrary to all other readers/writers the Sqlite handlers
                      do not accept file-like objects as the `file` parameter.
         """
-        super().__init__(file=None)
+        super().__init__(file=None, max_size=max_buffer_size, overflow=overflow)
         self.table_name = table_name
+        self.create_indexes = create_indexes
+        self.throughput_mode = throughput_mode
+        self._batch_size = self.MAX_BUFFER_SIZE_BEFORE_WRITES
         self._db_filename = file
         self._stop_running_event = threading.Event()
         self._conn = None
@@ -162,6 +288,10 @@ class SqliteWriter(BaseIOHandler, BufferedReader):
         log.debug("Creating sqlite database")
         self._conn = sqlite3.connect(self._db_filename)
 
+        if self.throughput_mode:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+
         # create table structure
         self._conn.cursor().execute(
             """
@@ -186,50 +316,77 @@ class SqliteWriter(BaseIOHandler, BufferedReader):
 
         try:
             while True:
-                messages = []  # reset buffer
-
-                msg = self.get_message(self.GET_MESSAGE_TIMEOUT)
-                while msg is not None:
-                    # log.debug("SqliteWriter: buffering message")
-
-                    messages.append(
-                        (
-                            msg.timestamp,
-                            msg.arbitration_id,
-                            msg.is_extended_id,
-                            msg.is_remote_frame,
-                            msg.is_error_frame,
-                            msg.dlc,
-                            memoryview(msg.data),
-                        )
-                    )
-
-                    if (
-                        time.time() - self.last_write > self.MAX_TIME_BETWEEN_WRITES
-                        or len(messages) > self.MAX_BUFFER_SIZE_BEFORE_WRITES
-                    ):
-                        break
-                    else:
-                        # just go on
-                        msg = self.get_message(self.GET_MESSAGE_TIMEOUT)
+                messages = self._get_batch()
 
                 count = len(messages)
                 if count > 0:
                     with self._conn:
                         # log.debug("Writing %d frames to db", count)
-                        self._conn.executemany(self._insert_template, messages)
-                        self._conn.commit()  # make the changes visible to the entire database
+                        self._conn.executemany(
+                            self._insert_template, map(_row_of_message, messages)
+                        )
                     self.num_frames += count
                     self.last_write = time.time()
 
-                # check if we are still supposed to run and go back up if yes
-                if self._stop_running_event.is_set():
+                # a full batch might leave more messages in the buffer
+                batch_full = count >= self._batch_size
+                if self.throughput_mode:
+                    self._adapt_batch_size(batch_full)
+
+                # check if we are still supposed to run and go back up if yes,
+                # but write out the remaining messages first
+                if self._stop_running_event.is_set() and not batch_full:
                     break
 
+            if self.create_indexes:
+                self._create_indexes()
+
         finally:
             self._conn.close()
             log.info("Stopped sqlite writer after writing %d messages", self.num_frames)
 
+    def _get_batch(self):
+        """Takes the next messages to write in one transaction out of the buffer.
+
+        :rtype: List[can.Message]
+        """
+        batch_size = self._batch_size
+        messages = self.get_messages(batch_size, self.GET_MESSAGE_TIMEOUT)
+        while (
+            messages
+            and len(messages) < batch_size
+            and time.time() - self.last_write <= self.MAX_TIME_BETWEEN_WRITES
+        ):
+            more_messages = self.get_messages(
+                batch_size - len(messages), self.GET_MESSAGE_TIMEOUT
+            )
+            if not more_messages:
+                break
+            messages += more_messages
+        return messages
+
+    def _adapt_batch_size(self, batch_full):
+        """Sizes the next batch after whether the last one was filled up."""
+        if batch_full:
+            # the messages arrive faster than they are written, so use larger
+            # transactions to catch up
+            self._batch_size = min(2 * self._batch_size, self.MAX_BATCH_SIZE)
+        else:
+            self._batch_size = max(
+                self._batch_size // 2, self.MAX_BUFFER_SIZE_BEFORE_WRITES
+            )
+
+    def _create_indexes(self):
+        """Creates the indexes on the timestamps and arbitration IDs."""
+        log.debug("Creating indexes of sqlite database")
+        with self._conn:
+            for column in ("ts", "arbitration_id"):
+                self._conn.execute(
+                    "CREATE INDEX IF NOT EXISTS {0}_{1} ON {0} ({1})".format(
+                        self.table_name, column
+                    )
+                )
+
     def stop(self):
         """Stops the reader an writes all remaining messages to the database. Thus, this
         might take a while and block.
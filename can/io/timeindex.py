@@ -0,0 +1,241 @@
+"""
+Sidecar time indexes for text log files like ``.asc``, ``.csv`` and ``.log``.
+
+An index stores the timestamp and the byte offset of every n-th line of a
+file. Since the files are sorted by time, a reader can use it to seek close to
+a requested start time instead of parsing all preceding lines. The index is
+stored next to the log file as JSON, like the index of
+:class:`~can.BLFReader`.
+"""
+
+import bisect
+import io
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+from ..typechecking import StringPathLike
+from .compression import split_suffix
+
+LOG = logging.getLogger(__name__)
+
+#: the version of the sidecar index files that are written
+INDEX_FORMAT_VERSION = 1
+
+#: the default number of lines between two entries of an index
+DEFAULT_STEP = 1000
+
+
+def _asc_timestamp(line: bytes) -> float:
+    return float(line.split(None, 1)[0])
+
+
+def _canutils_timestamp(line: bytes) -> float:
+    # e.g. b"(1600000000.000000) vcan0 123#00"
+    return float(line.split(None, 1)[0][1:-1])
+
+
+def _csv_timestamp(line: bytes) -> float:
+    return float(line.split(b",", 1)[0])
+
+
+#: the functions that parse the timestamp of a line as it is stored in a file
+#: of each format. They raise a :class:`ValueError` or an :class:`IndexError`
+#: for lines without a timestamp, like headers and comments.
+LINE_TIMESTAMP_PARSERS: Dict[str, Callable[[bytes], float]] = {
+    ".asc": _asc_timestamp,
+    ".csv": _csv_timestamp,
+    ".log": _canutils_timestamp,
+}
+
+
+class TimeIndex:
+    """The timestamps and byte offsets of some lines of a text log file.
+
+    The timestamps are the ones stored in the file, e.g. relative to the start
+    of the measurement for ASC files.
+    """
+
+    def __init__(
+        self,
+        timestamps: List[float],
+        offsets: List[int],
+        file_length: int,
+        step: int = DEFAULT_STEP,
+    ) -> None:
+        """
+        :param timestamps: the ascending timestamps of the indexed lines
+        :param offsets: the byte offsets of the indexed lines
+        :param file_length: the length of the indexed file in bytes, which is
+                            used to detect outdated indexes
+        :param step: the number of lines between two entries
+        """
+        self.timestamps = timestamps
+        self.offsets = offsets
+        self.file_length = file_length
+        self.step = step
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def offset_before(self, timestamp: float) -> Optional[int]:
+        """Looks up where to start reading to find the lines at a timestamp.
+
+        :param timestamp: the timestamp as it is stored in the file
+        :return: the offset of the last indexed line with an earlier timestamp
+                 or `None` if there is no such line
+        """
+        position = bisect.bisect_left(self.timestamps, timestamp)
+        return self.offsets[position - 1] if position else None
+
+    @classmethod
+    def build(
+        cls,
+        filename: StringPathLike,
+        file_format: Optional[str] = None,
+        step: int = DEFAULT_STEP,
+    ) -> "TimeIndex":
+        """Reads a log file once to build its index.
+
+        :param filename: the path of an uncompressed text log file
+        :param file_format: the suffix of the format of the file, which is
+                            taken from the file name by default
+        :param step: the number of lines between two entries
+        :raises ValueError: if the format cannot be indexed
+        """
+        if file_format is None:
+            file_format = split_suffix(filename)[0]
+        try:
+            parse = LINE_TIMESTAMP_PARSERS[file_format]
+        except KeyError:
+            raise ValueError(
+                f'Cannot build a time index for the format "{file_format}"'
+            ) from None
+
+        timestamps: List[float] = []
+        offsets: List[int] = []
+        offset = 0
+        # the number of lines until the next one is indexed
+        countdown = 0
+        with open(filename, "rb") as file:
+            for line in file:
+                if countdown <= 0:
+                    try:
+                        timestamp = parse(line)
+                    except (IndexError, ValueError):
+                        # try the next line instead
+                        pass
+                    else:
+                        # keep the index sorted even if the file is not
+                        if not timestamps or timestamp >= timestamps[-1]:
+                            timestamps.append(timestamp)
+                            offsets.append(offset)
+                        countdown = step
+                countdown -= 1
+                offset += len(line)
+
+        return cls(timestamps, offsets, offset, step)
+
+    @classmethod
+    def load(
+        cls, index_file: StringPathLike, filename: StringPathLike
+    ) -> Optional["TimeIndex"]:
+        """Loads the index of a log file from a sidecar file.
+
+        :param index_file: the path of the sidecar file
+        :param filename: the path of the indexed log file
+        :return: the index or `None` if the sidecar file does not exist or
+                 does not match the log file
+        """
+        try:
+            with open(index_file, "r", encoding="utf-8") as sidecar:
+                content: Dict[str, Any] = json.load(sidecar)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            LOG.warning("Ignoring the malformed index file %s", index_file)
+            return None
+
+        if content.get("version") != INDEX_FORMAT_VERSION or content.get(
+            "file_length"
+        ) != os.path.getsize(filename):
+            LOG.info("The index file %s is outdated", index_file)
+            return None
+
+        return cls(
+            content["timestamps"],
+            content["offsets"],
+            content["file_length"],
+            content["step"],
+        )
+
+    def save(self, index_file: StringPathLike) -> None:
+        """Stores the index in a sidecar file.
+
+        :param index_file: the path of the sidecar file
+        """
+        content = {
+            "version": INDEX_FORMAT_VERSION,
+            "file_length": self.file_length,
+            "step": self.step,
+            "timestamps": self.timestamps,
+            "offsets": self.offsets,
+        }
+        try:
+            with open(index_file, "w", encoding="utf-8") as sidecar:
+                json.dump(content, sidecar)
+        except OSError as error:
+            LOG.warning("Could not write the index file %s: %s", index_file, error)
+
+
+def build_time_index(
+    filename: StringPathLike,
+    index_file: Optional[StringPathLike] = None,
+    step: int = DEFAULT_STEP,
+) -> TimeIndex:
+    """Builds the index of a text log file and stores it in a sidecar file.
+
+    :param filename: the path of an uncompressed ``.asc``, ``.csv`` or
+                     ``.log`` file
+    :param index_file: the path of the sidecar file, which is the path of the
+                       log file with an additional ``.idx`` suffix by default
+    :param step: the number of lines between two entries
+    :return: the new index
+    :raises ValueError: if the format cannot be indexed
+    """
+    index = TimeIndex.build(filename, step=step)
+    index.save(index_file if index_file is not None else f"{filename}.idx")
+    return index
+
+
+def seek_offset(
+    file: Any,
+    index_file: StringPathLike,
+    file_format: str,
+    timestamp: float,
+) -> Optional[int]:
+    """Looks up where a reader may start to read a file to find a timestamp.
+
+    The index is loaded from the sidecar file. If it does not exist or is
+    outdated, it is built and stored there.
+
+    :param file: the text file object of the reader
+    :param index_file: the path of the sidecar file
+    :param file_format: the suffix of the format of the file
+    :param timestamp: the timestamp as it is stored in the file
+    :return: the offset of a line before the first one at the timestamp or
+             `None` if reading has to start at the beginning, e.g. because the
+             file is not a plain file on disk, but compressed or in memory
+    """
+    filename = getattr(file, "name", None)
+    if not isinstance(filename, (str, os.PathLike)) or not isinstance(
+        getattr(file, "buffer", None), io.BufferedReader
+    ):
+        return None
+
+    index = TimeIndex.load(index_file, filename)
+    if index is None:
+        index = TimeIndex.build(filename, file_format)
+        index.save(index_file)
+    return index.offset_before(timestamp)
@@ -3,11 +3,14 @@ This module contains the implementation of `can.Listener` and some readers.
 """
 
 import sys
+import threading
 import warnings
-from typing import Any, AsyncIterator, Awaitable, Optional
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Deque, List, Optional, Union
 
 from can.message import Message
 from can.bus import BusABC
+from can.typechecking import OverflowPolicy
 
 from abc import ABCMeta, abstractmethod
 
@@ -32,6 +35,8 @@ class Listener(metaclass=ABCMeta):
         listener(msg)
         # or
         listener.on_message_received(msg)
+        # or pass several messages at once
+        listener.on_messages_received([msg])
 
         # Important to ensure all outputs are flushed
         listener.stop()
@@ -44,6 +49,21 @@ class Listener(metaclass=ABCMeta):
         :param msg: the delivered message
         """
 
+    def on_messages_received(self, msgs: List[Message]) -> None:
+        """This method is called to handle several messages at once, in the
+        order they were received.
+
+        The default implementation calls :meth:`on_message_received` for each
+        of them. Listeners that can handle a batch more efficiently than the
+        individual messages, like writers to files, should override it.
+        :class:`can.Notifier` calls this method on listeners that override it
+        and :meth:`on_message_received` on all other ones.
+
+        :param msgs: the delivered messages
+        """
+        for msg in msgs:
+            self.on_message_received(msg)
+
     def __call__(self, msg: Message) -> None:
         self.on_message_received(msg)
 
@@ -74,6 +94,12 @@ class RedirectReader(Listener):
     def on_message_received(self, msg: Message) -> None:
         self.bus.send(msg)
 
+    def on_messages_received(self, msgs: List[Message]) -> None:
+        while msgs:
+            # this raises if not even a single message could be sent
+            sent = self.bus.send_batch(msgs)
+            msgs = msgs[sent:]
+
 
 class BufferedReader(Listener):
     """
@@ -81,18 +107,54 @@ class BufferedReader(Listener):
     **message buffer**: that is, when the :class:`can.BufferedReader` instance is
     notified of a new message it pushes it into a queue of messages waiting to
     be serviced. The messages can then be fetched with
-    :meth:`~can.BufferedReader.get_message`.
+    :meth:`~can.BufferedReader.get_message` or in bulk with
+    :meth:`~can.BufferedReader.get_messages`.
+
+    By default, the buffer grows without limit. If a `max_size` is given,
+    the `overflow` policy decides what happens to messages that arrive while
+    the buffer is full:
+
+    - ``"block"`` waits until the consumer made room, which in turn stalls
+      whoever delivers the messages, e.g. the thread of a :class:`~can.Notifier`,
+    - ``"drop_oldest"`` discards the oldest buffered message to make room and
+    - ``"drop_newest"`` discards the new message.
 
     Putting in messages after :meth:`~can.BufferedReader.stop` has been called will raise
     an exception, see :meth:`~can.BufferedReader.on_message_received`.
 
     :attr is_stopped: ``True`` if the reader has been stopped
+    :attr high_water_mark: the largest number of messages that were buffered at once
+    :attr dropped_messages: the number of messages that were discarded because
+                            the buffer was full
     """
 
-    def __init__(self) -> None:
-        # set to "infinite" size
-        self.buffer: SimpleQueue[Message] = SimpleQueue()
+    def __init__(self, max_size: int = 0, overflow: OverflowPolicy = "block") -> None:
+        """
+        :param max_size: The maximum number of buffered messages, or ``0`` for
+                         an unbounded buffer.
+        :param overflow: What to do with new messages if the buffer is full,
+                         one of ``"block"``, ``"drop_oldest"`` and ``"drop_newest"``.
+        :raises ValueError: if the overflow policy is unknown
+        """
+        if overflow not in ("block", "drop_oldest", "drop_newest"):
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+
+        self.max_size = max_size
+        self.overflow = overflow
         self.is_stopped: bool = False
+        self.high_water_mark = 0
+        self.dropped_messages = 0
+
+        # the unbounded buffer does without a lock, which is only needed to
+        # enforce the bound and the overflow policy
+        self.buffer: Union["SimpleQueue[Message]", Deque[Message]]
+        if max_size > 0:
+            self.buffer = deque()
+            lock = threading.Lock()
+            self._not_empty = threading.Condition(lock)
+            self._not_full = threading.Condition(lock)
+        else:
+            self.buffer = SimpleQueue()
 
     def on_message_received(self, msg: Message) -> None:
         """Append a message to the buffer.
@@ -100,10 +162,58 @@ class BufferedReader(Listener):
         :raises: BufferError
             if the reader has already been stopped
         """
+        buffer = self.buffer
+        if isinstance(buffer, deque):
+            self.on_messages_received([msg])
+            return
+
         if self.is_stopped:
             raise RuntimeError("reader has already been stopped")
-        else:
-            self.buffer.put(msg)
+        buffer.put(msg)
+        size = buffer.qsize()
+        if size > self.high_water_mark:
+            self.high_water_mark = size
+
+    def on_messages_received(self, msgs: List[Message]) -> None:
+        """Append several messages to the buffer at once.
+
+        :raises: BufferError
+            if the reader has already been stopped
+        """
+        buffer = self.buffer
+        if not isinstance(buffer, deque):
+            if self.is_stopped:
+                raise RuntimeError("reader has already been stopped")
+            for msg in msgs:
+                buffer.put(msg)
+            self.high_water_mark = max(self.high_water_mark, buffer.qsize())
+            return
+
+        max_size = self.max_size
+        with self._not_full:
+            if self.is_stopped:
+                raise RuntimeError("reader has already been stopped")
+
+            for msg in msgs:
+                if len(buffer) >= max_size:
+                    if self.overflow == "drop_newest":
+                        self.dropped_messages += 1
+                        continue
+                    if self.overflow == "drop_oldest":
+                        buffer.popleft()
+                        self.dropped_messages += 1
+                    else:
+                        # let the consumers catch up
+                        self._not_empty.notify_all()
+                        while len(buffer) >= max_size:
+                            self._not_full.wait()
+                            if self.is_stopped:
+                                raise RuntimeError("reader has already been stopped")
+
+                buffer.append(msg)
+
+            self.high_water_mark = max(self.high_water_mark, len(buffer))
+            self._not_empty.notify_all()
 
     def get_message(self, timeout: float = 0.5) -> Optional[Message]:
         """
@@ -115,14 +225,66 @@ class BufferedReader(Listener):
         :param timeout: The number of seconds to wait for a new message.
         :return: the Message if there is one, or None if there is not.
         """
+        buffer = self.buffer
+        if isinstance(buffer, deque):
+            msgs = self.get_messages(1, timeout)
+            return msgs[0] if msgs else None
+
         try:
-            return self.buffer.get(block=not self.is_stopped, timeout=timeout)
+            return buffer.get(block=not self.is_stopped, timeout=timeout)
         except Empty:
             return None
 
+    def get_messages(
+        self, max_messages: Optional[int] = None, timeout: Optional[float] = 0.5
+    ) -> List[Message]:
+        """
+        Retrieves the oldest buffered messages at once. If no message is
+        available it blocks for the given timeout or until a message is
+        received. Like :meth:`~can.BufferedReader.get_message`, this method
+        does not block after :meth:`can.BufferedReader.stop` has been called.
+
+        :param max_messages: The maximum number of messages to return, or
+                             ``None`` to return all buffered messages.
+        :param timeout: The number of seconds to wait for a new message, or
+                        ``None`` to wait indefinitely.
+        :return: The messages in the order they were received, which is an
+                 empty list if the timeout expired.
+        """
+        buffer = self.buffer
+        if not isinstance(buffer, deque):
+            try:
+                msgs = [buffer.get(block=not self.is_stopped, timeout=timeout)]
+            except Empty:
+                return []
+            while max_messages is None or len(msgs) < max_messages:
+                try:
+                    msgs.append(buffer.get_nowait())
+                except Empty:
+                    break
+            return msgs
+
+        with self._not_empty:
+            self._not_empty.wait_for(lambda: buffer or self.is_stopped, timeout)
+            count = len(buffer)
+            if max_messages is not None:
+                count = min(count, max_messages)
+            msgs = [buffer.popleft() for _ in range(count)]
+            if msgs:
+                self._not_full.notify_all()
+            return msgs
+
     def stop(self) -> None:
         """Prohibits any more additions to this reader."""
-        self.is_stopped = True
+        if not isinstance(self.buffer, deque):
+            self.is_stopped = True
+            return
+
+        with self._not_full:
+            self.is_stopped = True
+            # wake up everyone who is waiting, since nobody has to wait anymore
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
 
 
 class AsyncBufferedReader(Listener):
@@ -134,10 +296,34 @@ class AsyncBufferedReader(Listener):
 
         async for msg in reader:
             print(msg)
+
+    Like :class:`~can.BufferedReader`, the buffer may be bounded. Since the
+    event loop must never be blocked, it can only drop messages on overflow.
+
+    :attr high_water_mark: the largest number of messages that were buffered at once
+    :attr dropped_messages: the number of messages that were discarded because
+                            the buffer was full
     """
 
-    def __init__(self, **kwargs: Any) -> None:
+    def __init__(
+        self, max_size: int = 0, overflow: OverflowPolicy = "drop_oldest", **kwargs: Any
+    ) -> None:
+        """
+        :param max_size: The maximum number of buffered messages, or ``0`` for
+                         an unbounded buffer.
+        :param overflow: What to do with new messages if the buffer is full,
+                         either ``"drop_oldest"`` or ``"drop_newest"``.
+        :raises ValueError: if the overflow policy is unknown or ``"block"``
+        """
+        if overflow not in ("drop_oldest", "drop_newest"):
+            raise ValueError(
+                f"Unsupported overflow policy for an asyncio buffer: {overflow}"
+            )
+
         self.buffer: "asyncio.Queue[Message]"
+        self.overflow = overflow
+        self.high_water_mark = 0
+        self.dropped_messages = 0
 
         if "loop" in kwargs.keys():
             warnings.warn(
@@ -146,17 +332,34 @@ class AsyncBufferedReader(Listener):
                 DeprecationWarning,
             )
             if sys.version_info < (3, 10):
-                self.buffer = asyncio.Queue(loop=kwargs["loop"])
+                self.buffer = asyncio.Queue(max_size, loop=kwargs["loop"])
                 return
 
-        self.buffer = asyncio.Queue()
+        self.buffer = asyncio.Queue(max_size)
 
     def on_message_received(self, msg: Message) -> None:
         """Append a message to the buffer.
 
         Must only be called inside an event loop!
         """
-        self.buffer.put_nowait(msg)
+        buffer = self.buffer
+        if buffer.full():
+            if self.overflow == "drop_newest":
+                self.dropped_messages += 1
+                return
+            buffer.get_nowait()
+            self.dropped_messages += 1
+
+        buffer.put_nowait(msg)
+        self.high_water_mark = max(self.high_water_mark, buffer.qsize())
+
+    def on_messages_received(self, msgs: List[Message]) -> None:
+        """Append several messages to the buffer at once.
+
+        Must only be called inside an event loop!
+        """
+        for msg in msgs:
+            self.on_message_received(msg)
 
     async def get_message(self) -> Message:
         """
@@ -168,6 +371,25 @@ class AsyncBufferedReader(Listener):
         """
         return await self.buffer.get()
 
+    async def get_messages(self, max_messages: Optional[int] = None) -> List[Message]:
+        """
+        Retrieve the oldest buffered messages at once when awaited for,
+        waiting for at least one::
+
+            msgs = await reader.get_messages()
+
+        :param max_messages: The maximum number of messages to return, or
+                             ``None`` to return all buffered messages.
+        :return: The CAN messages in the order they were received.
+        """
+        msgs = [await self.buffer.get()]
+        count = self.buffer.qsize()
+        if max_messages is not None:
+            count = min(count, max_messages - 1)
+        for _ in range(count):
+            msgs.append(self.buffer.get_nowait())
+        return msgs
+
     def __aiter__(self) -> AsyncIterator[Message]:
         return self
 
@@ -0,0 +1,94 @@
+"""
+Merges several log files into a single one, which is ordered by timestamp.
+
+The log files may be of different formats, but each of them has to be sorted
+by time. The messages are streamed, so the log files may be arbitrarily large.
+"""
+
+import sys
+import argparse
+import errno
+from typing import cast, Iterable, List, Optional, Union
+
+from can import Logger, MergedLogReader, Message, Printer
+
+
+def _parse_channels(channels: str) -> List[Union[int, str]]:
+    return [
+        int(channel) if channel.isdigit() else channel
+        for channel in channels.split(",")
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Merge log files into a single one ordered by timestamp."
+    )
+
+    parser.add_argument(
+        "-f",
+        "--file_name",
+        dest="log_file",
+        help="""Path and base log filename of the merged log, for supported types see can.Logger.
+                If omitted, the messages are printed to stdout.""",
+        default=None,
+    )
+
+    parser.add_argument(
+        "-c",
+        "--channels",
+        type=_parse_channels,
+        help="""Comma separated channels to set on the messages of the input
+                files, in the same order as the input files, e.g. 0,1. By
+                default, the channels are kept as they were logged.""",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--start",
+        type=float,
+        help="<s> only merge messages with a timestamp at or after this one",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--end",
+        type=float,
+        help="<s> only merge messages with a timestamp at or before this one",
+        default=None,
+    )
+
+    parser.add_argument(
+        "infiles",
+        metavar="input-file",
+        type=str,
+        nargs="+",
+        help="The files to merge. For supported types see can.LogReader.",
+    )
+
+    # print help message when no arguments were given
+    if len(sys.argv) < 2:
+        parser.print_help(sys.stderr)
+        raise SystemExit(errno.EINVAL)
+
+    results = parser.parse_args()
+
+    channels: Optional[List[Union[int, str]]] = results.channels
+    if channels is not None and len(channels) != len(results.infiles):
+        parser.error("the number of channels must match the number of input files")
+
+    with MergedLogReader(
+        results.infiles, channels=channels, start=results.start, end=results.end
+    ) as reader:
+        if results.log_file is None:
+            writer = Printer()
+        else:
+            writer = Logger(results.log_file)  # type: ignore
+
+        with writer:
+            for msg in cast(Iterable[Message], reader):
+                writer.on_message_received(msg)
+
+
+if __name__ == "__main__":
+    main()
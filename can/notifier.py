@@ -2,7 +2,7 @@
 This module contains the implementation of :class:`~can.Notifier`.
 """
 
-from typing import Any, cast, Iterable, List, Optional, Union, Awaitable
+from typing import Any, cast, Iterable, List, Optional, Tuple, Union, Awaitable
 
 from can.bus import BusABC
 from can.listener import Listener
@@ -10,12 +10,25 @@ from can.message import Message
 
 import threading
 import logging
+import selectors
+import socket
 import time
 import asyncio
 
 logger = logging.getLogger("can.Notifier")
 
 
+def _handles_batches(listener: Any) -> bool:
+    """Checks whether the listener implements its own
+    :meth:`~can.Listener.on_messages_received`.
+
+    The default implementation is not used by the notifier, since it ignores
+    what :meth:`~can.Listener.on_message_received` returns, like coroutines.
+    """
+    handler = getattr(type(listener), "on_messages_received", None)
+    return handler is not None and handler is not Listener.on_messages_received
+
+
 class Notifier:
     def __init__(
         self,
@@ -23,6 +36,8 @@ class Notifier:
         listeners: Iterable[Listener],
         timeout: float = 1.0,
         loop: Optional[asyncio.AbstractEventLoop] = None,
+        use_selector: bool = False,
+        max_batch_size: int = 64,
     ) -> None:
         """Manages the distribution of :class:`can.Message` instances to listeners.
 
@@ -38,11 +53,30 @@ class Notifier:
         :param listeners: An iterable of :class:`~can.Listener`
         :param timeout: An optional maximum number of seconds to wait for any message.
         :param loop: An :mod:`asyncio` event loop to schedule listeners in.
+        :param use_selector:
+            If no `loop` is given, every bus is by default read in a thread of
+            its own. If this is `True`, all buses that provide a file
+            descriptor via :meth:`~can.BusABC.fileno` are instead read by a
+            single thread, which waits for all of them at once using
+            :mod:`selectors`. This is more efficient for many buses.
+            Buses without a file descriptor still get a thread of their own.
+        :param max_batch_size:
+            The maximum number of messages that are read from a bus at once
+            and then handed to the listeners, for example each time the
+            `loop` is woken up because a bus has messages. This keeps a single
+            busy bus from stalling the event loop.
         """
         self.listeners: List[Listener] = list(listeners)
         self.bus = bus
         self.timeout = timeout
         self._loop = loop
+        self._use_selector = use_selector
+        self.max_batch_size = max_batch_size
+
+        # created once the first bus is read by the selector thread
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._selector_thread: Optional[threading.Thread] = None
+        self._wakeup_sockets: Optional[Tuple[socket.socket, socket.socket]] = None
 
         #: Exception raised in thread
         self.exception: Optional[Exception] = None
@@ -72,6 +106,9 @@ class Notifier:
             # Use bus file descriptor to watch for messages
             self._loop.add_reader(reader, self._on_message_available, bus)
             self._readers.append(reader)
+        elif self._use_selector and reader >= 0 and self._add_to_selector(bus):
+            # The bus is read by the selector thread
+            pass
         else:
             reader_thread = threading.Thread(
                 target=self._rx_thread,
@@ -82,6 +119,45 @@ class Notifier:
             reader_thread.start()
             self._readers.append(reader_thread)
 
+    def _add_to_selector(self, bus: BusABC) -> bool:
+        """Registers the bus with the selector thread, which is started on
+        first use.
+
+        :returns: ``False`` if the file descriptor of the bus cannot be
+                  watched by the selector, e.g. a serial port on Windows.
+        """
+        if self._selector is None:
+            self._selector = selectors.DefaultSelector()
+            # allows stop() to interrupt waiting for the buses
+            self._wakeup_sockets = socket.socketpair()
+            for wakeup_socket in self._wakeup_sockets:
+                wakeup_socket.setblocking(False)
+            self._selector.register(self._wakeup_sockets[0], selectors.EVENT_READ)
+
+        try:
+            self._selector.register(bus.fileno(), selectors.EVENT_READ, bus)
+        except (OSError, ValueError) as error:
+            logger.debug(
+                'Cannot select on bus "%s", using a thread instead: %s',
+                bus.channel_info,
+                error,
+            )
+            return False
+
+        if self._selector_thread is None:
+            self._selector_thread = threading.Thread(
+                target=self._rx_selector_thread,
+                name="can.notifier for buses with a file descriptor",
+            )
+            self._selector_thread.daemon = True
+            self._selector_thread.start()
+            self._readers.append(self._selector_thread)
+        else:
+            # make the thread pick up the new bus right away
+            self._wake_selector_thread()
+
+        return True
+
     def stop(self, timeout: float = 5) -> None:
         """Stop notifying Listeners when new :class:`~can.Message` objects arrive
         and call :meth:`~can.Listener.stop` on each Listener.
@@ -91,6 +167,7 @@ class Notifier:
             Should be longer than timeout given at instantiation.
         """
         self._running = False
+        self._wake_selector_thread()
         end_time = time.time() + timeout
         for reader in self._readers:
             if isinstance(reader, threading.Thread):
@@ -100,23 +177,28 @@ class Notifier:
             elif self._loop:
                 # reader is a file descriptor
                 self._loop.remove_reader(reader)
+        if self._selector_thread is not None and not self._selector_thread.is_alive():
+            self._close_selector()
         for listener in self.listeners:
             if hasattr(listener, "stop"):
                 listener.stop()
 
     def _rx_thread(self, bus: BusABC) -> None:
-        msg = None
+        msgs: List[Message] = []
         try:
             while self._running:
-                if msg is not None:
+                if msgs:
                     with self._lock:
                         if self._loop is not None:
+                            # schedule a single callback for the whole batch
                             self._loop.call_soon_threadsafe(
-                                self._on_message_received, msg
+                                self._on_messages_received, msgs
                             )
                         else:
-                            self._on_message_received(msg)
-                msg = bus.recv(self.timeout)
+                            self._on_messages_received(msgs)
+                msgs = bus.recv_batch(
+                    max_messages=self.max_batch_size, timeout=self.timeout
+                )
         except Exception as exc:  # pylint: disable=broad-except
             self.exception = exc
             if self._loop is not None:
@@ -130,17 +212,82 @@ class Notifier:
                 # It was handled, so only log it
                 logger.info("suppressed exception: %s", exc)
 
+    def _rx_selector_thread(self) -> None:
+        selector = cast(selectors.BaseSelector, self._selector)
+        while self._running:
+            for key, _ in selector.select(self.timeout):
+                bus = cast(Optional[BusABC], key.data)
+                if bus is None:
+                    self._drain_wakeup_socket()
+                    continue
+
+                try:
+                    # only take what is already there, so that no bus can
+                    # delay the others
+                    msgs = bus.recv_batch(max_messages=self.max_batch_size, timeout=0)
+                    if msgs:
+                        with self._lock:
+                            self._on_messages_received(msgs)
+                except Exception as exc:  # pylint: disable=broad-except
+                    # stop reading this bus, like its own thread would end
+                    selector.unregister(key.fileobj)
+                    self.exception = exc
+                    if self._on_error(exc):
+                        logger.info("suppressed exception: %s", exc)
+                    else:
+                        logger.exception(
+                            'Stopped reading from bus "%s"', bus.channel_info
+                        )
+
+    def _wake_selector_thread(self) -> None:
+        if self._wakeup_sockets is not None:
+            try:
+                self._wakeup_sockets[1].send(b"\0")
+            except OSError:
+                # the socket buffer is full, so a wakeup is pending anyway
+                pass
+
+    def _drain_wakeup_socket(self) -> None:
+        wakeup_socket = cast(Tuple[socket.socket, socket.socket], self._wakeup_sockets)
+        try:
+            while wakeup_socket[0].recv(4096):
+                pass
+        except OSError:
+            pass
+
+    def _close_selector(self) -> None:
+        if self._selector is not None:
+            self._selector.close()
+        for wakeup_socket in self._wakeup_sockets or ():
+            wakeup_socket.close()
+
     def _on_message_available(self, bus: BusABC) -> None:
-        msg = bus.recv(0)
-        if msg is not None:
-            self._on_message_received(msg)
+        # take everything that is available, but give other callbacks a chance
+        # to run before continuing with the rest
+        msgs = bus.recv_batch(max_messages=self.max_batch_size, timeout=0)
+        if msgs:
+            self._on_messages_received(msgs)
+
+    def _on_messages_received(self, msgs: List[Message]) -> None:
+        for callback in self.listeners:
+            if _handles_batches(callback):
+                self._schedule_if_coroutine(
+                    cast(Optional[Awaitable[Any]], callback.on_messages_received(msgs))
+                )
+            else:
+                for msg in msgs:
+                    self._schedule_if_coroutine(
+                        cast(Optional[Awaitable[Any]], callback(msg))
+                    )
 
     def _on_message_received(self, msg: Message) -> None:
         for callback in self.listeners:
-            res = cast(Union[None, Optional[Awaitable[Any]]], callback(msg))
-            if res is not None and self._loop is not None and asyncio.iscoroutine(res):
-                # Schedule coroutine
-                self._loop.create_task(res)
+            self._schedule_if_coroutine(cast(Optional[Awaitable[Any]], callback(msg)))
+
+    def _schedule_if_coroutine(self, res: Optional[Awaitable[Any]]) -> None:
+        if res is not None and self._loop is not None and asyncio.iscoroutine(res):
+            # Schedule coroutine
+            self._loop.create_task(res)
 
     def _on_error(self, exc: Exception) -> bool:
         """Calls ``on_error()`` for all listeners if they implement it.
@@ -11,7 +11,7 @@ from datetime import datetime
 import errno
 from typing import cast, Iterable
 
-from can import LogReader, Message, MessageSync
+from can import CanOperationError, LogReader, Message, MessageSync
 
 from .logger import _create_base_argument_parser, _create_bus
 
@@ -97,12 +97,21 @@ def main() -> None:
             print(f"Can LogReader (Started on {datetime.now()})")
 
             try:
-                for message in in_sync:
-                    if message.is_error_frame and not error_frames:
-                        continue
+                # messages that are due at the same time are sent at once
+                for batch in in_sync.iter_batches():
+                    if not error_frames:
+                        batch = [msg for msg in batch if not msg.is_error_frame]
                     if verbosity >= 3:
-                        print(message)
-                    bus.send(message)
+                        for message in batch:
+                            print(message)
+                    while batch:
+                        sent = bus.send_batch(batch)
+                        if not sent:
+                            # do not retry forever if the bus makes no progress
+                            raise CanOperationError(
+                                f"The bus did not send any of {len(batch)} messages"
+                            )
+                        batch = batch[sent:]
             except KeyboardInterrupt:
                 pass
 
@@ -38,3 +38,6 @@ AutoDetectedConfig = typing_extensions.TypedDict(
 )
 
 ReadableBytesLike = typing.Union[bytes, bytearray, memoryview]
+
+# What to do with new messages if a bounded buffer is full
+OverflowPolicy = typing_extensions.Literal["block", "drop_oldest", "drop_newest"]
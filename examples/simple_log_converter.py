@@ -3,6 +3,7 @@
 """
 Use this to convert .can/.asc files to .log files.
 Can be easily adapted for all sorts of files.
+See :mod:`can.convert` for a faster converter with more options.
 
 Usage: python3 simple_log_convert.py sourceLog.asc targetLog.log
 """
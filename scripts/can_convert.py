@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+
+"""
+See :mod:`can.convert`.
+"""
+
+from can.convert import main
+
+
+if __name__ == "__main__":
+    main()
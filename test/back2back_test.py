@@ -212,6 +212,72 @@ class Back2BackTestCase(unittest.TestCase):
         finally:
             bus3.shutdown()
 
+    def test_recv_batch(self):
+        sent_msgs = [
+            can.Message(is_extended_id=False, arbitration_id=0x400 + i, data=[i])
+            for i in range(5)
+        ]
+        for msg in sent_msgs:
+            self.bus2.send(msg)
+        # Some buses may receive their own messages. Remove them from the queue
+        self.bus2.recv_batch(timeout=0)
+
+        recv_msgs = []
+        start = time()
+        while len(recv_msgs) < len(sent_msgs) and time() - start < 1.0:
+            recv_msgs += self.bus1.recv_batch(max_messages=10, timeout=self.TIMEOUT)
+        self.assertEqual(len(recv_msgs), len(sent_msgs))
+        for recv_msg, sent_msg in zip(recv_msgs, sent_msgs):
+            self._check_received_message(recv_msg, sent_msg)
+
+    def test_recv_batch_max_messages(self):
+        for i in range(3):
+            self.bus2.send(can.Message(arbitration_id=0x500 + i))
+        sleep(0.05)
+
+        first = self.bus1.recv_batch(max_messages=2, timeout=self.TIMEOUT)
+        self.assertGreaterEqual(len(first), 1)
+        self.assertLessEqual(len(first), 2)
+        rest = self.bus1.recv_batch(max_messages=10, timeout=self.TIMEOUT)
+        self.assertEqual(
+            [msg.arbitration_id for msg in first + rest], [0x500, 0x501, 0x502]
+        )
+
+        with self.assertRaises(ValueError):
+            self.bus1.recv_batch(max_messages=0)
+
+    def test_recv_batch_no_message(self):
+        self.assertEqual(self.bus1.recv_batch(timeout=0.1), [])
+
+    def test_recv_batch_filtered(self):
+        self.bus1.set_filters([{"can_id": 0x600, "can_mask": 0x7FF}])
+        for arbitration_id in (0x601, 0x600, 0x602, 0x600):
+            self.bus2.send(can.Message(arbitration_id=arbitration_id))
+        sleep(0.05)
+
+        recv_msgs = []
+        while True:
+            msgs = self.bus1.recv_batch(timeout=self.TIMEOUT)
+            if not msgs:
+                break
+            recv_msgs += msgs
+        self.assertEqual([msg.arbitration_id for msg in recv_msgs], [0x600, 0x600])
+
+    def test_send_batch(self):
+        sent_msgs = [
+            can.Message(is_extended_id=True, arbitration_id=0x700 + i, data=[i] * i)
+            for i in range(8)
+        ]
+        self.assertEqual(self.bus2.send_batch(sent_msgs), len(sent_msgs))
+        # Some buses may receive their own messages. Remove them from the queue
+        self.bus2.recv_batch(timeout=0)
+
+        for sent_msg in sent_msgs:
+            self._check_received_message(self.bus1.recv(self.TIMEOUT), sent_msg)
+
+    def test_send_batch_empty(self):
+        self.assertEqual(self.bus1.send_batch([]), 0)
+
     def test_fd_message(self):
         msg = can.Message(
             is_fd=True, is_extended_id=True, arbitration_id=0x56789, data=[0xFF] * 64
@@ -59,3 +59,5 @@ IS_PYPY = platform.python_implementation() == "PyPy"
 TEST_CAN_FD = True
 
 TEST_INTERFACE_SOCKETCAN = IS_LINUX and env("TEST_SOCKETCAN")
+
+TEST_BENCHMARKS = env("TEST_BENCHMARKS")
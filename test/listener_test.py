@@ -7,6 +7,8 @@ import unittest
 import random
 import logging
 import tempfile
+import threading
+import time
 import os
 import warnings
 from os.path import join, dirname
@@ -109,6 +111,7 @@ class ListenerTest(BusTest):
 
         test_filetype_to_instance(".asc", can.ASCReader)
         test_filetype_to_instance(".blf", can.BLFReader)
+        test_filetype_to_instance(".canc", can.ColumnarReader)
         test_filetype_to_instance(".csv", can.CSVReader)
         test_filetype_to_instance(".db", can.SqliteReader)
         test_filetype_to_instance(".log", can.CanutilsLogReader)
@@ -134,6 +137,7 @@ class ListenerTest(BusTest):
 
         test_filetype_to_instance(".asc", can.ASCWriter)
         test_filetype_to_instance(".blf", can.BLFWriter)
+        test_filetype_to_instance(".canc", can.ColumnarWriter)
         test_filetype_to_instance(".csv", can.CSVWriter)
         test_filetype_to_instance(".db", can.SqliteWriter)
         test_filetype_to_instance(".log", can.CanutilsLogWriter)
@@ -157,6 +161,137 @@ class ListenerTest(BusTest):
         self.assertIsNotNone(a_listener.get_message(0.1))
 
 
+class BufferedReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.msgs = [can.Message(arbitration_id=i) for i in range(10)]
+
+    def _ids(self, msgs):
+        return [msg.arbitration_id for msg in msgs]
+
+    def test_get_messages(self):
+        reader = can.BufferedReader()
+        reader.on_messages_received(self.msgs)
+        self.assertEqual(reader.get_messages(4, timeout=0), self.msgs[:4])
+        self.assertEqual(reader.get_messages(timeout=0), self.msgs[4:])
+        self.assertEqual(reader.get_messages(timeout=0.01), [])
+        self.assertEqual(reader.high_water_mark, 10)
+        self.assertEqual(reader.dropped_messages, 0)
+
+    def test_get_messages_one_by_one(self):
+        reader = can.BufferedReader()
+        for msg in self.msgs:
+            reader(msg)
+        self.assertEqual(reader.get_messages(4, timeout=0), self.msgs[:4])
+        reader.stop()
+        self.assertEqual(reader.get_messages(timeout=None), self.msgs[4:])
+        self.assertEqual(reader.get_messages(timeout=None), [])
+        self.assertEqual(reader.high_water_mark, 10)
+        with self.assertRaises(RuntimeError):
+            reader(self.msgs[0])
+
+    def test_get_messages_waits(self):
+        reader = can.BufferedReader()
+        threading.Timer(0.05, reader.on_message_received, [self.msgs[0]]).start()
+        self.assertEqual(reader.get_messages(timeout=5), self.msgs[:1])
+
+    def test_drop_oldest(self):
+        reader = can.BufferedReader(max_size=4, overflow="drop_oldest")
+        for msg in self.msgs:
+            reader(msg)
+        self.assertEqual(self._ids(reader.get_messages(timeout=0)), [6, 7, 8, 9])
+        self.assertEqual(reader.dropped_messages, 6)
+        self.assertEqual(reader.high_water_mark, 4)
+
+    def test_drop_newest(self):
+        reader = can.BufferedReader(max_size=4, overflow="drop_newest")
+        reader.on_messages_received(self.msgs)
+        self.assertEqual(self._ids(reader.get_messages(timeout=0)), [0, 1, 2, 3])
+        self.assertEqual(reader.dropped_messages, 6)
+
+    def test_block(self):
+        reader = can.BufferedReader(max_size=4)
+        producer = threading.Thread(
+            target=reader.on_messages_received, args=(self.msgs,)
+        )
+        producer.start()
+
+        received = []
+        while len(received) < len(self.msgs):
+            received += reader.get_messages(3, timeout=5)
+        producer.join(5)
+
+        self.assertEqual(received, self.msgs)
+        self.assertEqual(reader.dropped_messages, 0)
+        self.assertLessEqual(reader.high_water_mark, 4)
+
+    def test_stop_releases_blocked_producer(self):
+        reader = can.BufferedReader(max_size=1)
+        reader(self.msgs[0])
+        errors = []
+
+        def produce():
+            try:
+                reader(self.msgs[1])
+            except RuntimeError as error:
+                errors.append(error)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        time.sleep(0.05)
+        reader.stop()
+        producer.join(5)
+        self.assertFalse(producer.is_alive())
+        self.assertEqual(len(errors), 1)
+        # buffered messages can still be fetched without blocking
+        self.assertEqual(reader.get_messages(timeout=None), self.msgs[:1])
+        self.assertEqual(reader.get_messages(timeout=None), [])
+
+    def test_unknown_overflow_policy(self):
+        with self.assertRaises(ValueError):
+            can.BufferedReader(max_size=1, overflow="crash")
+
+
+class AsyncBufferedReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.msgs = [can.Message(arbitration_id=i) for i in range(10)]
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_get_messages(self):
+        async def run():
+            reader = can.AsyncBufferedReader()
+            reader.on_messages_received(self.msgs)
+            self.assertEqual(await reader.get_messages(4), self.msgs[:4])
+            self.assertEqual(await reader.get_messages(), self.msgs[4:])
+
+        self.loop.run_until_complete(run())
+
+    def test_drop_oldest(self):
+        async def run():
+            reader = can.AsyncBufferedReader(max_size=4)
+            reader.on_messages_received(self.msgs)
+            self.assertEqual(await reader.get_messages(), self.msgs[6:])
+            self.assertEqual(reader.dropped_messages, 6)
+            self.assertEqual(reader.high_water_mark, 4)
+
+        self.loop.run_until_complete(run())
+
+    def test_drop_newest(self):
+        async def run():
+            reader = can.AsyncBufferedReader(max_size=4, overflow="drop_newest")
+            reader.on_messages_received(self.msgs)
+            self.assertEqual(await reader.get_messages(), self.msgs[:4])
+            self.assertEqual(reader.dropped_messages, 6)
+
+        self.loop.run_until_complete(run())
+
+    def test_block_is_not_supported(self):
+        with self.assertRaises(ValueError):
+            can.AsyncBufferedReader(max_size=4, overflow="block")
+
+
 def test_deprecated_loop_arg(recwarn):
     warnings.simplefilter("always")
     can.AsyncBufferedReader(loop=asyncio.get_event_loop())
@@ -12,12 +12,17 @@ comments.
 TODO: correctly set preserves_channel and adds_default_channel
 """
 
+import io
 import logging
 import unittest
 import tempfile
+import threading
+import timeit
 import os
+import zlib
 from abc import abstractmethod, ABCMeta
 from itertools import zip_longest
+from unittest.mock import patch
 from datetime import datetime
 
 import can
@@ -31,6 +36,7 @@ from .data.example_data import (
     sort_messages,
 )
 from .message_helper import ComparingMessagesTestCase
+from .config import TEST_BENCHMARKS
 
 logging.basicConfig(level=logging.DEBUG)
 
@@ -326,6 +332,19 @@ class ReaderWriterTest(unittest.TestCase, ComparingMessagesTestCase, metaclass=A
 
         self.assertMessagesEqual(self.original_messages, read_messages)
 
+    def test_write_batches(self):
+        """testing that writing batches of messages is equivalent to writing
+        them one by one"""
+        with self.writer_constructor(self.test_file_name) as writer:
+            for start in range(0, len(self.original_messages), 7):
+                writer.on_messages_received(self.original_messages[start : start + 7])
+            self._ensure_fsync(writer)
+
+        with self.reader_constructor(self.test_file_name) as reader:
+            read_messages = list(reader)
+
+        self.assertMessagesEqual(self.original_messages, read_messages)
+
     def _write_all(self, writer):
         """Writes messages and insert comments here and there."""
         # Note: we make no assumptions about the length of original_messages and original_comments
@@ -554,6 +573,87 @@ class TestAscFileFormat(ReaderWriterTest):
         actual = self._read_log_file("test_CanErrorFrames.asc")
         self.assertMessagesEqual(actual, expected_messages)
 
+    def test_flush_interval(self):
+        msg = can.Message(arbitration_id=0x123, data=[1, 2, 3])
+        with io.StringIO() as file:
+            writer = can.ASCWriter(file, flush_interval=3600)
+            header = file.getvalue()
+            writer.on_message_received(msg)
+            self.assertEqual(file.getvalue(), header)
+            writer.MAX_BUFFER_SIZE_BEFORE_WRITES = 3
+            writer.on_message_received(msg)
+            self.assertIn("Start of measurement", file.getvalue())
+            self.assertEqual(file.getvalue().count(" 01 02 03"), 2)
+            writer.on_message_received(msg)
+            self.assertEqual(file.getvalue().count(" 01 02 03"), 2)
+            writer.flush()
+            self.assertEqual(file.getvalue().count(" 01 02 03"), 3)
+
+        with io.StringIO() as file:
+            writer = can.ASCWriter(file, flush_interval=0)
+            writer.on_message_received(msg)
+            self.assertIn(" 01 02 03", file.getvalue())
+
+    def test_fast_path_matches_general_parser(self):
+        lines = [
+            "   1.000000 1  123             Rx   d 8 01 02 03 04 05 06 07 08\n",
+            "   1.100000 2  1ABCDEx         Tx   d 2 AA BB  Length = 1 BitCount = 2\n",
+            "   1.200000 1  7FF             Rx   d 0\n",
+            "   1.300000 1  7FF             Rx   d 8 01 02\n",
+            "   1.400000 1  100             Rx   d 2 1 2\n",
+            "   1.500000 CANFD   1 Rx        300  Name  1 0 8  8 01 02 03 04 05 06 07 08"
+            "   102203  133   303000 e0006659 46500250 4b140250 20011736 2001040d\n",
+            "   1.600000 CANFD   2 Tx     50005x  0 1 9 12 " + "FF " * 12 + "0 0\n",
+            "   1.700000 CANFD   3 Rx        4EE  1 1 0 0 0 0 0 0 0 0 0 0\n",
+        ]
+        data = "".join(
+            [
+                "date Sam Sep 30 15:06:13.191 2017\n",
+                "base hex  timestamps absolute\n",
+                "Begin Triggerblock Sam Sep 30 15:06:13.191 2017\n",
+            ]
+            + lines
+        )
+        with can.ASCReader(io.StringIO(data)) as reader:
+            actual = list(reader)
+        with patch.object(can.ASCReader, "_use_fast_path", False):
+            with can.ASCReader(io.StringIO(data)) as reader:
+                expected = list(reader)
+        self.assertEqual(len(actual), len(lines))
+        self.assertMessagesEqual(actual, expected)
+        self.assertEqual([msg.channel for msg in actual], [0, 1, 0, 0, 0, 0, 1, 2])
+
+
+@unittest.skipUnless(TEST_BENCHMARKS, "skip benchmarks")
+class BenchmarkAscReader(unittest.TestCase):
+    def test_benchmark(self):
+        logfile = os.path.join(os.path.dirname(__file__), "data", "logfile.asc")
+        with open(logfile) as file:
+            lines = file.readlines()
+        # the data frames of the example file, since the general parser does
+        # not support some of the other lines
+        frames = [
+            line
+            for line in lines
+            if (" d " in line and "J1939TP" not in line)
+            or ("CANFD" in line and "ErrorFrame" not in line)
+        ]
+        data = "".join(lines[:5] + frames * 5000)
+
+        def read():
+            with can.ASCReader(io.StringIO(data)) as reader:
+                return sum(1 for _ in reader)
+
+        fast = min(timeit.repeat(read, number=1, repeat=3))
+        with patch.object(can.ASCReader, "_use_fast_path", False):
+            general = min(timeit.repeat(read, number=1, repeat=3))
+        count = read()
+        print(
+            f"general parser: {count / general:.0f} lines/s, "
+            f"fast path: {count / fast:.0f} lines/s ({general / fast:.1f}x)"
+        )
+        self.assertGreaterEqual(general / fast, 3)
+
 
 class TestBlfFileFormat(ReaderWriterTest):
     """Tests can.BLFWriter and can.BLFReader.
@@ -653,6 +753,152 @@ class TestBlfFileFormat(ReaderWriterTest):
         self.assertMessagesEqual(actual, [expected] * 2)
         self.assertEqual(actual[0].channel, expected.channel)
 
+    def test_compresses_in_background(self):
+        msgs = [
+            can.Message(timestamp=1600000000.0 + i, arbitration_id=i, data=[i % 256])
+            for i in range(1000)
+        ]
+        compressing_threads = set()
+        compress = zlib.compress
+
+        def record_thread(*args):
+            compressing_threads.add(threading.current_thread())
+            return compress(*args)
+
+        writer = can.BLFWriter(self.test_file_name)
+        # many objects do not fit in one container
+        writer.max_container_size = 1000
+        with patch("zlib.compress", record_thread):
+            for msg in msgs:
+                writer.on_message_received(msg)
+            writer.stop()
+        self.assertNotIn(threading.current_thread(), compressing_threads)
+
+        with can.BLFReader(self.test_file_name) as reader:
+            self.assertEqual(reader.object_count, len(msgs))
+            self.assertAlmostEqual(reader.stop_timestamp, msgs[-1].timestamp)
+            self.assertMessagesEqual(msgs, list(reader))
+
+
+class TestBlfIndex(unittest.TestCase):
+    """Tests the index of can.BLFReader, reading parts of a file and reading
+    in parallel."""
+
+    def setUp(self):
+        with tempfile.NamedTemporaryFile(suffix=".blf", delete=False) as test_file:
+            self.test_file_name = test_file.name
+        self.index_file_name = self.test_file_name + ".idx"
+
+        writer = can.BLFWriter(self.test_file_name)
+        # use small containers such that many objects span two of them
+        writer.max_container_size = 1000
+        for i in range(2000):
+            writer.on_message_received(
+                can.Message(
+                    timestamp=1600000000.0 + i * 0.01,
+                    arbitration_id=i,
+                    is_fd=i % 3 == 0,
+                    data=bytes(range(i % 64 if i % 3 == 0 else i % 8)),
+                )
+            )
+        writer.stop()
+
+        with can.BLFReader(self.test_file_name) as reader:
+            self.all_messages = list(reader)
+        self.assertEqual(len(self.all_messages), 2000)
+
+    def tearDown(self):
+        os.remove(self.test_file_name)
+        if os.path.exists(self.index_file_name):
+            os.remove(self.index_file_name)
+
+    def _ids(self, msgs):
+        return [msg.arbitration_id for msg in msgs]
+
+    def test_index(self):
+        with can.BLFReader(self.test_file_name) as reader:
+            index = reader.index
+        self.assertGreater(len(index), 50)
+        for previous, entry in zip(index, index[1:]):
+            self.assertLessEqual(previous.stop_timestamp, entry.start_timestamp)
+            self.assertGreater(entry.offset, previous.offset)
+        # some objects continue in the next container
+        self.assertTrue(any(entry.first_object for entry in index))
+
+    def test_read_range(self):
+        with can.BLFReader(self.test_file_name) as reader:
+            for start, end in [(1600000003.0, 1600000008.0), (None, 1600000000.5)]:
+                expected = [
+                    msg
+                    for msg in self.all_messages
+                    if (start is None or msg.timestamp >= start)
+                    and msg.timestamp <= end
+                ]
+                self.assertEqual(
+                    self._ids(reader.read_range(start, end)), self._ids(expected)
+                )
+            self.assertEqual(self._ids(reader.read_range()), list(range(2000)))
+            self.assertEqual(list(reader.read_range(1700000000.0)), [])
+
+    def test_read_range_unsorted(self):
+        with can.BLFWriter(self.test_file_name) as writer:
+            for i, offset in enumerate([0.0, 5.0, 1.0, 6.0, 2.0]):
+                writer.on_message_received(
+                    can.Message(timestamp=1600000000.0 + offset, arbitration_id=i)
+                )
+        with can.BLFReader(self.test_file_name, end=1600000002.0) as reader:
+            self.assertEqual(
+                self._ids(reader.read_range(None, 1600000002.0)), [0, 2, 4]
+            )
+            reader.seek_time(1600000001.0)
+            self.assertEqual(self._ids(reader), [2, 4])
+
+    def test_seek_time(self):
+        with can.BLFReader(self.test_file_name) as reader:
+            reader.seek_time(1600000012.345)
+            self.assertEqual(self._ids(reader), list(range(1235, 2000)))
+
+    def test_in_memory_file(self):
+        with open(self.test_file_name, "rb") as file:
+            data = io.BytesIO(file.read())
+        with can.BLFReader(data) as reader:
+            self.assertEqual(
+                self._ids(reader.read_range(1600000001.0, 1600000001.995)),
+                list(range(100, 200)),
+            )
+
+    def test_sidecar_index_file(self):
+        with can.BLFReader(
+            self.test_file_name, index_file=self.index_file_name
+        ) as reader:
+            index = reader.index
+        self.assertTrue(os.path.exists(self.index_file_name))
+
+        with can.BLFReader(
+            self.test_file_name, index_file=self.index_file_name
+        ) as reader:
+            with patch.object(reader, "_build_index") as build_index:
+                self.assertEqual(reader.index, index)
+                build_index.assert_not_called()
+
+    def _assert_same_messages(self, msgs):
+        self.assertEqual(len(msgs), len(self.all_messages))
+        for msg, expected in zip(msgs, self.all_messages):
+            self.assertTrue(msg.equals(expected, timestamp_delta=0.0), repr(msg))
+
+    def test_parallel_decompression(self):
+        with can.BLFReader(self.test_file_name, workers=3) as reader:
+            self._assert_same_messages(list(reader))
+        with can.BLFReader(self.test_file_name, workers=3) as reader:
+            self.assertEqual(
+                self._ids(reader.read_range(1600000003.0, 1600000008.0)),
+                list(range(300, 801)),
+            )
+
+    def test_parallel_parsing(self):
+        with can.BLFReader(self.test_file_name, workers=2, processes=2) as reader:
+            self._assert_same_messages(list(reader))
+
 
 class TestCanutilsFileFormat(ReaderWriterTest):
     """Tests can.CanutilsLogWriter and can.CanutilsLogReader"""
@@ -668,6 +914,219 @@ class TestCanutilsFileFormat(ReaderWriterTest):
             adds_default_channel="vcan0",
         )
 
+    def test_memory_mapped_file(self):
+        with can.CanutilsLogWriter(self.test_file_name) as writer:
+            self._write_all(writer)
+        with can.CanutilsLogReader(self.test_file_name) as reader:
+            expected = list(reader)
+        with can.CanutilsLogReader(self.test_file_name, use_mmap=True) as reader:
+            self.assertIsNotNone(reader._mmap)
+            actual = list(reader)
+        self.assertMessagesEqual(actual, expected)
+        self.assertEqual(
+            [msg.channel for msg in actual], [msg.channel for msg in expected]
+        )
+
+    def test_flush_interval(self):
+        msg = can.Message(arbitration_id=0x123, is_extended_id=False, data=[1, 2, 3])
+        with io.StringIO() as file:
+            writer = can.CanutilsLogWriter(file, flush_interval=3600)
+            writer.on_messages_received([msg, msg])
+            self.assertEqual(file.getvalue(), "")
+            writer.MAX_BUFFER_SIZE_BEFORE_WRITES = 3
+            writer.on_message_received(msg)
+            self.assertEqual(file.getvalue(), "(0.000000) vcan0 123#010203\n" * 3)
+            writer.on_message_received(msg)
+            self.assertEqual(file.getvalue(), "(0.000000) vcan0 123#010203\n" * 3)
+            writer.flush()
+            self.assertEqual(file.getvalue(), "(0.000000) vcan0 123#010203\n" * 4)
+
+        with io.StringIO() as file:
+            writer = can.CanutilsLogWriter(file, flush_interval=0)
+            writer.on_message_received(msg)
+            self.assertEqual(file.getvalue(), "(0.000000) vcan0 123#010203\n")
+
+
+@unittest.skipUnless(TEST_BENCHMARKS, "skip benchmarks")
+class BenchmarkCanutilsLog(unittest.TestCase):
+    """Measures the throughput of a candump log, which candump and canplayer
+    handle at the full rate of several busy buses."""
+
+    def setUp(self):
+        with tempfile.NamedTemporaryFile(suffix=".log", delete=False) as test_file:
+            self.test_file_name = test_file.name
+        self.messages = [
+            can.Message(
+                timestamp=1600000000.0 + i * 1e-4,
+                arbitration_id=0x100 + i % 50,
+                data=bytes(range(i % 9)),
+                channel="can0",
+            )
+            for i in range(100000)
+        ]
+
+    def tearDown(self):
+        os.remove(self.test_file_name)
+
+    def test_benchmark(self):
+        def write():
+            with can.CanutilsLogWriter(self.test_file_name) as writer:
+                for msg in self.messages:
+                    writer.on_message_received(msg)
+
+        def write_batches():
+            with can.CanutilsLogWriter(self.test_file_name) as writer:
+                for i in range(0, len(self.messages), 64):
+                    writer.on_messages_received(self.messages[i : i + 64])
+
+        def read(**kwargs):
+            with can.CanutilsLogReader(self.test_file_name, **kwargs) as reader:
+                self.assertEqual(sum(1 for _ in reader), len(self.messages))
+
+        for name, function in [
+            ("write", write),
+            ("write batches", write_batches),
+            ("read", read),
+            ("read memory mapped", lambda: read(use_mmap=True)),
+        ]:
+            duration = min(timeit.repeat(function, number=1, repeat=3))
+            print(f"{name}: {len(self.messages) / duration:.0f} frames/s")
+
+
+@unittest.skipUnless(TEST_BENCHMARKS, "skip benchmarks")
+class BenchmarkSqliteWriter(unittest.TestCase):
+    """Checks that the throughput mode of the sqlite writer keeps up with
+    20000 frames/s."""
+
+    def setUp(self):
+        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as test_file:
+            self.test_file_name = test_file.name
+        self.messages = [
+            can.Message(
+                timestamp=1600000000.0 + i * 1e-4,
+                arbitration_id=0x100 + i % 50,
+                data=bytes(range(i % 9)),
+            )
+            for i in range(100000)
+        ]
+
+    def tearDown(self):
+        os.remove(self.test_file_name)
+
+    def test_benchmark(self):
+        def write():
+            with can.SqliteWriter(self.test_file_name, throughput_mode=True) as writer:
+                for msg in self.messages:
+                    writer.on_message_received(msg)
+
+        duration = min(timeit.repeat(write, number=1, repeat=3))
+        frames_per_second = len(self.messages) / duration
+        print(f"write: {frames_per_second:.0f} frames/s")
+        self.assertGreaterEqual(frames_per_second, 20000)
+
+
+class TestColumnarFileFormat(ReaderWriterTest):
+    """Tests can.ColumnarWriter and can.ColumnarReader"""
+
+    def _setup_instance(self):
+        super()._setup_instance_helper(
+            lambda file: can.ColumnarWriter(file, chunk_size=4),
+            can.ColumnarReader,
+            binary_file=True,
+            check_fd=True,
+            check_comments=False,
+            preserves_channel=True,
+        )
+
+    def _write_messages(self, **kwargs):
+        messages = [
+            can.Message(
+                timestamp=float(i),
+                arbitration_id=0x100 + i,
+                data=bytes(range(i % 9)),
+                channel=i % 2,
+            )
+            for i in range(50)
+        ]
+        with can.ColumnarWriter(self.test_file_name, **kwargs) as writer:
+            for msg in messages:
+                writer(msg)
+        return messages
+
+    def test_index(self):
+        self._write_messages(chunk_size=20)
+        with can.ColumnarReader(self.test_file_name) as reader:
+            self.assertEqual(
+                [
+                    (
+                        entry.message_count,
+                        entry.start_timestamp,
+                        entry.stop_timestamp,
+                        entry.min_arbitration_id,
+                        entry.max_arbitration_id,
+                    )
+                    for entry in reader.index
+                ],
+                [
+                    (20, 0.0, 19.0, 0x100, 0x113),
+                    (20, 20.0, 39.0, 0x114, 0x127),
+                    (10, 40.0, 49.0, 0x128, 0x131),
+                ],
+            )
+
+    def test_iter_chunks(self):
+        messages = self._write_messages(chunk_size=20)
+        with can.ColumnarReader(self.test_file_name) as reader:
+            chunks = list(reader.iter_chunks(start=25.0, end=45.0))
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(list(chunks[0].timestamps), [float(i) for i in range(20, 40)])
+        self.assertEqual(chunks[1].arbitration_ids[0], 0x128)
+        self.assertEqual(
+            chunks[0].payload[chunks[0].data_offsets()[3] :][
+                : chunks[0].data_lengths[3]
+            ],
+            messages[23].data,
+        )
+        self.assertMessagesEqual(
+            messages[20:], [*chunks[0].messages(), *chunks[1].messages()]
+        )
+
+    def test_iter_chunks_filtered(self):
+        messages = self._write_messages(chunk_size=20)
+        can_filters = [{"can_id": 0x115, "can_mask": 0x1FFFFFFF}]
+        with can.ColumnarReader(self.test_file_name) as reader:
+            chunks = list(reader.iter_chunks(can_filters=can_filters))
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual(chunks[0].arbitration_ids[0], 0x114)
+
+        with can.ColumnarReader(self.test_file_name, can_filters=can_filters) as reader:
+            with patch.object(
+                reader, "_parse_chunk", wraps=reader._parse_chunk
+            ) as parse_chunk:
+                self.assertMessagesEqual(list(reader), messages[21:22])
+                self.assertEqual(parse_chunk.call_count, 1)
+
+    def test_uncompressed(self):
+        messages = self._write_messages(compression_level=0)
+        with can.ColumnarReader(self.test_file_name) as reader:
+            self.assertEqual(reader.index[0].compression, 0)
+            self.assertMessagesEqual(messages, list(reader))
+
+    def test_missing_index(self):
+        messages = self._write_messages(chunk_size=20)
+        # cut off the index and parts of the last chunk, as after a crash
+        with open(self.test_file_name, "r+b") as file:
+            file.truncate(os.path.getsize(self.test_file_name) - 60)
+        with can.ColumnarReader(self.test_file_name) as reader:
+            self.assertEqual(len(reader.index), 2)
+            self.assertMessagesEqual(messages[:40], list(reader))
+
+    def test_not_columnar(self):
+        with open(self.test_file_name, "wb") as file:
+            file.write(b"LOGG" + bytes(100))
+        with self.assertRaises(can.io.columnar.ColumnarParseError):
+            can.ColumnarReader(self.test_file_name).stop()
+
 
 class TestCsvFileFormat(ReaderWriterTest):
     """Tests can.ASCWriter and can.ASCReader"""
@@ -729,6 +1188,351 @@ class TestSqliteDatabaseFormat(ReaderWriterTest):
 
         self.assertMessagesEqual(self.original_messages, read_messages)
 
+    def _write_selection_messages(self, **kwargs):
+        messages = [
+            can.Message(
+                timestamp=float(i),
+                arbitration_id=0x100 + i,
+                is_extended_id=i % 2 == 1,
+                data=[i],
+            )
+            for i in range(20)
+        ]
+        with can.SqliteWriter(self.test_file_name, **kwargs) as writer:
+            for msg in messages:
+                writer(msg)
+        return messages
+
+    def test_time_range(self):
+        messages = self._write_selection_messages()
+        with can.SqliteReader(self.test_file_name, start=5.0, end=9.0) as reader:
+            self.assertEqual(len(reader), 5)
+            self.assertMessagesEqual(messages[5:10], list(reader))
+
+    def test_filters(self):
+        messages = self._write_selection_messages()
+        can_filters = [
+            {"can_id": 0x102, "can_mask": 0x1FFFFFFF},
+            {"can_id": 0x110, "can_mask": 0x7FC, "extended": False},
+        ]
+        with can.SqliteReader(
+            self.test_file_name, can_filters=can_filters, end=17.0
+        ) as reader:
+            expected = [messages[i] for i in (2, 16)]
+            self.assertEqual(len(reader), len(expected))
+            self.assertMessagesEqual(expected, list(reader))
+
+    def test_arraysize(self):
+        messages = self._write_selection_messages()
+        with can.SqliteReader(self.test_file_name, arraysize=3) as reader:
+            self.assertMessagesEqual(messages, list(reader.read_all()))
+
+    def test_create_indexes(self):
+        self._write_selection_messages(create_indexes=True)
+        with can.SqliteReader(self.test_file_name) as reader:
+            indexes = reader._conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            ).fetchall()
+        self.assertEqual(
+            {name for (name,) in indexes}, {"messages_ts", "messages_arbitration_id"}
+        )
+
+    def test_throughput_mode(self):
+        messages = [
+            can.Message(timestamp=i * 1e-3, arbitration_id=i % 0x800, data=[i % 256])
+            for i in range(5000)
+        ]
+        # write everything at once, so that stopping has to drain many batches
+        with can.SqliteWriter(self.test_file_name, throughput_mode=True) as writer:
+            writer.on_messages_received(messages)
+        self.assertEqual(writer.num_frames, len(messages))
+
+        with can.SqliteReader(self.test_file_name) as reader:
+            (journal_mode,) = reader._conn.execute("PRAGMA journal_mode").fetchone()
+            self.assertEqual(journal_mode, "wal")
+            self.assertMessagesEqual(messages, list(reader))
+
+    def test_bounded_buffer(self):
+        messages = [can.Message(arbitration_id=i) for i in range(100)]
+        with can.SqliteWriter(
+            self.test_file_name, max_buffer_size=10, overflow="drop_newest"
+        ) as writer:
+            writer.on_messages_received(messages)
+        self.assertEqual(writer.dropped_messages, 90)
+
+        with can.SqliteReader(self.test_file_name) as reader:
+            self.assertMessagesEqual(messages[:10], list(reader))
+
+
+class TestCompressedLogFiles(unittest.TestCase):
+    """Tests compressing text log files with can.Logger and can.LogReader"""
+
+    messages = TEST_MESSAGES_BASE + TEST_MESSAGES_CAN_FD
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _round_trip(self, filename):
+        path = os.path.join(self.temp_dir.name, filename)
+        with can.Logger(path) as writer:
+            for msg in self.messages:
+                writer(msg)
+        with can.LogReader(path) as reader:
+            return path, list(reader)
+
+    def test_round_trip(self):
+        for suffix in (".asc", ".csv", ".log"):
+            _, expected = self._round_trip("plain" + suffix)
+            for compression in (".gz", ".bz2", ".xz"):
+                with self.subTest(suffix=suffix, compression=compression):
+                    path, actual = self._round_trip("compressed" + suffix + compression)
+                    with can.io.compression.COMPRESSION_SUFFIXES[compression](
+                        path, "rt"
+                    ) as file:
+                        # the file really is compressed
+                        self.assertTrue(file.read())
+                    self.assertEqual(len(actual), len(expected))
+                    for actual_msg, expected_msg in zip(actual, expected):
+                        self.assertTrue(actual_msg.equals(expected_msg))
+
+    def test_compresses_in_background(self):
+        path = os.path.join(self.temp_dir.name, "test.log.gz")
+        with can.Logger(path) as writer:
+            self.assertIsInstance(
+                writer.file.buffer, can.io.compression.BackgroundCompressedFile
+            )
+            self.assertTrue(writer.file.buffer._thread.is_alive())
+
+    def test_append(self):
+        path = os.path.join(self.temp_dir.name, "test.csv.gz")
+        with can.Logger(path) as writer:
+            writer(self.messages[0])
+        with can.Logger(path, append=True) as writer:
+            writer(self.messages[1])
+        with can.LogReader(path) as reader:
+            self.assertEqual(len(list(reader)), 2)
+
+    def test_binary_format(self):
+        with self.assertRaises(ValueError):
+            can.Logger(os.path.join(self.temp_dir.name, "test.blf.gz"))
+        with self.assertRaises(ValueError):
+            can.LogReader(os.path.join(self.temp_dir.name, "test.blf.gz"))
+
+
+class TestLogReaderSelection(unittest.TestCase):
+    """Tests reading time ranges and IDs with can.LogReader"""
+
+    can_filters = [
+        {"can_id": 0x100, "can_mask": 0x7F0, "extended": False},
+        {"can_id": 0x18FEF100, "can_mask": 0x1FFFFFFF},
+    ]
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.messages = [
+            can.Message(
+                timestamp=1000.0 + i * 0.5,
+                arbitration_id=0x18FEF100 + i % 3 if i % 2 else 0x100 + i % 32,
+                is_extended_id=bool(i % 2),
+                data=[i % 256] * (i % 9),
+            )
+            for i in range(100)
+        ]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write(self, filename):
+        path = os.path.join(self.temp_dir.name, filename)
+        with can.Logger(path) as writer:
+            for msg in self.messages:
+                writer(msg)
+        return path
+
+    def _check_selection(self, path, **kwargs):
+        with can.LogReader(path) as reader:
+            messages = list(reader)
+        start = messages[20].timestamp
+        end = messages[60].timestamp
+        matcher = can.CompiledFilters(self.can_filters)
+        expected = [
+            msg for msg in messages if start <= msg.timestamp <= end and matcher(msg)
+        ]
+        self.assertTrue(expected)
+
+        with can.LogReader(
+            path, start=start, end=end, can_filters=self.can_filters, **kwargs
+        ) as reader:
+            actual = list(reader)
+        self.assertEqual(len(actual), len(expected))
+        for actual_msg, expected_msg in zip(actual, expected):
+            self.assertTrue(actual_msg.equals(expected_msg))
+
+    def test_formats(self):
+        for suffix in (".asc", ".blf", ".canc", ".csv", ".db", ".log", ".log.gz"):
+            with self.subTest(suffix=suffix):
+                self._check_selection(self._write("test" + suffix))
+
+    def test_blf_index(self):
+        path = self._write("test.blf")
+        self._check_selection(path, index_file=path + ".idx")
+
+    def test_text_index(self):
+        for suffix in (".asc", ".csv", ".log"):
+            with self.subTest(suffix=suffix):
+                path = self._write("test" + suffix)
+                self._check_selection(path, index_file=path + ".idx")
+                self.assertTrue(os.path.exists(path + ".idx"))
+
+    def test_text_index_seeks(self):
+        start = self.messages[50].timestamp
+        for suffix in (".asc", ".csv", ".log"):
+            with self.subTest(suffix=suffix):
+                path = self._write("test" + suffix)
+                with can.LogReader(path, start=start) as reader:
+                    expected = list(reader)
+                    # ASC files store timestamps relative to the start
+                    stored_start = start - getattr(reader, "start_time", 0.0)
+
+                index = can.io.build_time_index(path, step=10)
+                self.assertGreaterEqual(len(index), 10)
+                # the lines before the indexed line must not be read
+                skipped_from = index.offsets[0]
+                skipped_to = index.offset_before(stored_start)
+                self.assertGreater(skipped_to, skipped_from)
+                with open(path, "r+b") as file:
+                    file.seek(skipped_from)
+                    lines = file.read(skipped_to - skipped_from).splitlines(True)
+                    file.seek(skipped_from)
+                    for line in lines:
+                        file.write(b"x" * (len(line) - 1) + b"\n")
+
+                with can.LogReader(
+                    path, start=start, index_file=path + ".idx"
+                ) as reader:
+                    actual = list(reader)
+                self.assertEqual(len(actual), len(expected))
+                for actual_msg, expected_msg in zip(actual, expected):
+                    self.assertTrue(actual_msg.equals(expected_msg))
+
+    def test_outdated_text_index(self):
+        path = self._write("test.log")
+        can.io.build_time_index(path, step=10)
+        self.messages = self.messages[:80]
+        self._write("test.log")
+        self._check_selection(path, index_file=path + ".idx")
+
+    def test_stops_after_end(self):
+        path = self._write("test.log")
+        with open(path, "a") as file:
+            file.write("this line is not parsed\n")
+        with can.LogReader(path, end=1010.0) as reader:
+            self.assertEqual(len(list(reader)), 21)
+
+
+class TestMergedLogReader(unittest.TestCase):
+    """Tests merging several logs with can.MergedLogReader"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    @staticmethod
+    def _messages(start, count, arbitration_id):
+        return [
+            can.Message(
+                timestamp=start + i * 0.25,
+                arbitration_id=arbitration_id,
+                is_extended_id=False,
+                data=[i % 256],
+            )
+            for i in range(count)
+        ]
+
+    def _write(self, filename, messages):
+        path = os.path.join(self.temp_dir.name, filename)
+        with can.Logger(path) as writer:
+            for msg in messages:
+                writer(msg)
+        return path
+
+    def test_formats(self):
+        # the logs overlap, but start and end hours apart
+        start = 1600000000.0
+        paths = [
+            self._write("a.blf", self._messages(start, 100, 0x100)),
+            self._write("b.asc", self._messages(start + 10.1, 100, 0x200)),
+            self._write("c.log.gz", self._messages(start + 7200.0, 50, 0x300)),
+        ]
+        with can.MergedLogReader(paths, channels=[0, 1, 2]) as reader:
+            merged = list(reader)
+
+        self.assertEqual(len(merged), 250)
+        timestamps = [msg.timestamp for msg in merged]
+        self.assertEqual(timestamps, sorted(timestamps))
+        self.assertAlmostEqual(timestamps[0], start)
+        self.assertAlmostEqual(timestamps[-1], start + 7200.0 + 49 * 0.25)
+        for msg in merged:
+            self.assertEqual(msg.channel, (msg.arbitration_id >> 8) - 1)
+
+    def test_selection(self):
+        paths = [
+            self._write("a.csv", self._messages(0.0, 40, 0x100)),
+            self._write("b.canc", self._messages(0.1, 40, 0x200)),
+        ]
+        with can.MergedLogReader(
+            paths,
+            start=2.0,
+            end=3.0,
+            can_filters=[{"can_id": 0x200, "can_mask": 0x7FF}],
+        ) as reader:
+            merged = list(reader)
+        self.assertEqual([msg.timestamp for msg in merged], [2.1, 2.35, 2.6, 2.85])
+
+    def test_look_ahead(self):
+        consumed = [0, 0]
+
+        def count(index, messages):
+            for msg in messages:
+                consumed[index] += 1
+                yield msg
+
+        reader = can.MergedLogReader(
+            [
+                count(0, self._messages(0.0, 100, 0x100)),
+                count(1, self._messages(50.0, 100, 0x200)),
+            ]
+        )
+        messages = iter(reader)
+        for _ in range(10):
+            next(messages)
+        # only a single message of the log starting later was read
+        self.assertEqual(consumed, [10, 1])
+
+    def test_equal_timestamps(self):
+        reader = can.MergedLogReader(
+            [self._messages(0.0, 10, 0x100), self._messages(0.0, 10, 0x200)]
+        )
+        ids = [msg.arbitration_id for msg in reader]
+        self.assertEqual(ids, [0x100, 0x200] * 10)
+
+    def test_message_sync(self):
+        reader = can.MergedLogReader(
+            [self._messages(0.0, 20, 0x100), self._messages(0.1, 20, 0x200)]
+        )
+        synced = list(can.MessageSync(reader, timestamps=False, gap=0.0))
+        self.assertEqual(len(synced), 40)
+        self.assertEqual(synced[1].arbitration_id, 0x200)
+
+    def test_wrong_number_of_channels(self):
+        with self.assertRaises(ValueError):
+            can.MergedLogReader([[], []], channels=[0])
+
 
 class TestPrinter(unittest.TestCase):
     """Tests that can.Printer does not crash
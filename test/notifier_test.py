@@ -1,11 +1,14 @@
 #!/usr/bin/env python
 
 import unittest
+import socket
 import time
 import asyncio
 
 import can
 
+from .config import IS_UNIX
+
 
 class NotifierTest(unittest.TestCase):
     def test_single_bus(self):
@@ -38,6 +41,137 @@ class NotifierTest(unittest.TestCase):
         bus2.shutdown()
 
 
+class SocketPairBus(can.BusABC):
+    """A bus with a file descriptor, which receives what is written to
+    :attr:`remote`."""
+
+    def __init__(self, channel, **kwargs):
+        self.socket, self.remote = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.socket.setblocking(False)
+        super().__init__(channel=channel, **kwargs)
+        self.channel = channel
+        self.channel_info = "socket pair {}".format(channel)
+
+    def _recv_internal(self, timeout):
+        try:
+            frame = self.socket.recv(16)
+        except BlockingIOError:
+            return None, False
+        can_id, data = frame[0], frame[8:]
+        return (
+            can.Message(arbitration_id=can_id, data=data, channel=self.channel),
+            False,
+        )
+
+    def send(self, msg, timeout=None):
+        raise NotImplementedError()
+
+    def fileno(self):
+        return self.socket.fileno()
+
+    def shutdown(self):
+        self.socket.close()
+        self.remote.close()
+
+
+class BatchListener(can.Listener):
+    def __init__(self):
+        self.batches = []
+
+    def on_message_received(self, msg):
+        raise AssertionError("should receive batches")
+
+    def on_messages_received(self, msgs):
+        self.batches.append(msgs)
+
+
+class BatchNotifierTest(unittest.TestCase):
+    def test_batches_are_delivered(self):
+        bus = can.Bus("test", bustype="virtual", receive_own_messages=True)
+        batch_listener = BatchListener()
+        reader = can.BufferedReader()
+        msgs = [can.Message(arbitration_id=i) for i in range(20)]
+        bus.send_batch(msgs)
+
+        notifier = can.Notifier(bus, [batch_listener, reader], 0.1)
+        received = [reader.get_message(1) for _ in msgs]
+        notifier.stop()
+        bus.shutdown()
+
+        self.assertEqual([msg.arbitration_id for msg in received], list(range(20)))
+        batched = [msg for batch in batch_listener.batches for msg in batch]
+        self.assertEqual([msg.arbitration_id for msg in batched], list(range(20)))
+        self.assertLess(len(batch_listener.batches), len(msgs))
+
+    def test_default_implementation(self):
+        reader = can.BufferedReader()
+        msgs = [can.Message(arbitration_id=i) for i in range(3)]
+        reader.on_messages_received(msgs)
+        self.assertEqual([reader.get_message(0) for _ in msgs], msgs)
+
+
+@unittest.skipUnless(IS_UNIX, "requires Unix domain sockets")
+class SelectorNotifierTest(unittest.TestCase):
+    def setUp(self):
+        self.buses = [SocketPairBus(channel) for channel in range(4)]
+        self.virtual_bus = can.Bus("test", bustype="virtual", receive_own_messages=True)
+        self.reader = can.BufferedReader()
+
+    def tearDown(self):
+        for bus in self.buses:
+            bus.shutdown()
+        self.virtual_bus.shutdown()
+
+    def test_single_thread_for_all_buses(self):
+        notifier = can.Notifier(
+            self.buses + [self.virtual_bus], [self.reader], 0.1, use_selector=True
+        )
+        # one thread for all socket pairs and one for the virtual bus
+        self.assertEqual(len(notifier._readers), 2)
+
+        for bus in self.buses:
+            for can_id in range(10):
+                bus.remote.send(bytes([can_id, 0, 0, 0, 1, 0, 0, 0, 0xAA]))
+        self.virtual_bus.send(can.Message(arbitration_id=0x42))
+
+        received = [self.reader.get_message(1) for _ in range(41)]
+        self.assertNotIn(None, received)
+        for bus in self.buses:
+            ids = [msg.arbitration_id for msg in received if msg.channel == bus.channel]
+            self.assertEqual(ids, list(range(10)))
+        notifier.stop()
+
+    def test_add_bus_while_running(self):
+        notifier = can.Notifier(self.buses[:1], [self.reader], 0.1, use_selector=True)
+        notifier.add_bus(self.buses[1])
+        self.buses[1].remote.send(bytes(8))
+        self.assertIsNotNone(self.reader.get_message(1))
+        notifier.stop()
+
+    def test_asyncio_drains_available_messages(self):
+        loop = asyncio.new_event_loop()
+        bus = self.buses[0]
+        notifier = can.Notifier(bus, [self.reader], 0.1, loop=loop, max_batch_size=50)
+        for can_id in range(120):
+            bus.remote.send(bytes([can_id]) + bytes(7))
+
+        # a single wakeup handles at most one batch
+        notifier._on_message_available(bus)
+        self.assertEqual(self.reader.buffer.qsize(), 50)
+
+        loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertEqual(self.reader.buffer.qsize(), 120)
+        notifier.stop()
+        loop.close()
+
+    def test_stop_is_prompt(self):
+        notifier = can.Notifier(self.buses, [self.reader], 10.0, use_selector=True)
+        start = time.time()
+        notifier.stop()
+        self.assertLess(time.time() - start, 1.0)
+        self.assertFalse(notifier._readers[0].is_alive())
+
+
 class AsyncNotifierTest(unittest.TestCase):
     def test_asyncio_notifier(self):
         loop = asyncio.get_event_loop()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+"""
+This module tests the default implementations in :class:`can.BusABC`.
+"""
+
+import time
+import unittest
+from collections import deque
+
+import can
+
+
+class QueueBus(can.BusABC):
+    """A minimal bus that only implements the required methods."""
+
+    def __init__(self, fail_after=None, **kwargs):
+        super().__init__(channel="queue", **kwargs)
+        self.rx_queue = deque()
+        self.tx_queue = []
+        self.fail_after = fail_after
+
+    def _recv_internal(self, timeout):
+        if self.rx_queue:
+            return self.rx_queue.popleft(), False
+        return None, False
+
+    def send(self, msg, timeout=None):
+        if self.fail_after is not None and len(self.tx_queue) >= self.fail_after:
+            raise can.CanOperationError("Transmit buffer full")
+        self.tx_queue.append(msg)
+
+
+class TestDefaultBatchMethods(unittest.TestCase):
+    def setUp(self):
+        self.msgs = [can.Message(arbitration_id=i) for i in range(10)]
+
+    def test_recv_batch(self):
+        bus = QueueBus()
+        bus.rx_queue.extend(self.msgs)
+        self.assertEqual(bus.recv_batch(max_messages=4, timeout=0), self.msgs[:4])
+        self.assertEqual(bus.recv_batch(timeout=0), self.msgs[4:])
+        self.assertEqual(bus.recv_batch(timeout=0), [])
+
+    def test_recv_batch_filtered(self):
+        bus = QueueBus(can_filters=[{"can_id": 0x1, "can_mask": 0x1}])
+        bus.rx_queue.extend(self.msgs)
+        received = bus.recv_batch(max_messages=4, timeout=0)
+        self.assertEqual([msg.arbitration_id for msg in received], [1, 3])
+
+    def test_send_batch(self):
+        bus = QueueBus()
+        self.assertEqual(bus.send_batch(self.msgs), len(self.msgs))
+        self.assertEqual(bus.tx_queue, self.msgs)
+
+    def test_send_batch_partially(self):
+        bus = QueueBus(fail_after=3)
+        self.assertEqual(bus.send_batch(self.msgs), 3)
+        self.assertEqual(bus.tx_queue, self.msgs[:3])
+        with self.assertRaises(can.CanOperationError):
+            bus.send_batch(self.msgs[3:])
+
+
+class TestVirtualSendBatch(unittest.TestCase):
+    def setUp(self):
+        self.msgs = [can.Message(arbitration_id=i) for i in range(10)]
+        self.receiver = can.Bus(
+            interface="virtual", channel="send_batch", rx_queue_size=3
+        )
+        self.sender = can.Bus(interface="virtual", channel="send_batch")
+
+    def tearDown(self):
+        self.sender.shutdown()
+        self.receiver.shutdown()
+
+    def test_send_batch(self):
+        self.assertEqual(self.sender.send_batch(self.msgs[:3]), 3)
+        received = self.receiver.recv_batch(timeout=0)
+        self.assertEqual([msg.arbitration_id for msg in received], [0, 1, 2])
+        self.assertEqual(len({msg.timestamp for msg in received}), 1)
+
+    def test_send_batch_partially(self):
+        started = time.monotonic()
+        self.assertEqual(self.sender.send_batch(self.msgs, timeout=0.1), 3)
+        # the timeout applies to the whole batch and not to each message
+        self.assertLess(time.monotonic() - started, 0.5)
+        with self.assertRaises(can.CanOperationError):
+            self.sender.send_batch(self.msgs[3:], timeout=0)
+        received = self.receiver.recv_batch(timeout=0)
+        self.assertEqual([msg.arbitration_id for msg in received], [0, 1, 2])
+
+    def test_send_batch_to_all_receivers(self):
+        with can.Bus(
+            interface="virtual", channel="send_batch", rx_queue_size=5
+        ) as other_receiver:
+            self.assertEqual(self.sender.send_batch(self.msgs, timeout=0), 3)
+            # messages that do not fit into every queue are sent to no receiver
+            for receiver in (self.receiver, other_receiver):
+                received = receiver.recv_batch(timeout=0)
+                self.assertEqual([msg.arbitration_id for msg in received], [0, 1, 2])
+            self.assertEqual(self.sender.send_batch(self.msgs[3:], timeout=0), 3)
+            received = other_receiver.recv_batch(timeout=0)
+            self.assertEqual([msg.arbitration_id for msg in received], [3, 4, 5])
+
+
+if __name__ == "__main__":
+    unittest.main()
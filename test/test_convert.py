@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+"""
+This module tests the converter in :mod:`can.convert`.
+"""
+
+import os
+import tempfile
+import unittest
+
+import can
+from can.convert import convert_directory, convert_file
+
+
+class TestConvert(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.messages = [
+            can.Message(
+                timestamp=1600000000.0 + i * 0.01,
+                arbitration_id=0x100 + i % 4,
+                is_extended_id=False,
+                data=[i % 256] * (i % 9),
+            )
+            for i in range(2500)
+        ]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _path(self, *names):
+        return os.path.join(self.temp_dir.name, *names)
+
+    def _write(self, path):
+        with can.Logger(path) as writer:
+            for msg in self.messages:
+                writer(msg)
+
+    def _read(self, path):
+        with can.LogReader(path) as reader:
+            return list(reader)
+
+    def test_convert_file(self):
+        self._write(self._path("in.log"))
+        count, seconds = convert_file(
+            self._path("in.log"), self._path("out.blf"), batch_size=100
+        )
+        self.assertEqual(count, len(self.messages))
+        self.assertGreaterEqual(seconds, 0.0)
+
+        original = self._read(self._path("in.log"))
+        converted = self._read(self._path("out.blf"))
+        self.assertEqual(len(converted), len(original))
+        for actual, expected in zip(converted, original):
+            self.assertEqual(actual.timestamp, expected.timestamp)
+            self.assertEqual(actual.arbitration_id, expected.arbitration_id)
+            self.assertEqual(actual.data, expected.data)
+
+    def test_selection(self):
+        self._write(self._path("in.csv"))
+        count, _ = convert_file(
+            self._path("in.csv"),
+            self._path("out.log"),
+            start=1600000001.0,
+            end=1600000002.0,
+            can_filters=[{"can_id": 0x101, "can_mask": 0x7FF}],
+        )
+        converted = self._read(self._path("out.log"))
+        self.assertEqual(count, len(converted))
+        self.assertEqual(count, 25)
+        for msg in converted:
+            self.assertEqual(msg.arbitration_id, 0x101)
+
+    def test_reader_error(self):
+        with open(self._path("in.log"), "w") as file:
+            file.write("this is not a log file\n")
+        with self.assertRaises(Exception):
+            convert_file(self._path("in.log"), self._path("out.blf"))
+
+    def test_convert_directory(self):
+        os.mkdir(self._path("in"))
+        for name in ("a.asc", "b.log.gz", "c.csv"):
+            self._write(self._path("in", name))
+        with open(self._path("in", "notes.txt"), "w") as file:
+            file.write("not a log file")
+
+        count, _ = convert_directory(
+            self._path("in"), self._path("out"), ".blf", jobs=2
+        )
+        self.assertEqual(count, 3 * len(self.messages))
+        self.assertEqual(
+            sorted(os.listdir(self._path("out"))), ["a.blf", "b.blf", "c.blf"]
+        )
+        self.assertEqual(
+            len(self._read(self._path("out", "b.blf"))), len(self.messages)
+        )
+
+    def test_convert_directory_collision(self):
+        os.mkdir(self._path("in"))
+        for name in ("a.asc", "a.log"):
+            self._write(self._path("in", name))
+
+        with self.assertRaises(ValueError):
+            convert_directory(self._path("in"), self._path("out"), ".blf")
+        self.assertFalse(os.path.exists(self._path("out")))
+
+
+if __name__ == "__main__":
+    unittest.main()
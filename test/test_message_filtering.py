@@ -5,10 +5,13 @@
 This module tests :meth:`can.BusABC._matches_filters`.
 """
 
+import random
+import timeit
 import unittest
 
-from can import Bus, Message
+from can import Bus, CompiledFilters, Message
 
+from .config import TEST_BENCHMARKS
 from .data.example_data import TEST_ALL_MESSAGES
 
 
@@ -49,5 +52,170 @@ class TestMessageFiltering(unittest.TestCase):
         self.assertTrue(self.bus._matches_filters(HIGHEST_MSG))
 
 
+def reference_matches(filters, msg):
+    """The plain linear implementation that :class:`can.CompiledFilters` replaces."""
+    if not filters:
+        return True
+    for _filter in filters:
+        if "extended" in _filter and _filter["extended"] != msg.is_extended_id:
+            continue
+        if (_filter["can_id"] ^ msg.arbitration_id) & _filter["can_mask"] == 0:
+            return True
+    return False
+
+
+def random_filters(rng, count):
+    filters = []
+    for _ in range(count):
+        is_extended = rng.random() < 0.5
+        id_bits = 29 if is_extended else 11
+        _filter = {
+            "can_id": rng.getrandbits(id_bits),
+            "can_mask": rng.choice(
+                [
+                    (1 << id_bits) - 1,
+                    rng.getrandbits(id_bits),
+                    rng.getrandbits(id_bits) | 0xFFFFF000,
+                    0,
+                ]
+            ),
+        }
+        if rng.random() < 0.7:
+            _filter["extended"] = is_extended
+        filters.append(_filter)
+    return filters
+
+
+def random_messages(rng, count):
+    messages = []
+    for _ in range(count):
+        is_extended = rng.random() < 0.5
+        messages.append(
+            Message(
+                arbitration_id=rng.getrandbits(29 if is_extended else 11),
+                is_extended_id=is_extended,
+            )
+        )
+    return messages
+
+
+class TestCompiledFilters(unittest.TestCase):
+    def test_match_all(self):
+        for filters in (None, []):
+            matcher = CompiledFilters(filters)
+            self.assertIsNone(matcher.filters)
+            for msg in TEST_ALL_MESSAGES:
+                self.assertTrue(matcher(msg))
+
+    def test_standard_bitmap(self):
+        matcher = CompiledFilters([{"can_id": 0x100, "can_mask": 0x7FC}])
+        for arbitration_id in range(0x800):
+            self.assertEqual(
+                matcher.matches(arbitration_id, is_extended_id=False),
+                0x100 <= arbitration_id <= 0x103,
+            )
+        # the filter also applies to extended IDs
+        self.assertTrue(matcher.matches(0x1FFFF102, is_extended_id=True))
+        self.assertFalse(matcher.matches(0x1FFFF202, is_extended_id=True))
+
+    def test_extended_flag(self):
+        matcher = CompiledFilters(
+            [
+                {"can_id": 0x123, "can_mask": 0x7FF, "extended": False},
+                {"can_id": 0x456, "can_mask": 0x1FFFFFFF, "extended": True},
+            ]
+        )
+        self.assertTrue(matcher.matches(0x123, is_extended_id=False))
+        self.assertFalse(matcher.matches(0x123, is_extended_id=True))
+        self.assertTrue(matcher.matches(0x456, is_extended_id=True))
+        self.assertFalse(matcher.matches(0x456, is_extended_id=False))
+
+    def test_out_of_range_ids(self):
+        filters = [{"can_id": 0x923, "can_mask": 0xFFF}]
+        matcher = CompiledFilters(filters)
+        msg = Message(arbitration_id=0x923, is_extended_id=False)
+        self.assertTrue(matcher(msg))
+        self.assertEqual(matcher(msg), reference_matches(filters, msg))
+
+    def test_may_match_range(self):
+        matcher = CompiledFilters([{"can_id": 0x123, "can_mask": 0x1FFFFFFF}])
+        self.assertTrue(matcher.may_match_range(0x100, 0x200))
+        self.assertTrue(matcher.may_match_range(0x123, 0x123))
+        self.assertFalse(matcher.may_match_range(0x124, 0x200))
+        self.assertFalse(matcher.may_match_range(0x000, 0x122))
+        self.assertTrue(CompiledFilters().may_match_range(0x124, 0x200))
+
+        # never rule out a range with a matching ID
+        rng = random.Random(0x5EED)
+        filters = random_filters(rng, 5)
+        matcher = CompiledFilters(filters)
+        for msg in random_messages(rng, 500):
+            lowest = rng.randint(0, msg.arbitration_id)
+            highest = rng.randint(msg.arbitration_id, 0x1FFFFFFF)
+            if matcher(msg):
+                self.assertTrue(matcher.may_match_range(lowest, highest))
+
+    def test_equivalent_to_linear_matching(self):
+        rng = random.Random(0x5EED)
+        messages = random_messages(rng, 500)
+        for count in (1, 2, 5, 20, 100):
+            filters = random_filters(rng, count)
+            # make sure some of the messages hit exactly
+            messages += [
+                Message(
+                    arbitration_id=_filter["can_id"],
+                    is_extended_id=_filter.get("extended", False),
+                )
+                for _filter in filters
+            ]
+            matcher = CompiledFilters(filters)
+            for msg in messages:
+                self.assertEqual(
+                    matcher(msg), reference_matches(filters, msg), (filters, msg)
+                )
+
+
+@unittest.skipUnless(TEST_BENCHMARKS, "skip benchmarks")
+class BenchmarkCompiledFilters(unittest.TestCase):
+    def test_benchmark(self):
+        rng = random.Random(42)
+        messages = random_messages(rng, 1000)
+        for count in (1, 10, 50, 200):
+            # a typical mix of exact IDs and a few ranges of IDs
+            filters = []
+            for _ in range(count):
+                is_extended = rng.random() < 0.5
+                can_mask = rng.choice([0x1FFFFFFF] * 6 + [0x1FFFFF00])
+                if not is_extended:
+                    can_mask &= 0x7FF
+                filters.append(
+                    {
+                        "can_id": rng.getrandbits(29 if is_extended else 11),
+                        "can_mask": can_mask,
+                        "extended": is_extended,
+                    }
+                )
+            matcher = CompiledFilters(filters)
+
+            linear = min(
+                timeit.repeat(
+                    lambda: [reference_matches(filters, msg) for msg in messages],
+                    number=10,
+                    repeat=3,
+                )
+            )
+            compiled = min(
+                timeit.repeat(
+                    lambda: [matcher(msg) for msg in messages], number=10, repeat=3
+                )
+            )
+            print(
+                f"{count:4d} filters: linear {linear * 100:.3f} us/msg, "
+                f"compiled {compiled * 100:.3f} us/msg ({linear / compiled:.1f}x)"
+            )
+            if count >= 50:
+                self.assertLess(compiled, linear)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -8,11 +8,18 @@ This module tests :class:`can.MessageSync`.
 from copy import copy
 from time import time
 import gc
+import os
+import sys
+import tempfile
+from unittest.mock import patch
 
 import unittest
 import pytest
 
+import can
+import can.player
 from can import MessageSync, Message
+from can.interfaces.virtual import VirtualBus
 
 from .config import IS_CI, IS_TRAVIS, IS_OSX, IS_GITHUB_ACTIONS, IS_LINUX
 from .message_helper import ComparingMessagesTestCase
@@ -95,6 +102,74 @@ class TestMessageSync(unittest.TestCase, ComparingMessagesTestCase):
 
         self.assertMessagesEqual(messages, collected)
 
+    @pytest.mark.timeout(inc(0.2))
+    def test_iter_batches(self):
+        messages = [
+            Message(timestamp=50.0),
+            Message(timestamp=50.0),
+            Message(timestamp=50.0),
+            Message(timestamp=50.0 + 0.05),
+            Message(timestamp=50.0 + 0.05),
+        ]
+        sync = MessageSync(messages, gap=0.0)
+
+        start = time()
+        batches = []
+        timings = []
+        for batch in sync.iter_batches(max_batch_size=2):
+            batches.append(batch)
+            now = time()
+            timings.append(now - start)
+            start = now
+
+        self.assertEqual([len(batch) for batch in batches], [2, 1, 2])
+        self.assertMessagesEqual(messages, [msg for batch in batches for msg in batch])
+
+        self.assertTrue(0.0 <= timings[0] < inc(0.005), str(timings[0]))
+        self.assertTrue(0.0 <= timings[1] < inc(0.005), str(timings[1]))
+        self.assertTrue(0.045 <= timings[2] < inc(0.055), str(timings[2]))
+
+    def test_iter_batches_with_gap(self):
+        messages = [Message(timestamp=50.0), Message(timestamp=50.0)]
+        sync = MessageSync(messages, gap=0.001)
+        self.assertEqual([len(batch) for batch in sync.iter_batches()], [2])
+        sync = MessageSync(messages, timestamps=False, gap=0.001)
+        self.assertEqual([len(batch) for batch in sync.iter_batches()], [1, 1])
+
+    @pytest.mark.timeout(inc(0.2))
+    def test_iter_batches_with_default_arguments(self):
+        messages = [Message(timestamp=50.0)] * 3 + [Message(timestamp=50.01)] * 2
+        sync = MessageSync(messages)
+        self.assertEqual([len(batch) for batch in sync.iter_batches()], [3, 2])
+
+
+class TestPlayer(unittest.TestCase):
+    def setUp(self):
+        with tempfile.NamedTemporaryFile(suffix=".log", delete=False) as file:
+            self.file_name = file.name
+        with can.CanutilsLogWriter(self.file_name) as writer:
+            for timestamp in (50.0, 50.0, 50.0, 50.01, 50.01):
+                writer(Message(timestamp=timestamp, arbitration_id=0x123))
+
+    def tearDown(self):
+        os.remove(self.file_name)
+
+    def _play(self, send_batch):
+        argv = ["can.player", "-i", "virtual", "-c", "player", self.file_name]
+        with patch.object(sys, "argv", argv), patch.object(
+            VirtualBus, "send_batch", autospec=True, side_effect=send_batch
+        ) as mock:
+            can.player.main()
+        return [len(call[0][1]) for call in mock.call_args_list]
+
+    def test_sends_bursts_with_default_arguments(self):
+        batch_sizes = self._play(lambda bus, msgs, timeout=None: len(msgs))
+        self.assertEqual(batch_sizes, [3, 2])
+
+    def test_gives_up_without_progress(self):
+        with self.assertRaises(can.CanOperationError):
+            self._play(lambda bus, msgs, timeout=None: 0)
+
 
 @skip_on_unreliable_platforms
 @pytest.mark.timeout(inc(0.3))
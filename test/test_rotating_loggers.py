@@ -5,9 +5,11 @@
 Test rotating loggers
 """
 import os
+import shutil
 from pathlib import Path
 import tempfile
-from unittest.mock import Mock
+import threading
+from unittest.mock import Mock, PropertyMock, patch
 
 import pytest
 
@@ -51,6 +53,7 @@ class TestBaseRotatingLogger:
         supported_writers = can.io.BaseRotatingLogger.supported_writers
         assert supported_writers[".asc"] == can.ASCWriter
         assert supported_writers[".blf"] == can.BLFWriter
+        assert supported_writers[".canc"] == can.ColumnarWriter
         assert supported_writers[".csv"] == can.CSVWriter
         assert supported_writers[".log"] == can.CanutilsLogWriter
         assert supported_writers[".txt"] == can.Printer
@@ -250,6 +253,46 @@ class TestSizedRotatingLogger:
 
             logger_instance.stop()
 
+    def test_should_rollover_compressed(self):
+        compressed_file = can.io.compression.BackgroundCompressedFile
+        with tempfile.TemporaryDirectory() as temp_dir:
+            logger_instance = can.SizedRotatingLogger(
+                base_filename=os.path.join(temp_dir, "mylogfile.asc.gz"),
+                max_bytes=512,
+            )
+            msg = generate_message(0x123)
+
+            with patch.object(
+                compressed_file, "compressed_size", new_callable=PropertyMock
+            ) as compressed_size:
+                compressed_size.return_value = 511
+                assert logger_instance.should_rollover(msg) is False
+                compressed_size.return_value = 512
+                assert logger_instance.should_rollover(msg) is True
+
+            logger_instance.stop()
+
+    def test_rollover_compressed(self):
+        msg = generate_message(0x123)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            logger_instance = can.SizedRotatingLogger(
+                base_filename=os.path.join(temp_dir, "mylogfile.log.xz"),
+                max_bytes=512,
+            )
+            logger_instance.on_message_received(msg)
+            logger_instance.do_rollover()
+            logger_instance.on_message_received(msg)
+            logger_instance.stop()
+
+            file_names = sorted(os.listdir(temp_dir))
+            assert len(file_names) == 2
+            for file_name in file_names:
+                assert file_name.startswith("mylogfile")
+                assert file_name.endswith(".log.xz")
+                with can.LogReader(os.path.join(temp_dir, file_name)) as reader:
+                    assert len(list(reader)) == 1
+
     def test_logfile_size(self):
         base_filename = "mylogfile.ASC"
         max_bytes = 1024
@@ -266,3 +309,200 @@ class TestSizedRotatingLogger:
                 assert os.path.getsize(os.path.join(temp_dir, file_path)) <= 1100
 
             logger_instance.stop()
+
+    def test_size_includes_buffered_data(self):
+        msg = generate_message(0x123)
+        max_bytes = 4096
+
+        for suffix in (".asc", ".blf", ".canc", ".log"):
+            with tempfile.TemporaryDirectory() as temp_dir:
+                logger_instance = can.SizedRotatingLogger(
+                    base_filename=os.path.join(temp_dir, "mylogfile" + suffix),
+                    max_bytes=max_bytes,
+                )
+                # all formats buffer more than max_bytes in memory
+                for _ in range(1000):
+                    logger_instance.on_message_received(msg)
+                logger_instance.stop()
+
+                file_names = os.listdir(temp_dir)
+                assert len(file_names) > 1, suffix
+                for file_name in file_names:
+                    size = os.path.getsize(os.path.join(temp_dir, file_name))
+                    assert size <= max_bytes + 2 * logger_instance.MAX_MESSAGE_SIZE
+
+    def test_size_includes_data_held_by_the_compressor(self):
+        messages = [
+            can.Message(
+                timestamp=index * 0.001,
+                arbitration_id=(index * 0x2B5) % 0x800,
+                data=[(index * 31 + offset * 7) % 256 for offset in range(8)],
+            )
+            for index in range(10000)
+        ]
+        max_bytes = 20000
+
+        for suffix in (".asc.gz", ".log.bz2", ".log.xz"):
+            with tempfile.TemporaryDirectory() as temp_dir:
+                logger_instance = can.SizedRotatingLogger(
+                    base_filename=os.path.join(temp_dir, "mylogfile" + suffix),
+                    max_bytes=max_bytes,
+                )
+                for msg in messages:
+                    logger_instance.on_message_received(msg)
+                logger_instance.stop()
+
+                file_names = os.listdir(temp_dir)
+                assert len(file_names) > 1, suffix
+                for file_name in file_names:
+                    size = os.path.getsize(os.path.join(temp_dir, file_name))
+                    assert size <= max_bytes, suffix
+
+    def test_checks_size_rarely(self):
+        msg = generate_message(0x123)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            logger_instance = can.SizedRotatingLogger(
+                base_filename=os.path.join(temp_dir, "mylogfile.log"),
+                max_bytes=1024**2,
+            )
+            with patch.object(
+                logger_instance, "_file_size", wraps=logger_instance._file_size
+            ) as file_size:
+                for _ in range(1000):
+                    logger_instance.on_message_received(msg)
+                logger_instance.on_messages_received([msg] * 1000)
+                assert file_size.call_count == 1
+
+            logger_instance.stop()
+
+    def test_rollover_in_background(self):
+        msg = generate_message(0x123)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            logger_instance = can.SizedRotatingLogger(
+                base_filename=os.path.join(temp_dir, "mylogfile.blf"),
+                max_bytes=4096,
+            )
+            stopped_by = []
+            old_writer = logger_instance.writer
+            org_stop = old_writer.stop
+
+            def stop():
+                stopped_by.append(threading.current_thread())
+                org_stop()
+
+            old_writer.stop = stop
+            logger_instance.on_message_received(msg)
+            logger_instance.do_rollover()
+            assert logger_instance.writer is not old_writer
+            logger_instance.on_message_received(msg)
+            logger_instance.stop()
+
+            assert stopped_by
+            assert stopped_by[0] is not threading.current_thread()
+            file_names = sorted(os.listdir(temp_dir))
+            assert len(file_names) == 2
+            for file_name in file_names:
+                with can.LogReader(os.path.join(temp_dir, file_name)) as reader:
+                    assert len(list(reader)) == 1
+
+    def test_rollover_with_rotator(self):
+        msg = generate_message(0x123)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            logger_instance = can.SizedRotatingLogger(
+                base_filename=os.path.join(temp_dir, "mylogfile.asc"),
+                max_bytes=4096,
+            )
+            rotator = Mock(side_effect=os.rename)
+            logger_instance.rotator = rotator
+            logger_instance.on_message_received(msg)
+            logger_instance.do_rollover()
+            logger_instance.stop()
+
+            source, dest = rotator.call_args[0]
+            assert source == logger_instance.base_filename
+            assert sorted(os.listdir(temp_dir)) == sorted(
+                ["mylogfile.asc", os.path.basename(dest)]
+            )
+
+    def test_rollover_with_overridden_rotate(self):
+        msg = generate_message(0x123)
+        rotated = []
+
+        class CopyingLogger(can.SizedRotatingLogger):
+            def rotate(self, source, dest):
+                # the old log file has to be complete at this point
+                with can.LogReader(source) as reader:
+                    rotated.append(len(list(reader)))
+                shutil.copy(source, dest)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            logger_instance = CopyingLogger(
+                base_filename=os.path.join(temp_dir, "mylogfile.blf"),
+                max_bytes=4096,
+            )
+            logger_instance.on_message_received(msg)
+            logger_instance.do_rollover()
+            logger_instance.stop()
+
+            assert rotated == [1]
+            assert len(os.listdir(temp_dir)) == 2
+
+
+class TestTimedRotatingLogger:
+    def test_import(self):
+        assert hasattr(can.io, "TimedRotatingLogger")
+        assert hasattr(can, "TimedRotatingLogger")
+
+    def test_attributes(self):
+        assert issubclass(can.TimedRotatingLogger, can.io.BaseRotatingLogger)
+        assert hasattr(can.TimedRotatingLogger, "should_rollover")
+        assert hasattr(can.TimedRotatingLogger, "do_rollover")
+
+    def test_should_rollover(self):
+        msg = generate_message(0x123)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            logger_instance = can.TimedRotatingLogger(
+                base_filename=os.path.join(temp_dir, "mylogfile.asc"), interval=60
+            )
+            assert logger_instance.should_rollover(msg) is False
+            with patch("time.time", return_value=logger_instance.rollover_at):
+                assert logger_instance.should_rollover(msg) is True
+
+            logger_instance.stop()
+
+    def test_no_interval(self):
+        msg = generate_message(0x123)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            logger_instance = can.TimedRotatingLogger(
+                base_filename=os.path.join(temp_dir, "mylogfile.asc")
+            )
+            with patch("time.time", return_value=logger_instance.rollover_at + 1e6):
+                assert logger_instance.should_rollover(msg) is False
+
+            logger_instance.stop()
+
+    def test_rollover(self):
+        msg = generate_message(0x123)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            logger_instance = can.TimedRotatingLogger(
+                base_filename=os.path.join(temp_dir, "mylogfile.log"), interval=60
+            )
+            logger_instance.on_message_received(msg)
+            rollover_at = logger_instance.rollover_at
+            with patch("time.time", return_value=rollover_at):
+                logger_instance.on_message_received(msg)
+            assert logger_instance.rollover_count == 1
+            assert logger_instance.rollover_at == rollover_at + 60
+            logger_instance.stop()
+
+            file_names = sorted(os.listdir(temp_dir))
+            assert len(file_names) == 2
+            for file_name in file_names:
+                with can.LogReader(os.path.join(temp_dir, file_name)) as reader:
+                    assert len(list(reader)) == 1
@@ -103,6 +103,54 @@ class TestPlayerScript(CanScriptTest):
         return module
 
 
+class TestMergeScript(CanScriptTest):
+    def _commands(self):
+        commands = [
+            "python -m can.merge --help",
+            "python scripts/can_merge.py --help",
+        ]
+        if IS_UNIX:
+            commands += ["can_merge.py --help"]
+        return commands
+
+    def _import(self):
+        import can.merge as module
+
+        return module
+
+
+class TestConvertScript(CanScriptTest):
+    def _commands(self):
+        commands = [
+            "python -m can.convert --help",
+            "python scripts/can_convert.py --help",
+        ]
+        if IS_UNIX:
+            commands += ["can_convert.py --help"]
+        return commands
+
+    def _import(self):
+        import can.convert as module
+
+        return module
+
+
+class TestIndexScript(CanScriptTest):
+    def _commands(self):
+        commands = [
+            "python -m can.index --help",
+            "python scripts/can_index.py --help",
+        ]
+        if IS_UNIX:
+            commands += ["can_index.py --help"]
+        return commands
+
+    def _import(self):
+        import can.index as module
+
+        return module
+
+
 # TODO add #390
 
 
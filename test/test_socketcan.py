@@ -8,23 +8,38 @@ from unittest.mock import patch
 from unittest.mock import call
 
 import ctypes
+import errno
+import select
+import socket
+import struct
+import time
 
+import can
 from can.interfaces.socketcan.socketcan import (
     bcm_header_factory,
     build_bcm_header,
     build_bcm_tx_delete_header,
     build_bcm_transmit_header,
     build_bcm_update_header,
+    build_can_frame,
+    capture_message,
     BcmMsgHead,
+    SocketcanBus,
+    RECEIVED_TIMESTAMP_STRUCT,
 )
 from can.interfaces.socketcan.constants import (
     CAN_BCM_TX_DELETE,
     CAN_BCM_TX_SETUP,
     SETTIMER,
+    SO_RCVBUFFORCE,
+    SO_RXQ_OVFL,
+    SO_TIMESTAMPNS,
     STARTTIMER,
     TX_COUNTEVT,
 )
 
+from .config import IS_LINUX, TEST_BENCHMARKS, TEST_INTERFACE_SOCKETCAN
+
 
 class SocketCANTest(unittest.TestCase):
     def setUp(self):
@@ -381,5 +396,264 @@ class SocketCANTest(unittest.TestCase):
         self.assertEqual(1, result.nframes)
 
 
+@unittest.skipUnless(IS_LINUX, "socket constants are only available on Linux")
+class SocketcanBusReceiveTest(unittest.TestCase):
+    def setUp(self):
+        self.sock = Mock()
+        self.sock.recvmsg_into.side_effect = BlockingIOError
+        with patch(
+            "can.interfaces.socketcan.socketcan.create_socket", return_value=self.sock
+        ):
+            self.bus = SocketcanBus(channel="vcan0")
+        self.sock.setsockopt.reset_mock()
+
+    def _queue_frames(self, *frames, timestamp=(1600000000, 500000000)):
+        def recvmsg_into(buffers, ancbufsize, flags):
+            if not frames_left:
+                raise BlockingIOError
+            data = frames_left.pop(0)
+            buffers[0][: len(data)] = data
+            ancillary_data = []
+            if timestamp is not None:
+                cmsg_data = RECEIVED_TIMESTAMP_STRUCT.pack(*timestamp)
+                ancillary_data.append((socket.SOL_SOCKET, SO_TIMESTAMPNS, cmsg_data))
+            return len(data), ancillary_data, 0, ("vcan0", 0)
+
+        frames_left = [build_can_frame(msg) for msg in frames]
+        self.sock.recvmsg_into.side_effect = recvmsg_into
+
+    def test_receive_timeout_is_set_once(self):
+        self.assertEqual(self.bus._recv_internal(0.25), (None, True))
+        self.assertEqual(self.bus._recv_internal(0.25), (None, True))
+        self.sock.setsockopt.assert_called_once_with(
+            socket.SOL_SOCKET, socket.SO_RCVTIMEO, struct.pack("@ll", 0, 250000)
+        )
+        self.assertEqual(self.sock.recvmsg_into.call_args[0][2], 0)
+
+    def test_receive_non_blocking(self):
+        self.assertIsNone(self.bus.recv(0))
+        self.sock.setsockopt.assert_not_called()
+        self.assertEqual(self.sock.recvmsg_into.call_args[0][2], socket.MSG_DONTWAIT)
+
+    def test_receive_tiny_timeout_does_not_block(self):
+        self.bus._recv_internal(1e-9)
+        self.sock.setsockopt.assert_called_once_with(
+            socket.SOL_SOCKET, socket.SO_RCVTIMEO, struct.pack("@ll", 0, 1)
+        )
+
+    def test_drop_counter_is_enabled(self):
+        self.sock.reset_mock()
+        with patch(
+            "can.interfaces.socketcan.socketcan.create_socket", return_value=self.sock
+        ):
+            SocketcanBus(channel="vcan0")
+        self.sock.setsockopt.assert_any_call(socket.SOL_SOCKET, SO_RXQ_OVFL, 1)
+
+    def test_receive_buffer_size(self):
+        def setsockopt(level, option, value):
+            if option == SO_RCVBUFFORCE:
+                raise PermissionError(1, "Operation not permitted")
+
+        self.sock.reset_mock()
+        self.sock.setsockopt.side_effect = setsockopt
+        with patch(
+            "can.interfaces.socketcan.socketcan.create_socket", return_value=self.sock
+        ):
+            SocketcanBus(channel="vcan0", receive_buffer_size=65536)
+        self.sock.setsockopt.assert_any_call(socket.SOL_SOCKET, SO_RCVBUFFORCE, 65536)
+        self.sock.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+
+    def test_dropped_frames(self):
+        received_drop_counts = [None, 3, 3, 5, 0xFFFFFFFF, 1]
+
+        def recvmsg_into(buffers, ancbufsize, flags):
+            if not received_drop_counts:
+                raise BlockingIOError
+            drop_count = received_drop_counts.pop(0)
+            data = build_can_frame(can.Message(arbitration_id=0x1))
+            buffers[0][: len(data)] = data
+            timestamp = RECEIVED_TIMESTAMP_STRUCT.pack(1600000000, 0)
+            ancillary_data = [(socket.SOL_SOCKET, SO_TIMESTAMPNS, timestamp)]
+            if drop_count is not None:
+                ancillary_data.append(
+                    (socket.SOL_SOCKET, SO_RXQ_OVFL, struct.pack("@I", drop_count))
+                )
+            return len(data), ancillary_data, 0, ("vcan0", 0)
+
+        self.sock.recvmsg_into.side_effect = recvmsg_into
+
+        self.assertEqual(self.bus.dropped_frames, 0)
+        expected = [0, 3, 3, 5, 0xFFFFFFFF, 0xFFFFFFFF + 2]
+        for dropped_frames in expected:
+            self.assertIsNotNone(self.bus.recv(0))
+            self.assertEqual(self.bus.dropped_frames, dropped_frames)
+
+    def test_receive_frames(self):
+        sent = [
+            can.Message(
+                arbitration_id=0x123, is_extended_id=False, channel="vcan0", data=[1, 2]
+            ),
+            can.Message(
+                arbitration_id=0x1ABCDEF, is_extended_id=True, channel="vcan0", data=[4]
+            ),
+            can.Message(
+                arbitration_id=0x42,
+                channel="vcan0",
+                is_extended_id=False,
+                is_fd=True,
+                bitrate_switch=True,
+                data=range(64),
+            ),
+        ]
+        self._queue_frames(*sent)
+
+        received = self.bus.recv_batch(timeout=0.1)
+        self.assertEqual(len(received), len(sent))
+        for recv_msg, sent_msg in zip(received, sent):
+            self.assertTrue(sent_msg.equals(recv_msg, timestamp_delta=None))
+            self.assertAlmostEqual(recv_msg.timestamp, 1600000000.5)
+
+        # the data must not be shared with the receive buffer
+        self.assertEqual(received[0].data, bytearray([1, 2]))
+
+    def test_receive_without_timestamp(self):
+        self._queue_frames(can.Message(arbitration_id=0x1), timestamp=None)
+        with self.assertRaises(can.CanOperationError):
+            self.bus.recv(0)
+
+    def test_receive_invalid_timestamp(self):
+        self._queue_frames(can.Message(arbitration_id=0x1), timestamp=(1, 10**9))
+        with self.assertRaises(can.CanOperationError):
+            self.bus.recv(0)
+
+
+@unittest.skipUnless(IS_LINUX, "socket constants are only available on Linux")
+class SocketcanBusSendTest(unittest.TestCase):
+    def setUp(self):
+        self.sock = Mock()
+        self.sent_frames = []
+        self.sock.send.side_effect = self._send
+        with patch(
+            "can.interfaces.socketcan.socketcan.create_socket", return_value=self.sock
+        ):
+            self.bus = SocketcanBus(channel="vcan0")
+
+    def _send(self, data, flags):
+        # the frame may be a view on a buffer that is reused
+        self.sent_frames.append(bytes(data))
+        return len(data)
+
+    def test_send_without_waiting(self):
+        msg = can.Message(arbitration_id=0x123, data=[1, 2, 3])
+        with patch("select.select") as select_mock:
+            self.bus.send(msg)
+        select_mock.assert_not_called()
+        self.assertEqual(self.sock.send.call_args[0][1], socket.MSG_DONTWAIT)
+        self.assertEqual(self.sent_frames, [build_can_frame(msg)])
+
+    def test_send_frames_like_build_can_frame(self):
+        msgs = [
+            can.Message(arbitration_id=0x1, is_fd=True, data=range(64)),
+            can.Message(arbitration_id=0x2, is_extended_id=False, data=[7] * 8),
+            can.Message(arbitration_id=0x3, data=[9]),
+            can.Message(arbitration_id=0x4, is_remote_frame=True, dlc=4),
+            can.Message(arbitration_id=0x5, is_error_frame=True),
+            can.Message(
+                arbitration_id=0x6,
+                is_fd=True,
+                bitrate_switch=True,
+                error_state_indicator=True,
+                data=[1, 2],
+            ),
+        ]
+        for msg in msgs:
+            self.bus.send(msg)
+        self.assertEqual(self.bus.send_batch(msgs), len(msgs))
+        expected = [build_can_frame(msg) for msg in msgs]
+        self.assertEqual(self.sent_frames, expected + expected)
+
+    def test_send_waits_if_buffer_is_full(self):
+        self.sock.send.side_effect = [
+            OSError(errno.ENOBUFS, "No buffer space available"),
+            8 + 8,
+        ]
+        with patch("select.select", return_value=([], [self.sock], [])) as select_mock:
+            self.bus.send(can.Message(arbitration_id=0x123), timeout=1.0)
+        select_mock.assert_called_once()
+        self.assertEqual(self.sock.send.call_count, 2)
+
+    def test_send_fails_without_timeout(self):
+        self.sock.send.side_effect = OSError(errno.EAGAIN, "Try again")
+        with patch("select.select") as select_mock:
+            with self.assertRaises(can.CanOperationError):
+                self.bus.send(can.Message(arbitration_id=0x123))
+        select_mock.assert_not_called()
+
+    def test_send_raises_other_errors(self):
+        self.sock.send.side_effect = OSError(errno.ENETDOWN, "Network is down")
+        with self.assertRaises(can.CanOperationError) as context:
+            self.bus.send(can.Message(arbitration_id=0x123), timeout=1.0)
+        self.assertEqual(context.exception.error_code, errno.ENETDOWN)
+
+
+@unittest.skipUnless(
+    TEST_INTERFACE_SOCKETCAN and TEST_BENCHMARKS, "skip socketcan benchmarks"
+)
+class BenchmarkSocketcanReceive(unittest.TestCase):
+    """Compares the receive throughput on *vcan0* to the previous approach of
+    waiting with :func:`select.select` and then reading with
+    :func:`~can.interfaces.socketcan.socketcan.capture_message`.
+    """
+
+    FRAMES = 20000
+
+    def setUp(self):
+        self.tx_bus = can.Bus(interface="socketcan", channel="vcan0")
+        # large enough to queue all frames
+        self.rx_bus = can.Bus(interface="socketcan", channel="vcan0")
+        self.rx_bus.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 24)
+
+    def tearDown(self):
+        self.tx_bus.shutdown()
+        self.rx_bus.shutdown()
+
+    def _send_frames(self):
+        msg = can.Message(arbitration_id=0x123, data=[1, 2, 3, 4, 5, 6, 7, 8])
+        for _ in range(self.FRAMES):
+            while True:
+                try:
+                    self.tx_bus.send(msg, timeout=1.0)
+                    break
+                except can.CanOperationError:
+                    time.sleep(0.0001)
+
+    def _measure(self, receive):
+        self._send_frames()
+        start = time.perf_counter()
+        received = 0
+        while received < self.FRAMES and receive() is not None:
+            received += 1
+        return received / (time.perf_counter() - start)
+
+    def test_benchmark(self):
+        sock = self.rx_bus.socket
+
+        def before():
+            if select.select([sock], [], [], 1.0)[0]:
+                return capture_message(sock)
+            return None
+
+        def after():
+            return self.rx_bus.recv(1.0)
+
+        rate_before = self._measure(before)
+        rate_after = self._measure(after)
+        print(
+            f"\nsocketcan receive: {rate_before:.0f} frames/s before, "
+            f"{rate_after:.0f} frames/s after ({rate_after / rate_before:.2f}x)"
+        )
+        self.assertGreater(rate_after, rate_before)
+
+
 if __name__ == "__main__":
     unittest.main()
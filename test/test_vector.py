@@ -229,6 +229,21 @@ class TestVectorBus(unittest.TestCase):
         can.interfaces.vector.canlib.xldriver.xlCanTransmit.assert_not_called()
         can.interfaces.vector.canlib.xldriver.xlCanTransmitEx.assert_called()
 
+    def test_send_batch(self) -> None:
+        self.bus = can.Bus(channel=[0, 1], bustype="vector", _testing=True)
+        msgs = [
+            can.Message(arbitration_id=0x100, channel=0),
+            can.Message(arbitration_id=0x101, channel=0),
+            can.Message(arbitration_id=0x102, channel=1),
+            can.Message(arbitration_id=0x103, channel=0),
+        ]
+        self.assertEqual(self.bus.send_batch(msgs), len(msgs))
+        xl_can_transmit = can.interfaces.vector.canlib.xldriver.xlCanTransmit
+        # one call for each run of messages on the same channel
+        self.assertEqual(xl_can_transmit.call_count, 3)
+        self.assertEqual(xl_can_transmit.call_args_list[0][0][2].value, 2)
+        can.interfaces.vector.canlib.xldriver.xlCanTransmitEx.assert_not_called()
+
     def test_flush_tx_buffer(self) -> None:
         self.bus = can.Bus(channel=0, bustype="vector", _testing=True)
         self.bus.flush_tx_buffer()